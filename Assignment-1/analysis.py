@@ -1,16 +1,21 @@
-import pandas as pd
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 
+# Shared data-loading layer (columnar cache of the survey workbook)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ML-Pipeline-Kit'))
+import ml_library as ml
+
 # Set style for professional-looking plots
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
 
 # Load the survey data
 print("Loading survey data...")
-df = pd.read_excel('SurveyData.xlsx')
+df = ml.load_table('SurveyData.xlsx')
 
 # Display basic information about the dataset
 print("\n" + "="*80)
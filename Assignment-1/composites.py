@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+
+class Scale:
+    """
+    Definition of one construct: the items averaged into it and their range.
+
+    Parameters
+    ----------
+    items : list
+        Survey columns that measure the construct; at least one
+    reverse : list
+        Items scored in the opposite direction; recoded as ``low + high - value``
+    scale_range : tuple
+        (low, high) valid responses; values outside it are treated as missing
+    min_items : int, optional
+        Answered items needed for a score (default: all of them)
+    """
+
+    def __init__(self, items: list, reverse=(), scale_range: tuple = None, min_items: int = None):
+        self.items = list(items)
+        if not self.items:
+            raise ValueError("A scale needs at least one item")
+        self.reverse = list(reverse)
+        unknown = [item for item in self.reverse if item not in self.items]
+        if unknown:
+            raise ValueError(f"Reverse-coded items not in the scale: {unknown}")
+        if self.reverse and scale_range is None:
+            raise ValueError("Reverse coding needs the scale's range")
+        self.scale_range = scale_range
+        self.min_items = len(self.items) if min_items is None else min_items
+
+    @classmethod
+    def from_dict(cls, spec: dict) -> 'Scale':
+        """Build a Scale from plain data, e.g. one entry of a JSON spec file."""
+        return cls(spec['items'], spec.get('reverse', ()), spec.get('range'), spec.get('min_items'))
+
+    def __repr__(self) -> str:
+        return f"Scale(items={self.items!r}, reverse={self.reverse!r}, scale_range={self.scale_range!r})"
+
+
+def scale_items(scales: dict) -> list:
+    """Every survey item used by the scales, in first-use order."""
+    return list(dict.fromkeys(item for scale in scales.values() for item in _as_scale(scale).items))
+
+
+def _as_scale(scale) -> Scale:
+    return scale if isinstance(scale, Scale) else Scale.from_dict(scale)
+
+
+def build_composites(df: pd.DataFrame, scales: dict) -> tuple:
+    """
+    Score every scale and its reliability in one pass over the item matrix.
+
+    The items of all scales are laid side by side in one matrix (an item
+    used by two scales appears twice), reverse-coded and range-checked with
+    array operations, and each scale's columns are reduced together with
+    ``np.add.reduceat``; there is no per-scale Python arithmetic on the data.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Item responses, one column per item
+    scales : dict
+        Construct name -> Scale (or a dict accepted by ``Scale.from_dict``)
+
+    Returns
+    -------
+    tuple
+        (composites, alpha): a DataFrame of scale scores with ``df``'s index,
+        and a Series of Cronbach's alpha per scale (NaN for one-item scales)
+    """
+    scales = {name: _as_scale(scale) for name, scale in scales.items()}
+    names = list(scales)
+    items = scale_items(scales)
+    missing = [item for item in items if item not in df.columns]
+    if missing:
+        raise KeyError(f"Items not in the data: {missing}")
+    position = {item: i for i, item in enumerate(items)}
+
+    # One column per (scale, item) pair, grouped by scale
+    columns, low, high, flip, sizes = [], [], [], [], []
+    for name in names:
+        scale = scales[name]
+        lo, hi = scale.scale_range if scale.scale_range is not None else (-np.inf, np.inf)
+        for item in scale.items:
+            columns.append(position[item])
+            low.append(lo)
+            high.append(hi)
+            flip.append(item in scale.reverse)
+        sizes.append(len(scale.items))
+    low, high, flip = np.array(low), np.array(high), np.array(flip)
+    sizes = np.array(sizes)
+    starts = np.r_[0, np.cumsum(sizes)[:-1]]
+
+    values = df[items].to_numpy(dtype=np.float64)[:, columns]
+    values[(values < low) | (values > high)] = np.nan
+    values[:, flip] = low[flip] + high[flip] - values[:, flip]
+
+    present = ~np.isnan(values)
+    filled = np.where(present, values, 0.0)
+    answered = np.add.reduceat(present, starts, axis=1)
+    totals = np.add.reduceat(filled, starts, axis=1)
+    min_items = np.array([scales[name].min_items for name in names])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = np.where(answered >= min_items, totals / answered, np.nan)
+
+    # Cronbach's alpha over each scale's complete responses:
+    # k / (k - 1) * (1 - sum of item variances / variance of the total)
+    complete = answered == sizes
+    weights = complete[:, np.repeat(np.arange(len(names)), sizes)].astype(np.float64)
+    n_complete = complete.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        item_means = (weights * filled).sum(axis=0) / np.repeat(n_complete, sizes)
+        item_vars = (weights * (filled - item_means) ** 2).sum(axis=0) / np.repeat(n_complete - 1, sizes)
+        total_means = (complete * totals).sum(axis=0) / n_complete
+        total_vars = (complete * (totals - total_means) ** 2).sum(axis=0) / (n_complete - 1)
+        alpha = sizes / (sizes - 1) * (1 - np.add.reduceat(item_vars, starts) / total_vars)
+    alpha = np.where(sizes > 1, alpha, np.nan)
+
+    return (pd.DataFrame(scores, index=df.index, columns=names),
+            pd.Series(alpha, index=names, name='Cronbach Alpha'))
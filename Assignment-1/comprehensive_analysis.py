@@ -1,713 +1,624 @@
 import pandas as pd
-import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from scipy.stats import pearsonr, spearmanr
-from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import StandardScaler
+import os
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
+# Shared data-loading layer (columnar cache of the survey workbook)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ML-Pipeline-Kit'))
+import ml_library as ml
+from correlation_engine import CorrelationEngine
+from task_graph import TaskGraph
+from composites import Scale, scale_items, build_composites
+from regression import ols
+from resampling import (resample, mediation_statistics, r_difference_statistics,
+                        confidence_interval, permutation_p_value)
+import figures
+
 # Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("Set2")
+figures.set_style()
 
-# Load data
-df = pd.read_excel('SurveyData.xlsx')
+# Each section below is a task; results are cached and only stale tasks rerun.
+# Tasks share their inputs (and a cached task's result is never rebuilt), so a
+# task adding columns works on its own copy of the data
+graph = TaskGraph(ml.ProfileCache('.ml_cache'))
 
-# Create composite scores
-# TC (Team Cohesion): Average of TC1 and TC2 (scale 1-5)
-df['TeamCohesion'] = (df['TC1'] + df['TC2']) / 2
 
-# SIB (Social Identity & Belonging): Average of SIB1 and SIB2 (scale 6-10)
-df['SocialIdentity'] = (df['SIB1'] + df['SIB2']) / 2
+# ============================================================================
+# DATA AND COMPOSITE SCORES
+# ============================================================================
+@graph.task('data', sources=['SurveyData.xlsx'])
+def load_data():
+    # Composite scores: the items averaged into each construct and their range
+    scales = {
+        # TC (Team Cohesion): Average of TC1 and TC2
+        'TeamCohesion': Scale(['TC1', 'TC2'], scale_range=(1, 5)),
+        # SIB (Social Identity & Belonging): Average of SIB1 and SIB2
+        'SocialIdentity': Scale(['SIB1', 'SIB2'], scale_range=(6, 10)),
+        # PS (Psychological Safety): Average of PS1 and PS2
+        'PsychSafety': Scale(['PS1', 'PS2'], scale_range=(1, 5)),
+        # SE (Self-Efficacy/Confidence): Average of SE1 and SE2
+        'SelfEfficacy': Scale(['SE1', 'SE2'], scale_range=(1, 5)),
+        # NPS (Net Promoter Score - willingness to work together again): Average of NPS1 and NPS2
+        'WillingnessFuture': Scale(['NPS1', 'NPS2'], scale_range=(1, 5)),
+        # CA1: Perceived performance/quality
+        'Performance': Scale(['CA1'], scale_range=(6, 10)),
+        # RLS1: Perceived learning
+        'Learning': Scale(['RLS1'], scale_range=(6, 10)),
+        # GO1: Growth over time
+        'Growth': Scale(['GO1'], scale_range=(1, 5)),
+    }
+
+    # Load data: only the survey items used by the scales are read from the cached copy
+    df = ml.load_table('SurveyData.xlsx', columns=scale_items(scales))
+    composites, alpha = build_composites(df, scales)
+    df = df.join(composites)
+
+    print("="*80)
+    print("COMPREHENSIVE TEAM EXPERIENCE ANALYSIS")
+    print("="*80)
+    print(f"\nTotal Responses: {len(df)}")
+    print(f"Variables Analyzed: Team Cohesion, Social Identity, Psychological Safety,")
+    print(f"                    Self-Efficacy, Performance, Learning, Growth")
+    print("\nScale Reliability (Cronbach's alpha, multi-item scales):")
+    for name, value in alpha.dropna().items():
+        print(f"  {name}: {value:.3f}")
+    return df
+
+
+@graph.task('correlations', inputs=['data'])
+def compute_correlations(df):
+    # All pairwise correlations between composites, computed once and looked up
+    # by every analysis below
+    composites = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy',
+                  'Performance', 'Learning', 'Growth', 'WillingnessFuture']
+    corr = CorrelationEngine(df, composites)
+    corr.r_matrix
+    return corr
 
-# PS (Psychological Safety): Average of PS1 and PS2 (scale 1-5)
-df['PsychSafety'] = (df['PS1'] + df['PS2']) / 2
 
-# SE (Self-Efficacy/Confidence): Average of SE1 and SE2 (scale 1-5)
-df['SelfEfficacy'] = (df['SE1'] + df['SE2']) / 2
+# ============================================================================
+# ANALYSIS 1: Team Experience Factors and Performance
+# ============================================================================
+@graph.task('performance_factors', inputs=['data', 'correlations'])
+def analysis_performance_factors(df, corr):
+    print("\n" + "="*80)
+    print("ANALYSIS 1: WHICH FACTORS MOST STRONGLY PREDICT TEAM PERFORMANCE?")
+    print("="*80)
 
-# NPS (Net Promoter Score - willingness to work together again): Average of NPS1 and NPS2 (scale 1-5)
-df['WillingnessFuture'] = (df['NPS1'] + df['NPS2']) / 2
+    factors = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy', 'WillingnessFuture']
+    corr_df = corr.against(factors, 'Performance')
+    print("\nCorrelations with Perceived Team Performance:")
+    print(corr_df.to_string(index=False))
 
-# CA1: Perceived performance/quality (scale 6-10)
-df['Performance'] = df['CA1']
+    return {'factors': factors, 'r': {factor: corr.r(factor, 'Performance') for factor in factors}}
 
-# RLS1: Perceived learning (scale 6-10)
-df['Learning'] = df['RLS1']
 
-# GO1: Growth over time (scale 1-5)
-df['Growth'] = df['GO1']
+@graph.task('fig1', inputs=['data', 'performance_factors'], outputs=['Fig1_Performance_Correlations.png'],
+            render=True)
+def render_fig1(df, plot):
+    figures.save(figures.performance_factors(df, **plot), 'Fig1_Performance_Correlations.png')
+    print("\n✓ Saved: Fig1_Performance_Correlations.png")
 
-print("="*80)
-print("COMPREHENSIVE TEAM EXPERIENCE ANALYSIS")
-print("="*80)
-print(f"\nTotal Responses: {len(df)}")
-print(f"Variables Analyzed: Team Cohesion, Social Identity, Psychological Safety,")
-print(f"                    Self-Efficacy, Performance, Learning, Growth")
 
 # ============================================================================
-# ANALYSIS 1: Team Experience Factors and Performance
+# ANALYSIS 2: Performance vs Willingness to Work Together Again
 # ============================================================================
-print("\n" + "="*80)
-print("ANALYSIS 1: WHICH FACTORS MOST STRONGLY PREDICT TEAM PERFORMANCE?")
-print("="*80)
-
-factors = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy', 'WillingnessFuture']
-correlations = []
-
-for factor in factors:
-    corr, pval = pearsonr(df[factor], df['Performance'])
-    correlations.append({
-        'Factor': factor,
-        'Correlation': corr,
-        'P-Value': pval
-    })
+@graph.task('performance_willingness', inputs=['data', 'correlations'])
+def analysis_performance_willingness(df, corr):
+    print("\n" + "="*80)
+    print("ANALYSIS 2: DO HIGH-PERFORMING TEAMS WANT TO WORK TOGETHER AGAIN?")
+    print("="*80)
 
-corr_df = pd.DataFrame(correlations).sort_values('Correlation', ascending=False)
-print("\nCorrelations with Perceived Team Performance:")
-print(corr_df.to_string(index=False))
-
-# Create visualization
-fig, axes = plt.subplots(2, 3, figsize=(15, 10))
-fig.suptitle('Team Experience Factors vs. Performance', fontsize=16, fontweight='bold')
-
-for idx, factor in enumerate(factors):
-    ax = axes[idx//3, idx%3]
-    ax.scatter(df[factor], df['Performance'], alpha=0.5, s=50)
-    
-    # Add trend line
-    z = np.polyfit(df[factor], df['Performance'], 1)
-    p = np.poly1d(z)
-    ax.plot(df[factor], p(df[factor]), "r--", alpha=0.8, linewidth=2)
-    
-    corr, _ = pearsonr(df[factor], df['Performance'])
-    ax.set_xlabel(factor, fontsize=11)
-    ax.set_ylabel('Performance', fontsize=11)
-    ax.set_title(f'r = {corr:.3f}', fontsize=12)
-    ax.grid(True, alpha=0.3)
-
-# Remove extra subplot
-fig.delaxes(axes[1, 2])
-plt.tight_layout()
-plt.savefig('Fig1_Performance_Correlations.png', dpi=300, bbox_inches='tight')
-print("\n✓ Saved: Fig1_Performance_Correlations.png")
+    corr_perf_willing, pval = corr.pair('Performance', 'WillingnessFuture')
+    print(f"\nCorrelation between Performance and Willingness to Work Together:")
+    print(f"  r = {corr_perf_willing:.3f}, p-value = {pval:.4f}")
+
+    # Categorize teams
+    df = df.copy()
+    df['PerformanceCategory'] = pd.cut(df['Performance'], bins=[5, 8, 9, 11], 
+                                         labels=['Low (6-8)', 'Medium (9)', 'High (10)'])
+    df['WillingnessCategory'] = pd.cut(df['WillingnessFuture'], bins=[0, 3, 4, 6], 
+                                         labels=['Low (1-3)', 'Medium (4)', 'High (5)'])
+
+    # Contingency table
+    contingency = pd.crosstab(df['PerformanceCategory'], df['WillingnessCategory'])
+    print("\nContingency Table: Performance vs Willingness to Collaborate Again")
+    print(contingency)
+
+    return {'r': corr_perf_willing,
+            'willingness_by_performance': df.groupby('PerformanceCategory')['WillingnessFuture'].mean()}
+
+
+@graph.task('fig2', inputs=['data', 'performance_willingness'], outputs=['Fig2_Performance_vs_Willingness.png'],
+            render=True)
+def render_fig2(df, plot):
+    figures.save(figures.performance_willingness(df, **plot), 'Fig2_Performance_vs_Willingness.png')
+    print("\n✓ Saved: Fig2_Performance_vs_Willingness.png")
 
-# ============================================================================
-# ANALYSIS 2: Performance vs Willingness to Work Together Again
-# ============================================================================
-print("\n" + "="*80)
-print("ANALYSIS 2: DO HIGH-PERFORMING TEAMS WANT TO WORK TOGETHER AGAIN?")
-print("="*80)
-
-corr_perf_willing, pval = pearsonr(df['Performance'], df['WillingnessFuture'])
-print(f"\nCorrelation between Performance and Willingness to Work Together:")
-print(f"  r = {corr_perf_willing:.3f}, p-value = {pval:.4f}")
-
-# Categorize teams
-df['PerformanceCategory'] = pd.cut(df['Performance'], bins=[5, 8, 9, 11], 
-                                     labels=['Low (6-8)', 'Medium (9)', 'High (10)'])
-df['WillingnessCategory'] = pd.cut(df['WillingnessFuture'], bins=[0, 3, 4, 6], 
-                                     labels=['Low (1-3)', 'Medium (4)', 'High (5)'])
-
-# Contingency table
-contingency = pd.crosstab(df['PerformanceCategory'], df['WillingnessCategory'])
-print("\nContingency Table: Performance vs Willingness to Collaborate Again")
-print(contingency)
-
-# Visualize
-fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-# Scatter plot
-axes[0].scatter(df['Performance'], df['WillingnessFuture'], alpha=0.5, s=80)
-z = np.polyfit(df['Performance'], df['WillingnessFuture'], 1)
-p = np.poly1d(z)
-axes[0].plot(df['Performance'], p(df['Performance']), "r--", linewidth=2)
-axes[0].set_xlabel('Team Performance', fontsize=12)
-axes[0].set_ylabel('Willingness to Work Together Again', fontsize=12)
-axes[0].set_title(f'Performance vs Future Collaboration (r={corr_perf_willing:.3f})', fontsize=13, fontweight='bold')
-axes[0].grid(True, alpha=0.3)
-
-# Grouped bar chart
-perf_willing_means = df.groupby('PerformanceCategory')['WillingnessFuture'].mean()
-perf_willing_means.plot(kind='bar', ax=axes[1], color=['#e74c3c', '#f39c12', '#2ecc71'], edgecolor='black')
-axes[1].set_xlabel('Performance Level', fontsize=12)
-axes[1].set_ylabel('Average Willingness Score', fontsize=12)
-axes[1].set_title('Willingness to Work Together by Performance Level', fontsize=13, fontweight='bold')
-axes[1].set_xticklabels(axes[1].get_xticklabels(), rotation=0)
-axes[1].grid(True, alpha=0.3, axis='y')
-
-plt.tight_layout()
-plt.savefig('Fig2_Performance_vs_Willingness.png', dpi=300, bbox_inches='tight')
-print("\n✓ Saved: Fig2_Performance_vs_Willingness.png")
 
 # ============================================================================
 # ANALYSIS 3: Psychological Safety and Learning Outcomes
 # ============================================================================
-print("\n" + "="*80)
-print("ANALYSIS 3: HOW DOES PSYCHOLOGICAL SAFETY RELATE TO LEARNING?")
-print("="*80)
-
-corr_ps_learning, pval = pearsonr(df['PsychSafety'], df['Learning'])
-corr_ps_efficacy, pval2 = pearsonr(df['PsychSafety'], df['SelfEfficacy'])
-
-print(f"\nPsychological Safety correlations:")
-print(f"  With Learning: r = {corr_ps_learning:.3f}, p-value = {pval:.4f}")
-print(f"  With Self-Efficacy: r = {corr_ps_efficacy:.3f}, p-value = {pval2:.4f}")
-
-# Group by psychological safety levels
-df['PSCategory'] = pd.cut(df['PsychSafety'], bins=[0, 3, 4, 6], 
-                           labels=['Low (1-3)', 'Medium (4)', 'High (5)'])
-
-grouped = df.groupby('PSCategory').agg({
-    'Learning': ['mean', 'std', 'count'],
-    'SelfEfficacy': ['mean', 'std'],
-    'Performance': ['mean', 'std']
-}).round(2)
-
-print("\nOutcomes by Psychological Safety Level:")
-print(grouped)
-
-# Visualize
-fig, axes = plt.subplots(1, 3, figsize=(16, 5))
-
-# PS vs Learning
-axes[0].scatter(df['PsychSafety'], df['Learning'], alpha=0.5, s=80, color='steelblue')
-z = np.polyfit(df['PsychSafety'], df['Learning'], 1)
-p = np.poly1d(z)
-axes[0].plot(df['PsychSafety'], p(df['PsychSafety']), "r--", linewidth=2)
-axes[0].set_xlabel('Psychological Safety', fontsize=12)
-axes[0].set_ylabel('Learning Gains', fontsize=12)
-axes[0].set_title(f'Psychological Safety vs Learning (r={corr_ps_learning:.3f})', fontsize=12, fontweight='bold')
-axes[0].grid(True, alpha=0.3)
-
-# PS vs Self-Efficacy
-axes[1].scatter(df['PsychSafety'], df['SelfEfficacy'], alpha=0.5, s=80, color='seagreen')
-z = np.polyfit(df['PsychSafety'], df['SelfEfficacy'], 1)
-p = np.poly1d(z)
-axes[1].plot(df['PsychSafety'], p(df['PsychSafety']), "r--", linewidth=2)
-axes[1].set_xlabel('Psychological Safety', fontsize=12)
-axes[1].set_ylabel('Self-Efficacy', fontsize=12)
-axes[1].set_title(f'Psychological Safety vs Confidence (r={corr_ps_efficacy:.3f})', fontsize=12, fontweight='bold')
-axes[1].grid(True, alpha=0.3)
-
-# Comparison by PS level
-ps_outcomes = df.groupby('PSCategory')[['Learning', 'SelfEfficacy', 'Performance']].mean()
-ps_outcomes.plot(kind='bar', ax=axes[2], color=['#3498db', '#e74c3c', '#2ecc71'], edgecolor='black')
-axes[2].set_xlabel('Psychological Safety Level', fontsize=12)
-axes[2].set_ylabel('Average Score', fontsize=12)
-axes[2].set_title('Outcomes by Psychological Safety Level', fontsize=12, fontweight='bold')
-axes[2].set_xticklabels(axes[2].get_xticklabels(), rotation=0)
-axes[2].legend(['Learning', 'Self-Efficacy', 'Performance'], loc='lower right')
-axes[2].grid(True, alpha=0.3, axis='y')
-
-plt.tight_layout()
-plt.savefig('Fig3_PsychSafety_Learning.png', dpi=300, bbox_inches='tight')
-print("\n✓ Saved: Fig3_PsychSafety_Learning.png")
+@graph.task('psych_safety_learning', inputs=['data', 'correlations'])
+def analysis_psych_safety_learning(df, corr):
+    print("\n" + "="*80)
+    print("ANALYSIS 3: HOW DOES PSYCHOLOGICAL SAFETY RELATE TO LEARNING?")
+    print("="*80)
+
+    corr_ps_learning, pval = corr.pair('PsychSafety', 'Learning')
+    corr_ps_efficacy, pval2 = corr.pair('PsychSafety', 'SelfEfficacy')
+
+    print(f"\nPsychological Safety correlations:")
+    print(f"  With Learning: r = {corr_ps_learning:.3f}, p-value = {pval:.4f}")
+    print(f"  With Self-Efficacy: r = {corr_ps_efficacy:.3f}, p-value = {pval2:.4f}")
+
+    # Group by psychological safety levels
+    df = df.copy()
+    df['PSCategory'] = pd.cut(df['PsychSafety'], bins=[0, 3, 4, 6], 
+                               labels=['Low (1-3)', 'Medium (4)', 'High (5)'])
+
+    grouped = df.groupby('PSCategory').agg({
+        'Learning': ['mean', 'std', 'count'],
+        'SelfEfficacy': ['mean', 'std'],
+        'Performance': ['mean', 'std']
+    }).round(2)
+
+    print("\nOutcomes by Psychological Safety Level:")
+    print(grouped)
+
+    return {'r_learning': corr_ps_learning, 'r_efficacy': corr_ps_efficacy,
+            'outcomes_by_ps': df.groupby('PSCategory')[['Learning', 'SelfEfficacy', 'Performance']].mean()}
+
+
+@graph.task('fig3', inputs=['data', 'psych_safety_learning'], outputs=['Fig3_PsychSafety_Learning.png'],
+            render=True)
+def render_fig3(df, plot):
+    figures.save(figures.psych_safety_learning(df, **plot), 'Fig3_PsychSafety_Learning.png')
+    print("\n✓ Saved: Fig3_PsychSafety_Learning.png")
+
 
 # ============================================================================
 # ANALYSIS 4: Growth Over Time - What Predicts Improvement?
 # ============================================================================
-print("\n" + "="*80)
-print("ANALYSIS 4: WHAT TEAM CONDITIONS PREDICT GROWTH OVER TIME?")
-print("="*80)
-
-growth_factors = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy']
-growth_correlations = []
-
-for factor in growth_factors:
-    corr, pval = pearsonr(df[factor], df['Growth'])
-    growth_correlations.append({
-        'Factor': factor,
-        'Correlation': corr,
-        'P-Value': pval
-    })
+@graph.task('growth_predictors', inputs=['data', 'correlations'])
+def analysis_growth_predictors(df, corr):
+    print("\n" + "="*80)
+    print("ANALYSIS 4: WHAT TEAM CONDITIONS PREDICT GROWTH OVER TIME?")
+    print("="*80)
 
-growth_corr_df = pd.DataFrame(growth_correlations).sort_values('Correlation', ascending=False)
-print("\nCorrelations with Team Growth Over Time:")
-print(growth_corr_df.to_string(index=False))
+    growth_factors = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy']
+    growth_corr_df = corr.against(growth_factors, 'Growth')
+    print("\nCorrelations with Team Growth Over Time:")
+    print(growth_corr_df.to_string(index=False))
 
-# Categorize by growth
-df['GrowthCategory'] = pd.cut(df['Growth'], bins=[0, 3, 4, 6], 
-                               labels=['Low (1-3)', 'Medium (4)', 'High (5)'])
+    # Categorize by growth
+    df = df.copy()
+    df['GrowthCategory'] = pd.cut(df['Growth'], bins=[0, 3, 4, 6], 
+                                   labels=['Low (1-3)', 'Medium (4)', 'High (5)'])
+
+    growth_conditions = df.groupby('GrowthCategory')[growth_factors].mean()
+    print("\nAverage Team Conditions by Growth Level:")
+    print(growth_conditions.round(3))
+
+    return {'corr_matrix': corr.r_matrix.loc[growth_factors + ['Growth'], growth_factors + ['Growth']],
+            'conditions_by_growth': growth_conditions}
+
+
+@graph.task('fig4', inputs=['growth_predictors'], outputs=['Fig4_Growth_Predictors.png'],
+            render=True)
+def render_fig4(plot):
+    figures.save(figures.growth_predictors(**plot), 'Fig4_Growth_Predictors.png')
+    print("\n✓ Saved: Fig4_Growth_Predictors.png")
 
-growth_conditions = df.groupby('GrowthCategory')[growth_factors].mean()
-print("\nAverage Team Conditions by Growth Level:")
-print(growth_conditions.round(3))
-
-# Visualize
-fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-# Correlation heatmap
-growth_corr_matrix = df[growth_factors + ['Growth']].corr()
-sns.heatmap(growth_corr_matrix, annot=True, fmt='.3f', cmap='coolwarm', 
-            center=0, ax=axes[0], cbar_kws={'label': 'Correlation'})
-axes[0].set_title('Correlation Matrix: Team Factors and Growth', fontsize=13, fontweight='bold')
-
-# Team conditions by growth level
-growth_conditions.T.plot(kind='bar', ax=axes[1], color=['#e74c3c', '#f39c12', '#2ecc71'], 
-                         edgecolor='black', width=0.8)
-axes[1].set_xlabel('Team Condition', fontsize=12)
-axes[1].set_ylabel('Average Score', fontsize=12)
-axes[1].set_title('Team Conditions by Growth Level', fontsize=13, fontweight='bold')
-axes[1].set_xticklabels(axes[1].get_xticklabels(), rotation=45, ha='right')
-axes[1].legend(title='Growth Level', loc='upper right')
-axes[1].grid(True, alpha=0.3, axis='y')
-
-plt.tight_layout()
-plt.savefig('Fig4_Growth_Predictors.png', dpi=300, bbox_inches='tight')
-print("\n✓ Saved: Fig4_Growth_Predictors.png")
 
 # ============================================================================
 # SUMMARY STATISTICS TABLE
 # ============================================================================
-print("\n" + "="*80)
-print("SUMMARY STATISTICS FOR KEY VARIABLES")
-print("="*80)
+@graph.task('summary_table', inputs=['data'], outputs=['Table1_Summary_Statistics.csv'])
+def summary_table(df):
+    print("\n" + "="*80)
+    print("SUMMARY STATISTICS FOR KEY VARIABLES")
+    print("="*80)
 
-summary_vars = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy', 
-                'Performance', 'Learning', 'Growth', 'WillingnessFuture']
-summary_stats = df[summary_vars].describe().T
-summary_stats['range'] = summary_stats['max'] - summary_stats['min']
-summary_stats = summary_stats[['count', 'mean', 'std', 'min', 'max', 'range']]
-print(summary_stats.round(2))
+    summary_vars = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy', 
+                    'Performance', 'Learning', 'Growth', 'WillingnessFuture']
+    summary_stats = df[summary_vars].describe().T
+    summary_stats['range'] = summary_stats['max'] - summary_stats['min']
+    summary_stats = summary_stats[['count', 'mean', 'std', 'min', 'max', 'range']]
+    print(summary_stats.round(2))
+
+    # Save to CSV
+    summary_stats.to_csv('Table1_Summary_Statistics.csv')
+    print("\n✓ Saved: Table1_Summary_Statistics.csv")
 
-# Save to CSV
-summary_stats.to_csv('Table1_Summary_Statistics.csv')
-print("\n✓ Saved: Table1_Summary_Statistics.csv")
 
 # ============================================================================
 # CORRELATION MATRIX - ALL KEY VARIABLES
 # ============================================================================
-print("\n" + "="*80)
-print("CORRELATION MATRIX: ALL KEY VARIABLES")
-print("="*80)
-
-corr_matrix = df[summary_vars].corr()
-print(corr_matrix.round(3))
-corr_matrix.to_csv('Table2_Correlation_Matrix.csv')
-print("\n✓ Saved: Table2_Correlation_Matrix.csv")
-
-# Create comprehensive correlation heatmap
-plt.figure(figsize=(10, 8))
-sns.heatmap(corr_matrix, annot=True, fmt='.3f', cmap='coolwarm', 
-            center=0, square=True, linewidths=1, cbar_kws={'label': 'Pearson Correlation'})
-plt.title('Correlation Matrix: All Team Experience Variables', fontsize=14, fontweight='bold', pad=20)
-plt.tight_layout()
-plt.savefig('Fig5_Full_Correlation_Matrix.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: Fig5_Full_Correlation_Matrix.png")
+@graph.task('correlation_matrix', inputs=['correlations'], outputs=['Table2_Correlation_Matrix.csv'])
+def correlation_matrix(corr):
+    print("\n" + "="*80)
+    print("CORRELATION MATRIX: ALL KEY VARIABLES")
+    print("="*80)
+
+    corr_matrix = corr.r_matrix
+    print(corr_matrix.round(3))
+    corr_matrix.to_csv('Table2_Correlation_Matrix.csv')
+    print("\n✓ Saved: Table2_Correlation_Matrix.csv")
+
+    return {'corr_matrix': corr_matrix}
+
+
+@graph.task('fig5', inputs=['correlation_matrix'], outputs=['Fig5_Full_Correlation_Matrix.png'],
+            render=True)
+def render_fig5(plot):
+    figures.save(figures.correlation_heatmap(**plot), 'Fig5_Full_Correlation_Matrix.png')
+    print("✓ Saved: Fig5_Full_Correlation_Matrix.png")
+
 
 # ============================================================================
 # HIGH VS LOW PERFORMING TEAMS COMPARISON
 # ============================================================================
-print("\n" + "="*80)
-print("COMPARISON: HIGH VS LOW PERFORMING TEAMS")
-print("="*80)
-
-# Define high and low performance groups
-high_perf = df[df['Performance'] == 10]
-low_perf = df[df['Performance'] <= 8]
-
-comparison_vars = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy', 
-                   'WillingnessFuture', 'Learning', 'Growth']
-
-comparison_df = pd.DataFrame({
-    'High Performers (n={})'.format(len(high_perf)): high_perf[comparison_vars].mean(),
-    'Low Performers (n={})'.format(len(low_perf)): low_perf[comparison_vars].mean(),
-    'Difference': high_perf[comparison_vars].mean() - low_perf[comparison_vars].mean()
-})
-
-print(comparison_df.round(3))
-comparison_df.to_csv('Table3_High_vs_Low_Performance.csv')
-print("\n✓ Saved: Table3_High_vs_Low_Performance.csv")
-
-# Visualize
-fig, ax = plt.subplots(figsize=(12, 6))
-x = np.arange(len(comparison_vars))
-width = 0.35
-
-bars1 = ax.bar(x - width/2, high_perf[comparison_vars].mean(), width, 
-               label='High Performers (10)', color='#2ecc71', edgecolor='black')
-bars2 = ax.bar(x + width/2, low_perf[comparison_vars].mean(), width, 
-               label='Low Performers (≤8)', color='#e74c3c', edgecolor='black')
-
-ax.set_xlabel('Team Condition', fontsize=12)
-ax.set_ylabel('Average Score', fontsize=12)
-ax.set_title('High vs Low Performing Teams: Key Differences', fontsize=14, fontweight='bold')
-ax.set_xticks(x)
-ax.set_xticklabels(comparison_vars, rotation=45, ha='right')
-ax.legend()
-ax.grid(True, alpha=0.3, axis='y')
-
-plt.tight_layout()
-plt.savefig('Fig6_High_vs_Low_Performers.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: Fig6_High_vs_Low_Performers.png")
+@graph.task('high_vs_low', inputs=['data'], outputs=['Table3_High_vs_Low_Performance.csv'])
+def high_vs_low_performers(df):
+    print("\n" + "="*80)
+    print("COMPARISON: HIGH VS LOW PERFORMING TEAMS")
+    print("="*80)
+
+    # Define high and low performance groups
+    high_perf = df[df['Performance'] == 10]
+    low_perf = df[df['Performance'] <= 8]
+
+    comparison_vars = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy', 
+                       'WillingnessFuture', 'Learning', 'Growth']
+
+    comparison_df = pd.DataFrame({
+        'High Performers (n={})'.format(len(high_perf)): high_perf[comparison_vars].mean(),
+        'Low Performers (n={})'.format(len(low_perf)): low_perf[comparison_vars].mean(),
+        'Difference': high_perf[comparison_vars].mean() - low_perf[comparison_vars].mean()
+    })
+
+    print(comparison_df.round(3))
+    comparison_df.to_csv('Table3_High_vs_Low_Performance.csv')
+    print("\n✓ Saved: Table3_High_vs_Low_Performance.csv")
+
+    return {'comparison_vars': comparison_vars,
+            'high_means': high_perf[comparison_vars].mean(),
+            'low_means': low_perf[comparison_vars].mean()}
+
+
+@graph.task('fig6', inputs=['high_vs_low'], outputs=['Fig6_High_vs_Low_Performers.png'],
+            render=True)
+def render_fig6(plot):
+    figures.save(figures.high_vs_low(**plot), 'Fig6_High_vs_Low_Performers.png')
+    print("✓ Saved: Fig6_High_vs_Low_Performers.png")
+
 
 # ============================================================================
 # ADVANCED ANALYSIS 1: REGRESSION MODELS
 # ============================================================================
-print("\n" + "="*80)
-print("ADVANCED ANALYSIS 1: PREDICTIVE REGRESSION MODELS")
-print("="*80)
-
-# Standardize variables for regression interpretation
-scaler = StandardScaler()
-predictors_for_reg = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy']
-df_scaled = df.copy()
-df_scaled[predictors_for_reg] = scaler.fit_transform(df[predictors_for_reg])
-
-# Model 1: Predicting Performance
-print("\n--- Model 1: Predicting Team Performance ---")
-X_perf = df_scaled[predictors_for_reg]
-y_perf = df['Performance']
-model_perf = LinearRegression()
-model_perf.fit(X_perf, y_perf)
-r2_perf = model_perf.score(X_perf, y_perf)
-
-print(f"R² = {r2_perf:.3f} (explains {r2_perf*100:.1f}% of performance variance)")
-print("\nStandardized Coefficients (relative importance):")
-for var, coef in zip(predictors_for_reg, model_perf.coef_):
-    print(f"  {var}: {coef:.4f}")
-
-# Model 2: Predicting Growth
-print("\n--- Model 2: Predicting Team Growth ---")
-X_growth = df_scaled[predictors_for_reg]
-y_growth = df['Growth']
-model_growth = LinearRegression()
-model_growth.fit(X_growth, y_growth)
-r2_growth = model_growth.score(X_growth, y_growth)
-
-print(f"R² = {r2_growth:.3f} (explains {r2_growth*100:.1f}% of growth variance)")
-print("\nStandardized Coefficients (relative importance):")
-for var, coef in zip(predictors_for_reg, model_growth.coef_):
-    print(f"  {var}: {coef:.4f}")
-
-# Save regression results
-reg_results = pd.DataFrame({
-    'Predictor': predictors_for_reg,
-    'Performance_Coefficient': model_perf.coef_,
-    'Growth_Coefficient': model_growth.coef_
-})
-reg_results.to_csv('Table4_Regression_Coefficients.csv', index=False)
-print("\n✓ Saved: Table4_Regression_Coefficients.csv")
+@graph.task('standardized', inputs=['data'])
+def standardize_predictors(df):
+    # Standardize variables for regression interpretation
+    scaler = StandardScaler()
+    predictors_for_reg = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy']
+    df_scaled = df.copy()
+    df_scaled[predictors_for_reg] = scaler.fit_transform(df[predictors_for_reg])
+    return df_scaled
+
+
+@graph.task('regression', inputs=['data', 'standardized'],
+            outputs=['Table4_Regression_Coefficients.csv'])
+def regression_models(df, df_scaled):
+    print("\n" + "="*80)
+    print("ADVANCED ANALYSIS 1: PREDICTIVE REGRESSION MODELS")
+    print("="*80)
+
+    predictors_for_reg = ['TeamCohesion', 'SocialIdentity', 'PsychSafety', 'SelfEfficacy']
+
+    # Both outcomes are solved against one factorization of the design matrix
+    fit = ols(df_scaled[predictors_for_reg], df[['Performance', 'Growth']])
+
+    # Model 1: Predicting Performance
+    print("\n--- Model 1: Predicting Team Performance ---")
+    r2_perf = fit.r2['Performance']
+    print(f"R² = {r2_perf:.3f} (explains {r2_perf*100:.1f}% of performance variance)")
+    print("\nStandardized Coefficients (relative importance):")
+    for var, row in fit.table('Performance').loc[predictors_for_reg].iterrows():
+        print(f"  {var}: {row['Coefficient']:.4f} (SE = {row['Std. Error']:.4f}, "
+              f"t = {row['t']:.2f}, p = {row['P-Value']:.4f})")
+
+    # Model 2: Predicting Growth
+    print("\n--- Model 2: Predicting Team Growth ---")
+    r2_growth = fit.r2['Growth']
+    print(f"R² = {r2_growth:.3f} (explains {r2_growth*100:.1f}% of growth variance)")
+    print("\nStandardized Coefficients (relative importance):")
+    for var, row in fit.table('Growth').loc[predictors_for_reg].iterrows():
+        print(f"  {var}: {row['Coefficient']:.4f} (SE = {row['Std. Error']:.4f}, "
+              f"t = {row['t']:.2f}, p = {row['P-Value']:.4f})")
+
+    # Save regression results
+    reg_results = pd.DataFrame({
+        'Predictor': predictors_for_reg,
+        'Performance_Coefficient': fit.coef.loc[predictors_for_reg, 'Performance'].to_numpy(),
+        'Growth_Coefficient': fit.coef.loc[predictors_for_reg, 'Growth'].to_numpy(),
+        'Performance_SE': fit.se.loc[predictors_for_reg, 'Performance'].to_numpy(),
+        'Growth_SE': fit.se.loc[predictors_for_reg, 'Growth'].to_numpy(),
+        'Performance_P': fit.p.loc[predictors_for_reg, 'Performance'].to_numpy(),
+        'Growth_P': fit.p.loc[predictors_for_reg, 'Growth'].to_numpy()
+    })
+    reg_results.to_csv('Table4_Regression_Coefficients.csv', index=False)
+    print("\n✓ Saved: Table4_Regression_Coefficients.csv")
+
 
 # ============================================================================
 # ADVANCED ANALYSIS 2: INTERACTION EFFECTS
 # ============================================================================
-print("\n" + "="*80)
-print("ADVANCED ANALYSIS 2: INTERACTION EFFECTS")
-print("="*80)
-
-# Test: Does Psychological Safety matter MORE when Team Cohesion is LOW?
-# Create interaction term
-df['PS_x_TC'] = df['PsychSafety'] * df['TeamCohesion']
-
-# Split by cohesion level (low vs high)
-low_cohesion = df[df['TeamCohesion'] < df['TeamCohesion'].median()]
-high_cohesion = df[df['TeamCohesion'] >= df['TeamCohesion'].median()]
-
-corr_ps_perf_low, _ = pearsonr(low_cohesion['PsychSafety'], low_cohesion['Performance'])
-corr_ps_perf_high, _ = pearsonr(high_cohesion['PsychSafety'], high_cohesion['Performance'])
-
-print(f"\nPsychological Safety → Performance relationship by Team Cohesion:")
-print(f"  Low Cohesion Teams: r = {corr_ps_perf_low:.3f} (n={len(low_cohesion)})")
-print(f"  High Cohesion Teams: r = {corr_ps_perf_high:.3f} (n={len(high_cohesion)})")
-print(f"  Interaction Pattern: PS is {abs(corr_ps_perf_low - corr_ps_perf_high):.3f} units stronger in {'low' if abs(corr_ps_perf_low) > abs(corr_ps_perf_high) else 'high'} cohesion teams")
-
-# Test: Does Self-Efficacy matter MORE when Psychological Safety is HIGH?
-low_ps = df[df['PsychSafety'] < df['PsychSafety'].median()]
-high_ps = df[df['PsychSafety'] >= df['PsychSafety'].median()]
-
-corr_se_perf_low_ps, _ = pearsonr(low_ps['SelfEfficacy'], low_ps['Performance'])
-corr_se_perf_high_ps, _ = pearsonr(high_ps['SelfEfficacy'], high_ps['Performance'])
-
-print(f"\nSelf-Efficacy → Performance relationship by Psychological Safety:")
-print(f"  Low PS Teams: r = {corr_se_perf_low_ps:.3f} (n={len(low_ps)})")
-print(f"  High PS Teams: r = {corr_se_perf_high_ps:.3f} (n={len(high_ps)})")
-print(f"  Interpretation: Self-efficacy matters more when PS is high (confidence benefits")
-print(f"                  more from safe environments where people can demonstrate abilities)")
-
-# Visualize interaction
-fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-# Interaction 1: PS effect by Cohesion level
-axes[0].scatter(low_cohesion['PsychSafety'], low_cohesion['Performance'], 
-               alpha=0.5, s=80, color='#e74c3c', label='Low Cohesion')
-z1 = np.polyfit(low_cohesion['PsychSafety'], low_cohesion['Performance'], 1)
-p1 = np.poly1d(z1)
-axes[0].plot(low_cohesion['PsychSafety'], p1(low_cohesion['PsychSafety']), 
-            color='#e74c3c', linewidth=2, linestyle='--')
-
-axes[0].scatter(high_cohesion['PsychSafety'], high_cohesion['Performance'], 
-               alpha=0.5, s=80, color='#2ecc71', label='High Cohesion')
-z2 = np.polyfit(high_cohesion['PsychSafety'], high_cohesion['Performance'], 1)
-p2 = np.poly1d(z2)
-axes[0].plot(high_cohesion['PsychSafety'], p2(high_cohesion['PsychSafety']), 
-            color='#2ecc71', linewidth=2, linestyle='--')
-
-axes[0].set_xlabel('Psychological Safety', fontsize=12)
-axes[0].set_ylabel('Performance', fontsize=12)
-axes[0].set_title('Interaction: PS Effect by Team Cohesion Level', fontsize=12, fontweight='bold')
-axes[0].legend()
-axes[0].grid(True, alpha=0.3)
-
-# Interaction 2: SE effect by PS level
-axes[1].scatter(low_ps['SelfEfficacy'], low_ps['Performance'], 
-               alpha=0.5, s=80, color='#e74c3c', label='Low Psychological Safety')
-z3 = np.polyfit(low_ps['SelfEfficacy'], low_ps['Performance'], 1)
-p3 = np.poly1d(z3)
-axes[1].plot(low_ps['SelfEfficacy'], p3(low_ps['SelfEfficacy']), 
-            color='#e74c3c', linewidth=2, linestyle='--')
-
-axes[1].scatter(high_ps['SelfEfficacy'], high_ps['Performance'], 
-               alpha=0.5, s=80, color='#2ecc71', label='High Psychological Safety')
-z4 = np.polyfit(high_ps['SelfEfficacy'], high_ps['Performance'], 1)
-p4 = np.poly1d(z4)
-axes[1].plot(high_ps['SelfEfficacy'], p4(high_ps['SelfEfficacy']), 
-            color='#2ecc71', linewidth=2, linestyle='--')
-
-axes[1].set_xlabel('Self-Efficacy', fontsize=12)
-axes[1].set_ylabel('Performance', fontsize=12)
-axes[1].set_title('Interaction: SE Effect by Psychological Safety Level', fontsize=12, fontweight='bold')
-axes[1].legend()
-axes[1].grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('Fig7_Interaction_Effects.png', dpi=300, bbox_inches='tight')
-print("\n✓ Saved: Fig7_Interaction_Effects.png")
+@graph.task('interaction', inputs=['data', 'correlations'])
+def interaction_effects(df, corr):
+    print("\n" + "="*80)
+    print("ADVANCED ANALYSIS 2: INTERACTION EFFECTS")
+    print("="*80)
+
+    # Test: Does Psychological Safety matter MORE when Team Cohesion is LOW?
+    # Create interaction term
+    df = df.copy()
+    df['PS_x_TC'] = df['PsychSafety'] * df['TeamCohesion']
+
+    # Split by cohesion level (low vs high)
+    low_cohesion = df[df['TeamCohesion'] < df['TeamCohesion'].median()]
+    high_cohesion = df[df['TeamCohesion'] >= df['TeamCohesion'].median()]
+
+    corr_ps_perf_low = corr.subset('low_cohesion', low_cohesion.index).r('PsychSafety', 'Performance')
+    corr_ps_perf_high = corr.subset('high_cohesion', high_cohesion.index).r('PsychSafety', 'Performance')
+
+    print(f"\nPsychological Safety → Performance relationship by Team Cohesion:")
+    print(f"  Low Cohesion Teams: r = {corr_ps_perf_low:.3f} (n={len(low_cohesion)})")
+    print(f"  High Cohesion Teams: r = {corr_ps_perf_high:.3f} (n={len(high_cohesion)})")
+    print(f"  Interaction Pattern: PS is {abs(corr_ps_perf_low - corr_ps_perf_high):.3f} units stronger in {'low' if abs(corr_ps_perf_low) > abs(corr_ps_perf_high) else 'high'} cohesion teams")
+
+    # Uncertainty of the difference: bootstrap CI, and a permutation test that
+    # shuffles cohesion against the (PS, Performance) pairs
+    n_resamples = 5000
+    pairs = {'x': df['PsychSafety'], 'y': df['Performance'], 'moderator': df['TeamCohesion']}
+    boot = resample(r_difference_statistics, pairs, n_resamples, seed=455)
+    null = resample(r_difference_statistics, pairs, n_resamples, method='permutation',
+                    permute=['moderator'], seed=455)
+    diff_lo, diff_hi = confidence_interval(boot['difference'])
+    diff_p = permutation_p_value(corr_ps_perf_low - corr_ps_perf_high, null['difference'])
+    print(f"  Difference (low - high): 95% bootstrap CI [{diff_lo:.3f}, {diff_hi:.3f}], permutation p = {diff_p:.4f}")
+
+    # Test: Does Self-Efficacy matter MORE when Psychological Safety is HIGH?
+    low_ps = df[df['PsychSafety'] < df['PsychSafety'].median()]
+    high_ps = df[df['PsychSafety'] >= df['PsychSafety'].median()]
+
+    corr_se_perf_low_ps = corr.subset('low_ps', low_ps.index).r('SelfEfficacy', 'Performance')
+    corr_se_perf_high_ps = corr.subset('high_ps', high_ps.index).r('SelfEfficacy', 'Performance')
+
+    print(f"\nSelf-Efficacy → Performance relationship by Psychological Safety:")
+    print(f"  Low PS Teams: r = {corr_se_perf_low_ps:.3f} (n={len(low_ps)})")
+    print(f"  High PS Teams: r = {corr_se_perf_high_ps:.3f} (n={len(high_ps)})")
+
+    pairs = {'x': df['SelfEfficacy'], 'y': df['Performance'], 'moderator': df['PsychSafety']}
+    boot = resample(r_difference_statistics, pairs, n_resamples, seed=455)
+    null = resample(r_difference_statistics, pairs, n_resamples, method='permutation',
+                    permute=['moderator'], seed=455)
+    diff_lo, diff_hi = confidence_interval(boot['difference'])
+    diff_p = permutation_p_value(corr_se_perf_low_ps - corr_se_perf_high_ps, null['difference'])
+    print(f"  Difference (low - high): 95% bootstrap CI [{diff_lo:.3f}, {diff_hi:.3f}], permutation p = {diff_p:.4f}")
+    print(f"  Interpretation: Self-efficacy matters more when PS is high (confidence benefits")
+    print(f"                  more from safe environments where people can demonstrate abilities)")
+
+    return {'low_cohesion': low_cohesion, 'high_cohesion': high_cohesion,
+            'low_ps': low_ps, 'high_ps': high_ps}
+
+
+@graph.task('fig7', inputs=['interaction'], outputs=['Fig7_Interaction_Effects.png'],
+            render=True)
+def render_fig7(plot):
+    figures.save(figures.interaction_effects(**plot), 'Fig7_Interaction_Effects.png')
+    print("\n✓ Saved: Fig7_Interaction_Effects.png")
+
 
 # ============================================================================
 # ADVANCED ANALYSIS 3: MEDIATION ANALYSIS
 # ============================================================================
-print("\n" + "="*80)
-print("ADVANCED ANALYSIS 3: EXPLORING MECHANISMS (MEDIATION)")
-print("="*80)
-
-# Question: Does Psychological Safety improve Performance mainly through Self-Efficacy?
-# Pathway: PS → SE → Performance
-
-print("\nMediation Analysis: Does Psychological Safety work through Self-Efficacy?")
-print("Pathway: Psychological Safety → Self-Efficacy → Performance")
-
-# Total effect (direct path from PS to Performance)
-total_effect, _ = pearsonr(df['PsychSafety'], df['Performance'])
-print(f"\n1. Total Effect (PS → Performance): r = {total_effect:.3f}")
-
-# Path A: PS → SE
-path_a, _ = pearsonr(df['PsychSafety'], df['SelfEfficacy'])
-print(f"2. Path A (PS → SE): r = {path_a:.3f}")
-
-# Path B: SE → Performance (controlling conceptually)
-path_b, _ = pearsonr(df['SelfEfficacy'], df['Performance'])
-print(f"3. Path B (SE → Performance): r = {path_b:.3f}")
-
-# Direct effect (PS → Performance after controlling for SE)
-X_med = df_scaled[['PsychSafety', 'SelfEfficacy']]
-y_med = df['Performance']
-model_med = LinearRegression()
-model_med.fit(X_med, y_med)
-direct_effect = model_med.coef_[0]
-indirect_effect_estimate = total_effect - direct_effect
-
-print(f"\n4. Direct Effect (PS → Performance, controlling for SE): {direct_effect:.4f}")
-print(f"5. Indirect Effect (PS → SE → Performance, estimated): {indirect_effect_estimate:.4f}")
-print(f"\nInterpretation: Of the total PS-Performance relationship ({total_effect:.3f}),")
-print(f"approximately {(abs(indirect_effect_estimate)/abs(total_effect)*100):.0f}% may work through")
-print(f"self-efficacy development, suggesting PS affects performance through")
-print(f"both increased confidence AND other mechanisms (e.g., risk-taking, idea contribution).")
-
-# Similar analysis for Social Identity → Growth
-print("\n" + "-"*80)
-print("Mediation Analysis: Does Social Identity affect Growth through Cohesion?")
-print("Pathway: Social Identity → Team Cohesion → Growth")
-
-total_effect_si, _ = pearsonr(df['SocialIdentity'], df['Growth'])
-print(f"\n1. Total Effect (SI → Growth): r = {total_effect_si:.3f}")
-
-path_a_si, _ = pearsonr(df['SocialIdentity'], df['TeamCohesion'])
-print(f"2. Path A (SI → TC): r = {path_a_si:.3f}")
-
-path_b_si, _ = pearsonr(df['TeamCohesion'], df['Growth'])
-print(f"3. Path B (TC → Growth): r = {path_b_si:.3f}")
-
-X_med2 = df_scaled[['SocialIdentity', 'TeamCohesion']]
-y_med2 = df['Growth']
-model_med2 = LinearRegression()
-model_med2.fit(X_med2, y_med2)
-direct_effect_si = model_med2.coef_[0]
-indirect_effect_si = total_effect_si - direct_effect_si
-
-print(f"\n4. Direct Effect (SI → Growth, controlling for TC): {direct_effect_si:.4f}")
-print(f"5. Indirect Effect (SI → TC → Growth, estimated): {indirect_effect_si:.4f}")
-print(f"\nInterpretation: Social identity seems to drive growth both by creating")
-print(f"interpersonal bonds AND by fostering collective commitment to improvement.")
-
-# Visualize mediation
-fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-# Mediation pathway 1
-y_pos_ax = np.array([0, 0.5, 1])
-axes[0].scatter([0], [0], s=200, color='#3498db', marker='o', zorder=3)
-axes[0].scatter([1], [0.5], s=200, color='#e74c3c', marker='o', zorder=3)
-axes[0].scatter([1], [1], s=200, color='#2ecc71', marker='o', zorder=3)
-
-axes[0].text(-0.15, 0, 'PS', fontsize=11, fontweight='bold', va='center')
-axes[0].text(0.85, 0.5, 'SE', fontsize=11, fontweight='bold', va='center')
-axes[0].text(0.95, 1, 'Perf', fontsize=11, fontweight='bold', va='center')
-
-axes[0].arrow(0.05, 0.02, 0.9, 0.45, head_width=0.05, head_length=0.05, fc='black', ec='black')
-axes[0].text(0.45, 0.3, f'a={path_a:.2f}', fontsize=10, ha='center')
-
-axes[0].arrow(0.05, 0.08, 0.9, 0.85, head_width=0.05, head_length=0.05, fc='gray', ec='gray', linestyle='--')
-axes[0].text(0.35, 0.55, f'total={total_effect:.2f}', fontsize=10, ha='center', color='gray')
-
-axes[0].arrow(1.05, 0.52, -0.04, 0.42, head_width=0.05, head_length=0.05, fc='black', ec='black')
-axes[0].text(1.15, 0.75, f'b={path_b:.2f}', fontsize=10, ha='left')
-
-axes[0].set_xlim(-0.3, 1.3)
-axes[0].set_ylim(-0.2, 1.2)
-axes[0].axis('off')
-axes[0].set_title('Mediation: PS → SE → Performance', fontsize=12, fontweight='bold')
-
-# Mediation pathway 2
-axes[1].scatter([0], [0], s=200, color='#f39c12', marker='o', zorder=3)
-axes[1].scatter([1], [0.5], s=200, color='#9b59b6', marker='o', zorder=3)
-axes[1].scatter([1], [1], s=200, color='#1abc9c', marker='o', zorder=3)
-
-axes[1].text(-0.15, 0, 'SI', fontsize=11, fontweight='bold', va='center')
-axes[1].text(0.85, 0.5, 'TC', fontsize=11, fontweight='bold', va='center')
-axes[1].text(0.95, 1, 'Growth', fontsize=11, fontweight='bold', va='center')
-
-axes[1].arrow(0.05, 0.02, 0.9, 0.45, head_width=0.05, head_length=0.05, fc='black', ec='black')
-axes[1].text(0.45, 0.3, f'a={path_a_si:.2f}', fontsize=10, ha='center')
-
-axes[1].arrow(0.05, 0.08, 0.9, 0.85, head_width=0.05, head_length=0.05, fc='gray', ec='gray', linestyle='--')
-axes[1].text(0.35, 0.55, f'total={total_effect_si:.2f}', fontsize=10, ha='center', color='gray')
-
-axes[1].arrow(1.05, 0.52, -0.04, 0.42, head_width=0.05, head_length=0.05, fc='black', ec='black')
-axes[1].text(1.15, 0.75, f'b={path_b_si:.2f}', fontsize=10, ha='left')
-
-axes[1].set_xlim(-0.3, 1.3)
-axes[1].set_ylim(-0.2, 1.2)
-axes[1].axis('off')
-axes[1].set_title('Mediation: SI → TC → Growth', fontsize=12, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('Fig8_Mediation_Pathways.png', dpi=300, bbox_inches='tight')
-print("\n✓ Saved: Fig8_Mediation_Pathways.png")
+@graph.task('mediation', inputs=['data', 'standardized', 'correlations'])
+def mediation_analysis(df, df_scaled, corr):
+    print("\n" + "="*80)
+    print("ADVANCED ANALYSIS 3: EXPLORING MECHANISMS (MEDIATION)")
+    print("="*80)
+
+    # Question: Does Psychological Safety improve Performance mainly through Self-Efficacy?
+    # Pathway: PS → SE → Performance
+
+    print("\nMediation Analysis: Does Psychological Safety work through Self-Efficacy?")
+    print("Pathway: Psychological Safety → Self-Efficacy → Performance")
+
+    # Total effect (direct path from PS to Performance)
+    total_effect = corr.r('PsychSafety', 'Performance')
+    print(f"\n1. Total Effect (PS → Performance): r = {total_effect:.3f}")
+
+    # Path A: PS → SE
+    path_a = corr.r('PsychSafety', 'SelfEfficacy')
+    print(f"2. Path A (PS → SE): r = {path_a:.3f}")
+
+    # Path B: SE → Performance (controlling conceptually)
+    path_b = corr.r('SelfEfficacy', 'Performance')
+    print(f"3. Path B (SE → Performance): r = {path_b:.3f}")
+
+    # Direct effect (PS → Performance after controlling for SE)
+    direct_effect = ols(df_scaled[['PsychSafety', 'SelfEfficacy']], df['Performance']).coef.at['PsychSafety', 'Performance']
+    indirect_effect_estimate = total_effect - direct_effect
+
+    print(f"\n4. Direct Effect (PS → Performance, controlling for SE): {direct_effect:.4f}")
+    print(f"5. Indirect Effect (PS → SE → Performance, estimated): {indirect_effect_estimate:.4f}")
+
+    # Bootstrap confidence intervals: all resamples are evaluated as one batch
+    n_resamples = 5000
+    boot = resample(mediation_statistics,
+                    {'x': df['PsychSafety'], 'm': df['SelfEfficacy'], 'y': df['Performance']},
+                    n_resamples, seed=455)
+    direct_lo, direct_hi = confidence_interval(boot['direct'])
+    indirect_lo, indirect_hi = confidence_interval(boot['indirect'])
+    print(f"   95% bootstrap CIs ({n_resamples} resamples): direct [{direct_lo:.4f}, {direct_hi:.4f}], "
+          f"indirect [{indirect_lo:.4f}, {indirect_hi:.4f}]")
+    print(f"\nInterpretation: Of the total PS-Performance relationship ({total_effect:.3f}),")
+    print(f"approximately {(abs(indirect_effect_estimate)/abs(total_effect)*100):.0f}% may work through")
+    print(f"self-efficacy development, suggesting PS affects performance through")
+    print(f"both increased confidence AND other mechanisms (e.g., risk-taking, idea contribution).")
+
+    # Similar analysis for Social Identity → Growth
+    print("\n" + "-"*80)
+    print("Mediation Analysis: Does Social Identity affect Growth through Cohesion?")
+    print("Pathway: Social Identity → Team Cohesion → Growth")
+
+    total_effect_si = corr.r('SocialIdentity', 'Growth')
+    print(f"\n1. Total Effect (SI → Growth): r = {total_effect_si:.3f}")
+
+    path_a_si = corr.r('SocialIdentity', 'TeamCohesion')
+    print(f"2. Path A (SI → TC): r = {path_a_si:.3f}")
+
+    path_b_si = corr.r('TeamCohesion', 'Growth')
+    print(f"3. Path B (TC → Growth): r = {path_b_si:.3f}")
+
+    direct_effect_si = ols(df_scaled[['SocialIdentity', 'TeamCohesion']], df['Growth']).coef.at['SocialIdentity', 'Growth']
+    indirect_effect_si = total_effect_si - direct_effect_si
+
+    print(f"\n4. Direct Effect (SI → Growth, controlling for TC): {direct_effect_si:.4f}")
+    print(f"5. Indirect Effect (SI → TC → Growth, estimated): {indirect_effect_si:.4f}")
+
+    boot = resample(mediation_statistics,
+                    {'x': df['SocialIdentity'], 'm': df['TeamCohesion'], 'y': df['Growth']},
+                    n_resamples, seed=455)
+    direct_lo, direct_hi = confidence_interval(boot['direct'])
+    indirect_lo, indirect_hi = confidence_interval(boot['indirect'])
+    print(f"   95% bootstrap CIs ({n_resamples} resamples): direct [{direct_lo:.4f}, {direct_hi:.4f}], "
+          f"indirect [{indirect_lo:.4f}, {indirect_hi:.4f}]")
+    print(f"\nInterpretation: Social identity seems to drive growth both by creating")
+    print(f"interpersonal bonds AND by fostering collective commitment to improvement.")
+
+    return {'ps_paths': (path_a, path_b, total_effect),
+            'si_paths': (path_a_si, path_b_si, total_effect_si)}
+
+
+@graph.task('fig8', inputs=['mediation'], outputs=['Fig8_Mediation_Pathways.png'],
+            render=True)
+def render_fig8(plot):
+    figures.save(figures.mediation_pathways(**plot), 'Fig8_Mediation_Pathways.png')
+    print("\n✓ Saved: Fig8_Mediation_Pathways.png")
+
 
 # ============================================================================
 # ADVANCED ANALYSIS 4: VULNERABILITY & RESILIENCE
 # ============================================================================
-print("\n" + "="*80)
-print("ADVANCED ANALYSIS 4: TEAM VULNERABILITY & RESILIENCE PATTERNS")
-print("="*80)
-
-# Identify vulnerable teams: low PS AND low cohesion
-vulnerable = df[(df['PsychSafety'] < df['PsychSafety'].median()) & 
-                (df['TeamCohesion'] < df['TeamCohesion'].median())]
-resilient = df[(df['PsychSafety'] >= df['PsychSafety'].median()) & 
-               (df['TeamCohesion'] >= df['TeamCohesion'].median())]
-
-print(f"\nVulnerable Teams (Low PS & Low Cohesion): n={len(vulnerable)}")
-print(f"  Average Performance: {vulnerable['Performance'].mean():.2f}")
-print(f"  Average Learning: {vulnerable['Learning'].mean():.2f}")
-print(f"  Average Growth: {vulnerable['Growth'].mean():.2f}")
-print(f"  Average Future Willingness: {vulnerable['WillingnessFuture'].mean():.2f}")
-
-print(f"\nResilient Teams (High PS & High Cohesion): n={len(resilient)}")
-print(f"  Average Performance: {resilient['Performance'].mean():.2f}")
-print(f"  Average Learning: {resilient['Learning'].mean():.2f}")
-print(f"  Average Growth: {resilient['Growth'].mean():.2f}")
-print(f"  Average Future Willingness: {resilient['WillingnessFuture'].mean():.2f}")
-
-print(f"\nPerformance Gap: {resilient['Performance'].mean() - vulnerable['Performance'].mean():.2f} points")
-print(f"Growth Gap: {resilient['Growth'].mean() - vulnerable['Growth'].mean():.2f} points")
-
-# Visualize vulnerability profiles
-fig, ax = plt.subplots(figsize=(10, 6))
-
-categories = ['Performance', 'Learning', 'Growth', 'Future Willingness']
-vulnerable_means = [vulnerable['Performance'].mean(), vulnerable['Learning'].mean(), 
-                   vulnerable['Growth'].mean(), vulnerable['WillingnessFuture'].mean()]
-resilient_means = [resilient['Performance'].mean(), resilient['Learning'].mean(), 
-                  resilient['Growth'].mean(), resilient['WillingnessFuture'].mean()]
-
-x = np.arange(len(categories))
-width = 0.35
-
-bars1 = ax.bar(x - width/2, vulnerable_means, width, label='Vulnerable Teams', 
-              color='#e74c3c', edgecolor='black')
-bars2 = ax.bar(x + width/2, resilient_means, width, label='Resilient Teams', 
-              color='#2ecc71', edgecolor='black')
-
-ax.set_ylabel('Average Score', fontsize=12)
-ax.set_title('Team Vulnerability vs Resilience: Outcome Differences', fontsize=13, fontweight='bold')
-ax.set_xticks(x)
-ax.set_xticklabels(categories)
-ax.legend(fontsize=11)
-ax.grid(True, alpha=0.3, axis='y')
-
-# Add value labels on bars
-for bars in [bars1, bars2]:
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.2f}', ha='center', va='bottom', fontsize=9)
-
-plt.tight_layout()
-plt.savefig('Fig9_Vulnerability_Resilience.png', dpi=300, bbox_inches='tight')
-print("\n✓ Saved: Fig9_Vulnerability_Resilience.png")
+@graph.task('vulnerability', inputs=['data'])
+def vulnerability_resilience(df):
+    print("\n" + "="*80)
+    print("ADVANCED ANALYSIS 4: TEAM VULNERABILITY & RESILIENCE PATTERNS")
+    print("="*80)
+
+    # Identify vulnerable teams: low PS AND low cohesion
+    vulnerable = df[(df['PsychSafety'] < df['PsychSafety'].median()) & 
+                    (df['TeamCohesion'] < df['TeamCohesion'].median())]
+    resilient = df[(df['PsychSafety'] >= df['PsychSafety'].median()) & 
+                   (df['TeamCohesion'] >= df['TeamCohesion'].median())]
+
+    print(f"\nVulnerable Teams (Low PS & Low Cohesion): n={len(vulnerable)}")
+    print(f"  Average Performance: {vulnerable['Performance'].mean():.2f}")
+    print(f"  Average Learning: {vulnerable['Learning'].mean():.2f}")
+    print(f"  Average Growth: {vulnerable['Growth'].mean():.2f}")
+    print(f"  Average Future Willingness: {vulnerable['WillingnessFuture'].mean():.2f}")
+
+    print(f"\nResilient Teams (High PS & High Cohesion): n={len(resilient)}")
+    print(f"  Average Performance: {resilient['Performance'].mean():.2f}")
+    print(f"  Average Learning: {resilient['Learning'].mean():.2f}")
+    print(f"  Average Growth: {resilient['Growth'].mean():.2f}")
+    print(f"  Average Future Willingness: {resilient['WillingnessFuture'].mean():.2f}")
+
+    print(f"\nPerformance Gap: {resilient['Performance'].mean() - vulnerable['Performance'].mean():.2f} points")
+    print(f"Growth Gap: {resilient['Growth'].mean() - vulnerable['Growth'].mean():.2f} points")
+
+    categories = ['Performance', 'Learning', 'Growth', 'Future Willingness']
+    vulnerable_means = [vulnerable['Performance'].mean(), vulnerable['Learning'].mean(), 
+                       vulnerable['Growth'].mean(), vulnerable['WillingnessFuture'].mean()]
+    resilient_means = [resilient['Performance'].mean(), resilient['Learning'].mean(), 
+                      resilient['Growth'].mean(), resilient['WillingnessFuture'].mean()]
+    return {'categories': categories, 'vulnerable_means': vulnerable_means,
+            'resilient_means': resilient_means}
+
+
+@graph.task('fig9', inputs=['vulnerability'], outputs=['Fig9_Vulnerability_Resilience.png'],
+            render=True)
+def render_fig9(plot):
+    figures.save(figures.vulnerability_resilience(**plot), 'Fig9_Vulnerability_Resilience.png')
+    print("\n✓ Saved: Fig9_Vulnerability_Resilience.png")
+
 
 # ============================================================================
 # ALTERNATIVE EXPLANATIONS & CONFOUNDS
 # ============================================================================
-print("\n" + "="*80)
-print("EXPLORING ALTERNATIVE EXPLANATIONS")
-print("="*80)
-
-# Alternative 1: Could team composition (assumed ability) drive both PS and performance?
-# Proxy: SE at baseline predicts both
-print("\nAlternative Explanation 1: Team Capability Confound")
-print("Could initial self-efficacy (proxy for team ability) drive both PS and performance?")
-
-# If this were true, we'd see strong SE-Performance AND PS-Performance with PS acting as byproduct
-se_perf_r, _ = pearsonr(df['SelfEfficacy'], df['Performance'])
-ps_perf_r, _ = pearsonr(df['PsychSafety'], df['Performance'])
-se_ps_r, _ = pearsonr(df['SelfEfficacy'], df['PsychSafety'])
-
-print(f"\n  SE → Performance: r = {se_perf_r:.3f}")
-print(f"  PS → Performance: r = {ps_perf_r:.3f}")
-print(f"  SE ↔ PS correlation: r = {se_ps_r:.3f}")
-print(f"\nFindings: PS-Performance relationship ({ps_perf_r:.3f}) is STRONGER than SE-Performance")
-print(f"({se_perf_r:.3f}), and SE-PS correlation is moderate ({se_ps_r:.3f}), suggesting that")
-print(f"PS is not merely reflecting underlying team ability.")
-
-# Alternative 2: Shared Method Variance
-print("\nAlternative Explanation 2: Shared Method Variance")
-print("Could high correlations just reflect similar scale directions?")
-
-# Check if reversals exist (e.g., Performance scales 6-10, others 1-5 or different)
-print(f"\n  Team Cohesion scale: 1-5")
-print(f"  Social Identity scale: 6-10 (REVERSED direction)")
-print(f"  Psych Safety scale: 1-5")
-print(f"  Performance scale: 6-10")
-print(f"\nFindings: Variables use different scales and directions, making shared method")
-print(f"variance less likely as a confound. High intercorrelations likely reflect genuine")
-print(f"team dynamics rather than measurement artifact.")
-
-print("\n" + "="*80)
-print("ANALYSIS COMPLETE!")
-print("="*80)
-print("\nGenerated Files:")
-print("  • 9 Figures (PNG) - including 3 new advanced analyses")
-print("  • 4 Tables (CSV) - including regression coefficients")
-print("\nKey Advanced Findings:")
-print("  1. Regression Model: Team factors explain 31% of performance variance")
-print("  2. Interaction: PS stronger predictor in low-cohesion teams (intervention target)")
-print("  3. Mediation: PS likely affects performance through multiple pathways")
-print("  4. Vulnerability: High-risk teams show 1+ point performance deficit")
+@graph.task('confounds', inputs=['correlations'])
+def alternative_explanations(corr):
+    print("\n" + "="*80)
+    print("EXPLORING ALTERNATIVE EXPLANATIONS")
+    print("="*80)
+
+    # Alternative 1: Could team composition (assumed ability) drive both PS and performance?
+    # Proxy: SE at baseline predicts both
+    print("\nAlternative Explanation 1: Team Capability Confound")
+    print("Could initial self-efficacy (proxy for team ability) drive both PS and performance?")
+
+    # If this were true, we'd see strong SE-Performance AND PS-Performance with PS acting as byproduct
+    se_perf_r = corr.r('SelfEfficacy', 'Performance')
+    ps_perf_r = corr.r('PsychSafety', 'Performance')
+    se_ps_r = corr.r('SelfEfficacy', 'PsychSafety')
+
+    print(f"\n  SE → Performance: r = {se_perf_r:.3f}")
+    print(f"  PS → Performance: r = {ps_perf_r:.3f}")
+    print(f"  SE ↔ PS correlation: r = {se_ps_r:.3f}")
+    print(f"\nFindings: PS-Performance relationship ({ps_perf_r:.3f}) is STRONGER than SE-Performance")
+    print(f"({se_perf_r:.3f}), and SE-PS correlation is moderate ({se_ps_r:.3f}), suggesting that")
+    print(f"PS is not merely reflecting underlying team ability.")
+
+    # Alternative 2: Shared Method Variance
+    print("\nAlternative Explanation 2: Shared Method Variance")
+    print("Could high correlations just reflect similar scale directions?")
+
+    # Check if reversals exist (e.g., Performance scales 6-10, others 1-5 or different)
+    print(f"\n  Team Cohesion scale: 1-5")
+    print(f"  Social Identity scale: 6-10 (REVERSED direction)")
+    print(f"  Psych Safety scale: 1-5")
+    print(f"  Performance scale: 6-10")
+    print(f"\nFindings: Variables use different scales and directions, making shared method")
+    print(f"variance less likely as a confound. High intercorrelations likely reflect genuine")
+    print(f"team dynamics rather than measurement artifact.")
+
+
+@graph.task('conclusions')
+def conclusions():
+    print("\n" + "="*80)
+    print("ANALYSIS COMPLETE!")
+    print("="*80)
+    print("\nGenerated Files:")
+    print("  • 9 Figures (PNG) - including 3 new advanced analyses")
+    print("  • 4 Tables (CSV) - including regression coefficients")
+    print("\nKey Advanced Findings:")
+    print("  1. Regression Model: Team factors explain 31% of performance variance")
+    print("  2. Interaction: PS stronger predictor in low-cohesion teams (intervention target)")
+    print("  3. Mediation: PS likely affects performance through multiple pathways")
+    print("  4. Vulnerability: High-risk teams show 1+ point performance deficit")
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Team experience analysis')
+    parser.add_argument('tasks', nargs='*', help='tasks to build (default: all)')
+    parser.add_argument('--force', nargs='*', default=[], help='tasks to rerun even if cached')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes (default: one per CPU)')
+    args = parser.parse_args()
+    # Figures render in their own worker processes while the statistics run
+    with figures.RenderQueue(args.jobs) as render_queue:
+        graph.run(args.tasks, n_jobs=args.jobs, force=args.force, render_queue=render_queue)
@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+def correlation_matrices(values: np.ndarray) -> tuple:
+    """
+    Pearson r, p-value and pair count for every pair of columns at once.
+
+    Missing values (NaN) are handled pairwise, like ``DataFrame.corr()``:
+    each pair uses the rows where both columns are present. All sums come
+    from three matrix products over the centered data, so the cost is a
+    handful of BLAS calls instead of one ``pearsonr`` per pair.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        (n_rows, n_cols) float array
+
+    Returns
+    -------
+    tuple
+        (r, p, n) arrays of shape (n_cols, n_cols)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    present = ~np.isnan(values)
+    mask = present.astype(np.float64)
+    # Centering first keeps the sums of squares well conditioned
+    centered = np.where(present, values - np.nanmean(values, axis=0), 0.0)
+
+    n = mask.T @ mask
+    sum_x = centered.T @ mask                 # [i, j]: sum of column i over rows where j is present
+    sum_xx = (centered * centered).T @ mask
+    sum_xy = centered.T @ centered
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sum_xy - sum_x * sum_x.T / n
+        var_x = sum_xx - sum_x ** 2 / n
+        r = cov / np.sqrt(var_x * var_x.T)
+        r = np.clip(r, -1.0, 1.0)
+        # A column correlates exactly 1 with itself; the sums above leave rounding noise
+        diagonal = np.arange(len(r))
+        r[diagonal, diagonal] = np.where(np.diagonal(var_x) > 0, 1.0, np.nan)
+
+        # Two-sided p-value of the t statistic with n - 2 degrees of freedom,
+        # the same test scipy.stats.pearsonr performs
+        dof = n - 2
+        t = r * np.sqrt(dof / (1.0 - r * r))
+        p = 2 * stats.t.sf(np.abs(t), dof)
+    p = np.where(np.abs(r) == 1.0, 0.0, p)
+    p = np.where(dof > 0, p, np.nan)
+    return r, p, n
+
+
+class CorrelationEngine:
+    """
+    Memoized correlation lookups for one table of variables.
+
+    The full r and p-value matrices are computed once, on first use, and
+    every later lookup is an index into them. Correlations within subgroups
+    of rows (e.g. low vs high cohesion teams) get their own engine, also
+    computed once and remembered under the subgroup's name.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data holding the variables
+    columns : list, optional
+        Variables to correlate (default: every numeric column)
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: list = None):
+        if columns is None:
+            columns = list(df.select_dtypes('number').columns)
+        self.columns = list(columns)
+        self._df = df
+        self._matrices = None
+        self._subsets = {}
+
+    def _compute(self) -> tuple:
+        if self._matrices is None:
+            r, p, n = correlation_matrices(self._df[self.columns].to_numpy(dtype=np.float64))
+            self._matrices = tuple(pd.DataFrame(m, index=self.columns, columns=self.columns)
+                                   for m in (r, p, n))
+        return self._matrices
+
+    @property
+    def r_matrix(self) -> pd.DataFrame:
+        """Pearson correlation of every pair of variables."""
+        return self._compute()[0]
+
+    @property
+    def p_matrix(self) -> pd.DataFrame:
+        """Two-sided p-value of every correlation."""
+        return self._compute()[1]
+
+    def pair(self, x: str, y: str) -> tuple:
+        """(r, p-value) for one pair, like ``scipy.stats.pearsonr``."""
+        r, p, _ = self._compute()
+        return r.at[x, y], p.at[x, y]
+
+    def r(self, x: str, y: str) -> float:
+        return self.pair(x, y)[0]
+
+    def against(self, factors: list, target: str) -> pd.DataFrame:
+        """Correlation table of several factors with one target, strongest first."""
+        r, p, _ = self._compute()
+        return pd.DataFrame({
+            'Factor': factors,
+            'Correlation': r.loc[factors, target].to_numpy(),
+            'P-Value': p.loc[factors, target].to_numpy()
+        }).sort_values('Correlation', ascending=False)
+
+    def subset(self, name: str, rows=None) -> 'CorrelationEngine':
+        """
+        Engine for a subgroup of rows, built on first request.
+
+        Parameters
+        ----------
+        name : str
+            Key the subgroup is remembered under
+        rows : boolean mask or index labels
+            Rows belonging to the subgroup; only needed the first time, and
+            checked against the remembered rows if passed again
+        """
+        if rows is None:
+            if name not in self._subsets:
+                raise KeyError(f"Unknown subgroup {name!r}; pass its rows on first use")
+            return self._subsets[name]
+        df = self._df.loc[rows]
+        if name not in self._subsets:
+            self._subsets[name] = CorrelationEngine(df, self.columns)
+        elif not df.index.equals(self._subsets[name]._df.index):
+            raise ValueError(f"Subgroup {name!r} was already built from different rows")
+        return self._subsets[name]
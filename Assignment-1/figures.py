@@ -0,0 +1,298 @@
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend
+import matplotlib.pyplot as plt
+import numpy as np
+import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
+
+
+def set_style():
+    """Plot style shared by every figure in the report."""
+    plt.style.use('seaborn-v0_8-whitegrid')
+    sns.set_palette("Set2")
+
+
+def _init_worker():
+    """Process pool initializer: render without a display, in the report style."""
+    plt.switch_backend('Agg')
+    set_style()
+
+
+def save(fig, path: str, dpi: int = 300) -> str:
+    """Write a figure to ``path``, close it and return the path."""
+    try:
+        fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return path
+
+
+class RenderQueue:
+    """
+    Process pool that renders figures on the Agg backend.
+
+    Figures are drawn and saved in worker processes, so the main process can
+    carry on with the statistics while earlier figures are still rendering.
+    Accepts any picklable callable, like ``ProcessPoolExecutor.submit``.
+
+    Parameters
+    ----------
+    n_jobs : int, optional
+        Number of worker processes (default: one per CPU)
+    """
+
+    def __init__(self, n_jobs: int = None):
+        self._pool = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker)
+
+    def submit(self, func, *args, **kwargs):
+        """Schedule ``func(*args, **kwargs)`` on a worker; returns a Future."""
+        return self._pool.submit(func, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+
+# ============================================================================
+# FIGURE BUILDERS: each takes precomputed results and returns a Figure
+# ============================================================================
+
+def _trend_line(ax, x, y, **kwargs):
+    """Least-squares line through the points."""
+    p = np.poly1d(np.polyfit(x, y, 1))
+    ax.plot(x, p(x), **kwargs)
+
+
+def performance_factors(df, factors: list, r: dict):
+    """Fig 1: each team factor against performance."""
+    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
+    fig.suptitle('Team Experience Factors vs. Performance', fontsize=16, fontweight='bold')
+
+    for idx, factor in enumerate(factors):
+        ax = axes[idx//3, idx%3]
+        ax.scatter(df[factor], df['Performance'], alpha=0.5, s=50)
+        _trend_line(ax, df[factor], df['Performance'], color='r', linestyle='--', alpha=0.8, linewidth=2)
+        ax.set_xlabel(factor, fontsize=11)
+        ax.set_ylabel('Performance', fontsize=11)
+        ax.set_title(f'r = {r[factor]:.3f}', fontsize=12)
+        ax.grid(True, alpha=0.3)
+
+    # Remove extra subplot
+    fig.delaxes(axes[1, 2])
+    fig.tight_layout()
+    return fig
+
+
+def performance_willingness(df, r: float, willingness_by_performance):
+    """Fig 2: performance against willingness to work together again."""
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Scatter plot
+    axes[0].scatter(df['Performance'], df['WillingnessFuture'], alpha=0.5, s=80)
+    _trend_line(axes[0], df['Performance'], df['WillingnessFuture'], color='r', linestyle='--', linewidth=2)
+    axes[0].set_xlabel('Team Performance', fontsize=12)
+    axes[0].set_ylabel('Willingness to Work Together Again', fontsize=12)
+    axes[0].set_title(f'Performance vs Future Collaboration (r={r:.3f})', fontsize=13, fontweight='bold')
+    axes[0].grid(True, alpha=0.3)
+
+    # Grouped bar chart
+    willingness_by_performance.plot(kind='bar', ax=axes[1], color=['#e74c3c', '#f39c12', '#2ecc71'],
+                                    edgecolor='black')
+    axes[1].set_xlabel('Performance Level', fontsize=12)
+    axes[1].set_ylabel('Average Willingness Score', fontsize=12)
+    axes[1].set_title('Willingness to Work Together by Performance Level', fontsize=13, fontweight='bold')
+    axes[1].set_xticklabels(axes[1].get_xticklabels(), rotation=0)
+    axes[1].grid(True, alpha=0.3, axis='y')
+
+    fig.tight_layout()
+    return fig
+
+
+def psych_safety_learning(df, r_learning: float, r_efficacy: float, outcomes_by_ps):
+    """Fig 3: psychological safety against learning and self-efficacy."""
+    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+
+    # PS vs Learning
+    axes[0].scatter(df['PsychSafety'], df['Learning'], alpha=0.5, s=80, color='steelblue')
+    _trend_line(axes[0], df['PsychSafety'], df['Learning'], color='r', linestyle='--', linewidth=2)
+    axes[0].set_xlabel('Psychological Safety', fontsize=12)
+    axes[0].set_ylabel('Learning Gains', fontsize=12)
+    axes[0].set_title(f'Psychological Safety vs Learning (r={r_learning:.3f})', fontsize=12, fontweight='bold')
+    axes[0].grid(True, alpha=0.3)
+
+    # PS vs Self-Efficacy
+    axes[1].scatter(df['PsychSafety'], df['SelfEfficacy'], alpha=0.5, s=80, color='seagreen')
+    _trend_line(axes[1], df['PsychSafety'], df['SelfEfficacy'], color='r', linestyle='--', linewidth=2)
+    axes[1].set_xlabel('Psychological Safety', fontsize=12)
+    axes[1].set_ylabel('Self-Efficacy', fontsize=12)
+    axes[1].set_title(f'Psychological Safety vs Confidence (r={r_efficacy:.3f})', fontsize=12, fontweight='bold')
+    axes[1].grid(True, alpha=0.3)
+
+    # Comparison by PS level
+    outcomes_by_ps.plot(kind='bar', ax=axes[2], color=['#3498db', '#e74c3c', '#2ecc71'], edgecolor='black')
+    axes[2].set_xlabel('Psychological Safety Level', fontsize=12)
+    axes[2].set_ylabel('Average Score', fontsize=12)
+    axes[2].set_title('Outcomes by Psychological Safety Level', fontsize=12, fontweight='bold')
+    axes[2].set_xticklabels(axes[2].get_xticklabels(), rotation=0)
+    axes[2].legend(['Learning', 'Self-Efficacy', 'Performance'], loc='lower right')
+    axes[2].grid(True, alpha=0.3, axis='y')
+
+    fig.tight_layout()
+    return fig
+
+
+def growth_predictors(corr_matrix, conditions_by_growth):
+    """Fig 4: correlations with growth and team conditions by growth level."""
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Correlation heatmap
+    sns.heatmap(corr_matrix, annot=True, fmt='.3f', cmap='coolwarm',
+                center=0, ax=axes[0], cbar_kws={'label': 'Correlation'})
+    axes[0].set_title('Correlation Matrix: Team Factors and Growth', fontsize=13, fontweight='bold')
+
+    # Team conditions by growth level
+    conditions_by_growth.T.plot(kind='bar', ax=axes[1], color=['#e74c3c', '#f39c12', '#2ecc71'],
+                                edgecolor='black', width=0.8)
+    axes[1].set_xlabel('Team Condition', fontsize=12)
+    axes[1].set_ylabel('Average Score', fontsize=12)
+    axes[1].set_title('Team Conditions by Growth Level', fontsize=13, fontweight='bold')
+    axes[1].set_xticklabels(axes[1].get_xticklabels(), rotation=45, ha='right')
+    axes[1].legend(title='Growth Level', loc='upper right')
+    axes[1].grid(True, alpha=0.3, axis='y')
+
+    fig.tight_layout()
+    return fig
+
+
+def correlation_heatmap(corr_matrix):
+    """Fig 5: correlation matrix of every key variable."""
+    fig, ax = plt.subplots(figsize=(10, 8))
+    sns.heatmap(corr_matrix, annot=True, fmt='.3f', cmap='coolwarm', ax=ax,
+                center=0, square=True, linewidths=1, cbar_kws={'label': 'Pearson Correlation'})
+    ax.set_title('Correlation Matrix: All Team Experience Variables', fontsize=14, fontweight='bold', pad=20)
+    fig.tight_layout()
+    return fig
+
+
+def high_vs_low(comparison_vars: list, high_means, low_means):
+    """Fig 6: team conditions of high vs low performers."""
+    fig, ax = plt.subplots(figsize=(12, 6))
+    x = np.arange(len(comparison_vars))
+    width = 0.35
+
+    ax.bar(x - width/2, high_means, width,
+           label='High Performers (10)', color='#2ecc71', edgecolor='black')
+    ax.bar(x + width/2, low_means, width,
+           label='Low Performers (≤8)', color='#e74c3c', edgecolor='black')
+
+    ax.set_xlabel('Team Condition', fontsize=12)
+    ax.set_ylabel('Average Score', fontsize=12)
+    ax.set_title('High vs Low Performing Teams: Key Differences', fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(comparison_vars, rotation=45, ha='right')
+    ax.legend()
+    ax.grid(True, alpha=0.3, axis='y')
+
+    fig.tight_layout()
+    return fig
+
+
+def _split_trends(ax, low, high, x: str, labels: tuple, xlabel: str, title: str):
+    """Scatter and trend line of x vs performance for a low and a high group."""
+    for group, label, color in ((low, labels[0], '#e74c3c'), (high, labels[1], '#2ecc71')):
+        ax.scatter(group[x], group['Performance'], alpha=0.5, s=80, color=color, label=label)
+        _trend_line(ax, group[x], group['Performance'], color=color, linewidth=2, linestyle='--')
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel('Performance', fontsize=12)
+    ax.set_title(title, fontsize=12, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+def interaction_effects(low_cohesion, high_cohesion, low_ps, high_ps):
+    """Fig 7: PS effect by cohesion level and SE effect by PS level."""
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Interaction 1: PS effect by Cohesion level
+    _split_trends(axes[0], low_cohesion, high_cohesion, 'PsychSafety',
+                  ('Low Cohesion', 'High Cohesion'), 'Psychological Safety',
+                  'Interaction: PS Effect by Team Cohesion Level')
+
+    # Interaction 2: SE effect by PS level
+    _split_trends(axes[1], low_ps, high_ps, 'SelfEfficacy',
+                  ('Low Psychological Safety', 'High Psychological Safety'), 'Self-Efficacy',
+                  'Interaction: SE Effect by Psychological Safety Level')
+
+    fig.tight_layout()
+    return fig
+
+
+def _mediation_panel(ax, names: tuple, colors: tuple, path_a: float, path_b: float,
+                     total: float, title: str):
+    """Path diagram X -> M -> Y with the a, b and total effects."""
+    ax.scatter([0], [0], s=200, color=colors[0], marker='o', zorder=3)
+    ax.scatter([1], [0.5], s=200, color=colors[1], marker='o', zorder=3)
+    ax.scatter([1], [1], s=200, color=colors[2], marker='o', zorder=3)
+
+    ax.text(-0.15, 0, names[0], fontsize=11, fontweight='bold', va='center')
+    ax.text(0.85, 0.5, names[1], fontsize=11, fontweight='bold', va='center')
+    ax.text(0.95, 1, names[2], fontsize=11, fontweight='bold', va='center')
+
+    ax.arrow(0.05, 0.02, 0.9, 0.45, head_width=0.05, head_length=0.05, fc='black', ec='black')
+    ax.text(0.45, 0.3, f'a={path_a:.2f}', fontsize=10, ha='center')
+
+    ax.arrow(0.05, 0.08, 0.9, 0.85, head_width=0.05, head_length=0.05, fc='gray', ec='gray', linestyle='--')
+    ax.text(0.35, 0.55, f'total={total:.2f}', fontsize=10, ha='center', color='gray')
+
+    ax.arrow(1.05, 0.52, -0.04, 0.42, head_width=0.05, head_length=0.05, fc='black', ec='black')
+    ax.text(1.15, 0.75, f'b={path_b:.2f}', fontsize=10, ha='left')
+
+    ax.set_xlim(-0.3, 1.3)
+    ax.set_ylim(-0.2, 1.2)
+    ax.axis('off')
+    ax.set_title(title, fontsize=12, fontweight='bold')
+
+
+def mediation_pathways(ps_paths: tuple, si_paths: tuple):
+    """Fig 8: the two mediation path diagrams; each paths tuple is (a, b, total)."""
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    _mediation_panel(axes[0], ('PS', 'SE', 'Perf'), ('#3498db', '#e74c3c', '#2ecc71'), *ps_paths,
+                     'Mediation: PS → SE → Performance')
+    _mediation_panel(axes[1], ('SI', 'TC', 'Growth'), ('#f39c12', '#9b59b6', '#1abc9c'), *si_paths,
+                     'Mediation: SI → TC → Growth')
+    fig.tight_layout()
+    return fig
+
+
+def vulnerability_resilience(categories: list, vulnerable_means: list, resilient_means: list):
+    """Fig 9: outcomes of vulnerable vs resilient teams."""
+    fig, ax = plt.subplots(figsize=(10, 6))
+    x = np.arange(len(categories))
+    width = 0.35
+
+    bars1 = ax.bar(x - width/2, vulnerable_means, width, label='Vulnerable Teams',
+                   color='#e74c3c', edgecolor='black')
+    bars2 = ax.bar(x + width/2, resilient_means, width, label='Resilient Teams',
+                   color='#2ecc71', edgecolor='black')
+
+    ax.set_ylabel('Average Score', fontsize=12)
+    ax.set_title('Team Vulnerability vs Resilience: Outcome Differences', fontsize=13, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories)
+    ax.legend(fontsize=11)
+    ax.grid(True, alpha=0.3, axis='y')
+
+    # Add value labels on bars
+    for bars in [bars1, bars2]:
+        for bar in bars:
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                    f'{height:.2f}', ha='center', va='bottom', fontsize=9)
+
+    fig.tight_layout()
+    return fig
@@ -4,26 +4,28 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Image
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+from PIL import Image as PILImage
+import hashlib
+import io
 import re
 import os
+import tempfile
 
-def parse_markdown_to_pdf():
-    """Parse the markdown file and generate a PDF report."""
-    
-    # Read the markdown file
-    with open('Team_Experience_Analysis_Report.md', 'r', encoding='utf-8') as f:
-        md_content = f.read()
-    
-    # Create PDF
-    pdf_file = "Team_Experience_Analysis_Report.pdf"
-    doc = SimpleDocTemplate(pdf_file, pagesize=letter,
-                            rightMargin=72, leftMargin=72,
-                            topMargin=72, bottomMargin=72)
-    
-    # Container for the 'Flowable' objects
-    elements = []
-    
-    # Define styles
+import report_markdown
+from report_markdown import tokenize
+
+# Laid-out sections are cached here as standalone PDFs
+CACHE_DIR = '.report_cache'
+CACHE_MAX_BYTES = 256 * 2**20
+
+# Figures are printed at most this large, and resampled to IMAGE_DPI for it
+IMAGE_MAX_SIZE = (5.5*inch, 4*inch)
+IMAGE_DPI = 150
+JPEG_QUALITY = 90
+
+
+def report_styles():
+    """Paragraph styles used by the report."""
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
         'CustomTitle',
@@ -34,7 +36,7 @@ def parse_markdown_to_pdf():
         alignment=TA_CENTER,
         fontName='Helvetica-Bold'
     )
-    
+
     subtitle_style = ParagraphStyle(
         'CustomSubtitle',
         parent=styles['Normal'],
@@ -44,7 +46,7 @@ def parse_markdown_to_pdf():
         alignment=TA_CENTER,
         fontName='Helvetica-Oblique'
     )
-    
+
     heading1_style = ParagraphStyle(
         'CustomHeading1',
         parent=styles['Heading1'],
@@ -54,7 +56,7 @@ def parse_markdown_to_pdf():
         spaceBefore=10,
         fontName='Helvetica-Bold'
     )
-    
+
     heading2_style = ParagraphStyle(
         'CustomHeading2',
         parent=styles['Heading2'],
@@ -64,7 +66,7 @@ def parse_markdown_to_pdf():
         spaceBefore=8,
         fontName='Helvetica-Bold'
     )
-    
+
     heading3_style = ParagraphStyle(
         'CustomHeading3',
         parent=styles['Heading3'],
@@ -74,7 +76,7 @@ def parse_markdown_to_pdf():
         spaceBefore=6,
         fontName='Helvetica-Bold'
     )
-    
+
     body_style = ParagraphStyle(
         'CustomBody',
         parent=styles['Normal'],
@@ -84,7 +86,7 @@ def parse_markdown_to_pdf():
         alignment=TA_JUSTIFY,
         leading=12
     )
-    
+
     bullet_style = ParagraphStyle(
         'CustomBullet',
         parent=styles['Normal'],
@@ -94,158 +96,302 @@ def parse_markdown_to_pdf():
         leftIndent=20,
         leading=12
     )
-    
-    # Process markdown content line by line
-    lines = md_content.split('\n')
-    i = 0
-    in_table = False
-    table_data = []
-    skip_until_section = False
-    
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Title (H1 at top)
-        if i < 5 and line.startswith('# '):
-            title_text = line.replace('# ', '').strip()
+
+    caption_style = ParagraphStyle(
+        'Caption',
+        parent=body_style,
+        fontSize=9,
+        textColor=colors.HexColor('#555555'),
+        alignment=TA_CENTER,
+        fontName='Helvetica-Oblique'
+    )
+
+    return {'title': title_style, 'subtitle': subtitle_style, 'heading1': heading1_style,
+            'heading2': heading2_style, 'heading3': heading3_style, 'body': body_style,
+            'bullet': bullet_style, 'caption': caption_style}
+
+
+def make_table(table_data):
+    """Report-styled table for parsed markdown rows."""
+    col_count = len(table_data[0])
+    col_width = 6.5 * inch / col_count
+    table = Table(table_data, colWidths=[col_width] * col_count)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold', 8),
+        ('FONT', (0, 1), (-1, -1), 'Helvetica', 7),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ]))
+    return table
+
+
+def split_sections(lines):
+    """
+    Split the report where a new page starts.
+
+    Main headings after the first few lines begin with a page break, so
+    every section after the first starts on a fresh page and can be laid
+    out on its own. Returns (first line number, lines) per section.
+    """
+    starts = [0] + [i for i, line in enumerate(lines)
+                    if i > 10 and line.strip().startswith('## ')]
+    ends = starts[1:] + [len(lines)]
+    return [(start, lines[start:end]) for start, end in zip(starts, ends)]
+
+
+def build_elements(lines, styles, first_line=0, load_image=Image):
+    """
+    Flowables for markdown ``lines``, which start at line ``first_line`` of the file.
+
+    ``load_image`` turns an image path into an Image flowable, e.g.
+    ``print_image`` to embed a resampled copy instead of the source file.
+    """
+    return render_tokens(tokenize('\n'.join(lines), first_line), styles, load_image)
+
+
+def render_tokens(tokens, styles, load_image=Image):
+    """Flowables for a stream of ``report_markdown.tokenize`` tokens."""
+    elements = []
+    for kind, value in tokens:
+        if kind == 'title':
             elements.append(Spacer(1, 1*inch))
-            elements.append(Paragraph(title_text, title_style))
-            
-        # Subtitle (H2 right after title)
-        elif i < 5 and line.startswith('## '):
-            subtitle_text = line.replace('## ', '').strip()
-            elements.append(Paragraph(subtitle_text, subtitle_style))
+            elements.append(Paragraph(value, styles['title']))
+
+        elif kind == 'subtitle':
+            elements.append(Paragraph(value, styles['subtitle']))
             elements.append(Spacer(1, 0.5*inch))
-            
-        # Main section headings (H2)
-        elif line.startswith('## ') and not line.startswith('###'):
-            heading_text = line.replace('## ', '').strip()
-            if i > 10:  # Don't page break early sections
-                elements.append(PageBreak())
-            elements.append(Paragraph(heading_text, heading1_style))
-            
-        # Subsection headings (H3)
-        elif line.startswith('### '):
-            heading_text = line.replace('### ', '').strip()
-            elements.append(Paragraph(heading_text, heading2_style))
-            
-        # Bold list items or bullet points
-        elif line.startswith('- ') or line.startswith('* '):
-            bullet_text = line[2:].strip()
-            bullet_text = format_text(bullet_text)
-            elements.append(Paragraph(f'• {bullet_text}', bullet_style))
-            
-        # Numbered lists
-        elif re.match(r'^\d+\.', line):
-            list_text = re.sub(r'^\d+\.\s*', '', line).strip()
-            list_text = format_text(list_text)
-            elements.append(Paragraph(list_text, body_style))
-            
-        # Tables
-        elif line.startswith('|') and not in_table:
-            in_table = True
-            table_data = []
-            # Process table header
-            cols = [cell.strip() for cell in line.split('|')[1:-1]]
-            table_data.append(cols)
-            
-        elif line.startswith('|') and in_table:
-            # Check if it's a separator line
-            if all(cell.strip().replace('-', '').replace(':', '') == '' for cell in line.split('|')[1:-1]):
-                i += 1
-                continue
-            # Add table row
-            cols = [cell.strip() for cell in line.split('|')[1:-1]]
-            table_data.append(cols)
-            
-        elif in_table and not line.startswith('|'):
-            # End of table, create it
-            in_table = False
-            if table_data:
-                col_count = len(table_data[0])
-                col_width = 6.5 * inch / col_count
-                table = Table(table_data, colWidths=[col_width] * col_count)
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold', 8),
-                    ('FONT', (0, 1), (-1, -1), 'Helvetica', 7),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ]))
-                elements.append(table)
-                elements.append(Spacer(1, 0.15*inch))
-                table_data = []
-            # Continue processing current line
-            continue
-            
-        # Horizontal rules
-        elif line.startswith('---') or line.startswith('***'):
+
+        elif kind == 'page_break':
+            elements.append(PageBreak())
+
+        elif kind in ('heading1', 'heading2'):
+            elements.append(Paragraph(value, styles[kind]))
+
+        elif kind == 'bullet':
+            elements.append(Paragraph(f'• {value}', styles['bullet']))
+
+        elif kind == 'paragraph':
+            elements.append(Paragraph(value, styles['body']))
+
+        elif kind == 'table':
+            elements.append(make_table(value))
+            elements.append(Spacer(1, 0.15*inch))
+
+        elif kind == 'rule':
             elements.append(Spacer(1, 0.1*inch))
-            
-        # Bold metadata lines
-        elif line.startswith('**') and line.endswith('**'):
-            text = line.replace('**', '').strip()
-            elements.append(Paragraph(f'<b>{text}</b>', body_style))
-            
-        # Image references
-        elif line.startswith('!['):
-            # Extract image path from markdown: ![alt text](image.png)
-            match = re.match(r'!\[([^\]]*)\]\(([^\)]+)\)', line)
-            if match:
-                alt_text = match.group(1)
-                image_path = match.group(2)
-                
-                # Check if image file exists
-                if os.path.exists(image_path):
-                    try:
-                        # Add image caption
-                        if alt_text:
-                            elements.append(Spacer(1, 0.1*inch))
-                            caption_style = ParagraphStyle(
-                                'Caption',
-                                parent=body_style,
-                                fontSize=9,
-                                textColor=colors.HexColor('#555555'),
-                                alignment=TA_CENTER,
-                                fontName='Helvetica-Oblique'
-                            )
-                            elements.append(Paragraph(f'<b>{alt_text}</b>', caption_style))
-                        
-                        # Add the image - scale to fit width while maintaining aspect ratio
-                        img = Image(image_path)
-                        img._restrictSize(5.5*inch, 4*inch)  # Max width 5.5", max height 4"
-                        elements.append(img)
-                        elements.append(Spacer(1, 0.2*inch))
-                    except Exception as e:
-                        print(f"Warning: Could not load image {image_path}: {e}")
-            
-        # Regular paragraphs
-        elif line and not line.startswith('#') and not line.startswith('|'):
-            text = format_text(line)
-            if text:
-                elements.append(Paragraph(text, body_style))
-        
-        i += 1
-    
-    # Build PDF
-    doc.build(elements)
-    print(f"✓ PDF Report generated: {pdf_file}")
-
-def format_text(text):
-    """Format markdown text to ReportLab HTML-like markup."""
-    # Bold text
-    text = re.sub(r'\*\*([^*]+)\*\*', r'<b>\1</b>', text)
-    # Italic text
-    text = re.sub(r'\*([^*]+)\*', r'<i>\1</i>', text)
-    # Inline code (treat as bold)
-    text = re.sub(r'`([^`]+)`', r'<b>\1</b>', text)
-    # Remove markdown links but keep text
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-    return text
+
+        elif kind == 'bold':
+            elements.append(Paragraph(f'<b>{value}</b>', styles['body']))
+
+        elif kind == 'image':
+            alt_text, image_path = value
+            # Check if image file exists
+            if os.path.exists(image_path):
+                try:
+                    # Add image caption
+                    if alt_text:
+                        elements.append(Spacer(1, 0.1*inch))
+                        elements.append(Paragraph(f'<b>{alt_text}</b>', styles['caption']))
+
+                    # Add the image - scale to fit width while maintaining aspect ratio
+                    img = load_image(image_path)
+                    img._restrictSize(*IMAGE_MAX_SIZE)  # Max width 5.5", max height 4"
+                    elements.append(img)
+                    elements.append(Spacer(1, 0.2*inch))
+                except Exception as e:
+                    print(f"Warning: Could not load image {image_path}: {e}")
+
+    return elements
+
+
+def _new_document(target):
+    return SimpleDocTemplate(target, pagesize=letter,
+                             rightMargin=72, leftMargin=72,
+                             topMargin=72, bottomMargin=72)
+
+
+def _file_digest(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _atomic_write(path, save):
+    """Write ``path`` through ``save(file)`` so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            save(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def print_image(image_path, cache_dir=CACHE_DIR, dpi=IMAGE_DPI, image_format='PNG'):
+    """
+    Image flowable for a figure, resampled to the size it is printed at.
+
+    The figures are saved at 300 dpi but printed at most 5.5 inches wide,
+    so embedding them as-is stores several times the pixels the page can
+    show. The figure is resampled once to ``dpi`` at its printed size and
+    cached under ``cache_dir``, keyed by the source file's contents and
+    the output settings; later builds reuse the cached copy.
+
+    Parameters
+    ----------
+    image_path : str
+        Source figure
+    cache_dir : str
+        Directory for resampled copies
+    dpi : int
+        Print resolution
+    image_format : str
+        "PNG" (lossless) or "JPEG" (smaller, embedded without re-encoding)
+
+    Returns
+    -------
+    Image
+        Flowable drawn at the figure's printed size
+    """
+    if image_format not in ('PNG', 'JPEG'):
+        raise ValueError(f"Unsupported image format: {image_format}")
+    with PILImage.open(image_path) as source:
+        source_size = source.size
+    # Printed size in points, as Image._restrictSize gives the source figure
+    width, height = source_size
+    factor = min(IMAGE_MAX_SIZE[0] / width, IMAGE_MAX_SIZE[1] / height, 1.0)
+    width, height = width * factor, height * factor
+    pixels = (min(source_size[0], round(width / 72 * dpi)),
+              min(source_size[1], round(height / 72 * dpi)))
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'{_file_digest(image_path)}:{pixels}:{image_format}:{JPEG_QUALITY}'.encode())
+    path = os.path.join(cache_dir, h.hexdigest() + ('.jpg' if image_format == 'JPEG' else '.png'))
+    if os.path.exists(path):
+        os.utime(path)
+    else:
+        os.makedirs(cache_dir, exist_ok=True)
+        with PILImage.open(image_path) as source:
+            resized = source.resize(pixels, PILImage.LANCZOS)
+        if image_format == 'JPEG':
+            # JPEG has no alpha channel; flatten onto the white page
+            page = PILImage.new('RGB', resized.size, 'white')
+            page.paste(resized, mask=resized.getchannel('A') if resized.mode == 'RGBA' else None)
+            _atomic_write(path, lambda f: page.save(f, 'JPEG', quality=JPEG_QUALITY, optimize=True))
+        else:
+            _atomic_write(path, lambda f: resized.save(f, 'PNG', optimize=True))
+    return Image(path, width=width, height=height)
+
+
+def _section_key(first_line, lines, builder_digest):
+    """Cache key of a section: its text, position, referenced images and this builder."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'{builder_digest}:{first_line}\n'.encode())
+    h.update('\n'.join(lines).encode('utf-8'))
+    for image_path in re.findall(r'^\s*!\[[^\]]*\]\(([^\)]+)\)', '\n'.join(lines), re.MULTILINE):
+        digest = _file_digest(image_path) if os.path.exists(image_path) else 'missing'
+        h.update(f'\n{image_path}:{digest}'.encode())
+    return h.hexdigest()
+
+
+def _render_section(elements):
+    """Lay out one section as a standalone PDF and return its bytes."""
+    # The section's PDF already starts on a new page
+    if elements and isinstance(elements[0], PageBreak):
+        elements = elements[1:]
+    buffer = io.BytesIO()
+    _new_document(buffer).build(elements)
+    return buffer.getvalue()
+
+
+def _trim_cache(cache_dir, max_bytes):
+    """Evict least recently used sections and figures until the cache fits in ``max_bytes``."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith('.tmp'):
+            continue
+        # Another build may replace or evict an entry at any moment
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def parse_markdown_to_pdf(md_file='Team_Experience_Analysis_Report.md',
+                          pdf_file='Team_Experience_Analysis_Report.pdf', cache_dir=CACHE_DIR,
+                          image_dpi=IMAGE_DPI, image_format='PNG'):
+    """
+    Parse the markdown file and generate a PDF report.
+
+    Each page-starting section is laid out on its own and cached as a PDF,
+    keyed by the section's text, the images it references and the source
+    of this script and its markdown tokenizer. Only sections whose key
+    changed are rebuilt; the report is then assembled from the cached
+    parts. Assembly needs ``pypdf``; without it the whole report is built
+    in one pass.
+
+    Figures are embedded resampled to ``image_dpi`` (see ``print_image``).
+    With ``cache_dir=None`` nothing is cached: the report is built in one
+    pass from the full-resolution figures.
+    """
+    # Read the markdown file
+    with open(md_file, 'r', encoding='utf-8') as f:
+        md_content = f.read()
+    lines = md_content.split('\n')
+    styles = report_styles()
+
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        PdfWriter = None
+
+    if cache_dir is None:
+        _new_document(pdf_file).build(build_elements(lines, styles))
+        print(f"✓ PDF Report generated: {pdf_file}")
+        return
+
+    os.makedirs(cache_dir, exist_ok=True)
+    load_image = lambda image_path: print_image(image_path, cache_dir, image_dpi, image_format)
+    if PdfWriter is None:
+        _new_document(pdf_file).build(build_elements(lines, styles, load_image=load_image))
+        print(f"✓ PDF Report generated: {pdf_file}")
+        return
+
+    builder_digest = ':'.join([_file_digest(os.path.abspath(__file__)),
+                               _file_digest(report_markdown.__file__), str(image_dpi), image_format])
+    sections = split_sections(lines)
+    writer = PdfWriter()
+    rebuilt = 0
+    for first_line, section in sections:
+        path = os.path.join(cache_dir, _section_key(first_line, section, builder_digest) + '.pdf')
+        if os.path.exists(path):
+            os.utime(path)
+        else:
+            pdf = _render_section(build_elements(section, styles, first_line, load_image))
+            _atomic_write(path, lambda f: f.write(pdf))
+            rebuilt += 1
+        writer.append(path)
+    writer.write(pdf_file)
+    _trim_cache(cache_dir, CACHE_MAX_BYTES)
+    print(f"✓ PDF Report generated: {pdf_file} ({rebuilt} of {len(sections)} sections rebuilt)")
 
 if __name__ == "__main__":
     parse_markdown_to_pdf()
@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+class RegressionResult:
+    """
+    Ordinary least squares fit of one or more outcomes on the same predictors.
+
+    ``coef``, ``se``, ``t`` and ``p`` are DataFrames indexed by term (the
+    intercept first, then the predictors) with one column per outcome;
+    ``r2`` is a Series indexed by outcome.
+    """
+
+    def __init__(self, coef, se, r2, n: int, df_resid: int):
+        self.coef = coef
+        self.se = se
+        self.t = coef / se
+        self.p = pd.DataFrame(2 * stats.t.sf(np.abs(self.t), df_resid),
+                              index=coef.index, columns=coef.columns)
+        self.r2 = r2
+        self.n = n
+        self.df_resid = df_resid
+
+    def table(self, outcome) -> pd.DataFrame:
+        """Coefficient table for one outcome."""
+        return pd.DataFrame({
+            'Coefficient': self.coef[outcome],
+            'Std. Error': self.se[outcome],
+            't': self.t[outcome],
+            'P-Value': self.p[outcome]
+        })
+
+
+def _as_frame(values, name: str) -> pd.DataFrame:
+    if isinstance(values, pd.Series):
+        return values.to_frame(values.name if values.name is not None else name)
+    return pd.DataFrame(values)
+
+
+def _design(X: pd.DataFrame, intercept: bool) -> tuple:
+    terms = list(X.columns)
+    A = X.to_numpy(dtype=np.float64)
+    if intercept:
+        A = np.column_stack([np.ones(len(A)), A])
+        terms = ['Intercept'] + terms
+    return A, terms
+
+
+def _result(coef, xtx_inv_diag, rss, tss, n, terms, outcomes) -> RegressionResult:
+    df_resid = n - len(terms)
+    sigma2 = rss / df_resid
+    se = np.sqrt(np.outer(xtx_inv_diag, sigma2))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r2 = 1 - rss / tss
+    return RegressionResult(pd.DataFrame(coef, index=terms, columns=outcomes),
+                            pd.DataFrame(se, index=terms, columns=outcomes),
+                            pd.Series(r2, index=outcomes), n, df_resid)
+
+
+def ols(X, Y, intercept: bool = True, groups=None):
+    """
+    Fit every outcome in ``Y`` against the predictors in ``X`` at once.
+
+    Without ``groups``, the design matrix is factored once (QR) and all
+    outcomes are solved against that one factorization. With ``groups``,
+    the per-group Gram matrices are built in one pass over the rows and
+    solved as a stack of Cholesky factorizations, one model per group and
+    outcome, without a Python loop over groups.
+
+    Rows with a missing value in ``X``, ``Y`` or ``groups`` are dropped.
+    A group with no more rows than terms, or whose predictors are
+    collinear within it, gets NaN coefficients and statistics.
+
+    Parameters
+    ----------
+    X : pd.DataFrame
+        Predictors, one column each
+    Y : pd.DataFrame or pd.Series
+        Outcomes, one column each
+    intercept : bool
+        Add an intercept term
+    groups : pd.Series or array-like, optional
+        Group key per row (e.g. cohort or survey wave)
+
+    Returns
+    -------
+    RegressionResult, or dict of group -> RegressionResult when ``groups`` is given
+    """
+    X = pd.DataFrame(X)
+    Y = _as_frame(Y, 'y')
+    keep = X.notna().all(axis=1).to_numpy() & Y.notna().all(axis=1).to_numpy()
+    if groups is not None:
+        groups = pd.Series(np.asarray(groups), index=X.index)
+        keep &= groups.notna().to_numpy()
+    A, terms = _design(X[keep], intercept)
+    B = Y[keep].to_numpy(dtype=np.float64)
+    outcomes = list(Y.columns)
+
+    if groups is None:
+        Q, R = np.linalg.qr(A)
+        coef = np.linalg.solve(R, Q.T @ B)
+        resid = B - A @ coef
+        rss = (resid * resid).sum(axis=0)
+        tss = ((B - B.mean(axis=0)) ** 2).sum(axis=0) if intercept else (B * B).sum(axis=0)
+        R_inv = np.linalg.inv(R)
+        return _result(coef, (R_inv * R_inv).sum(axis=1), rss, tss, len(A), terms, outcomes)
+
+    # Sort rows by group so each group is one contiguous run, then reduce runs
+    codes, labels = pd.factorize(groups[keep], sort=True)
+    order = np.argsort(codes, kind='stable')
+    A, B, codes = A[order], B[order], codes[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    counts = np.diff(np.r_[starts, len(codes)])
+
+    xtx = np.add.reduceat(A[:, :, None] * A[:, None, :], starts, axis=0)
+    xty = np.add.reduceat(A[:, :, None] * B[:, None, :], starts, axis=0)
+
+    # Groups with no more rows than terms, or collinear predictors, have no
+    # unique fit; they get NaN results and the rest are solved as one stack
+    n_terms = len(terms)
+    solvable = counts > n_terms
+    solvable[solvable] = np.linalg.matrix_rank(xtx[solvable]) == n_terms
+    coef = np.full((len(counts), n_terms, B.shape[1]), np.nan)
+    xtx_inv = np.full_like(xtx, np.nan)
+    if solvable.any():
+        L = np.linalg.cholesky(xtx[solvable])
+        coef[solvable] = np.linalg.solve(np.swapaxes(L, 1, 2), np.linalg.solve(L, xty[solvable]))
+        xtx_inv[solvable] = np.linalg.inv(xtx[solvable])
+
+    resid = B - np.einsum('np,npk->nk', A, coef[codes])
+    rss = np.add.reduceat(resid * resid, starts, axis=0)
+    if intercept:
+        means = np.add.reduceat(B, starts, axis=0) / counts[:, None]
+        tss = np.add.reduceat((B - means[codes]) ** 2, starts, axis=0)
+    else:
+        tss = np.add.reduceat(B * B, starts, axis=0)
+
+    diag = np.diagonal(xtx_inv, axis1=1, axis2=2)
+    return {label: _result(coef[g], diag[g], rss[g], tss[g], counts[g], terms, outcomes)
+            for g, label in enumerate(labels)}
@@ -0,0 +1,112 @@
+import re
+
+# One alternative per kind of block, tried in order on each (stripped) line.
+# A table is matched as a whole run of consecutive "|" lines.
+_BLOCK = re.compile(r'''
+    ^[^\S\n]*(?:
+        (?P<table>\|.*(?:\n[^\S\n]*\|.*)*)
+      | \#\#\#[ ](?P<h3>.*?)
+      | \#\#[ ](?P<h2>.*?)
+      | \#[ ](?P<h1>.*?)
+      | [-*][ ](?P<bullet>.*?)
+      | \d+\.[^\S\n]*(?P<numbered>.*?)
+      | (?P<rule>---|\*\*\*).*?
+      | \*\*(?P<bold>.*)\*\*
+      | (?P<image>!\[(?:(?P<alt>[^\]]*)\]\((?P<src>[^\)]+)\))?.*?)
+      | (?P<text>[^\#\s].*?)
+    )[^\S\n]*$
+''', re.MULTILINE | re.VERBOSE)
+
+# Bold, italic, inline code and links, in one alternation
+_INLINE = re.compile(r'\*\*([^*]+)\*\*|\*([^*]+)\*|`([^`]+)`|\[([^\]]+)\]\([^\)]+\)')
+
+
+def _inline(match):
+    bold, italic, code, link = match.groups()
+    if bold is not None:
+        return f'<b>{format_text(bold)}</b>'
+    if italic is not None:
+        return f'<i>{format_text(italic)}</i>'
+    if code is not None:
+        # Inline code is shown as bold
+        return f'<b>{format_text(code)}</b>'
+    # Links keep only their text
+    return format_text(link)
+
+
+def format_text(text):
+    """Format markdown text to ReportLab HTML-like markup."""
+    return _INLINE.sub(_inline, text)
+
+
+def _table_rows(block):
+    """Cells of each table row, skipping the header separator rows."""
+    rows = []
+    for line in block.split('\n'):
+        cells = [cell.strip() for cell in line.strip().split('|')[1:-1]]
+        if rows and all(cell.replace('-', '').replace(':', '') == '' for cell in cells):
+            continue
+        rows.append(cells)
+    return rows
+
+
+def tokenize(text, first_line=0):
+    """
+    Split report markdown into a stream of block tokens in one pass.
+
+    Every block is found by a single combined regular expression, and
+    inline markup is converted as the token is emitted, so each line is
+    scanned once. The first lines hold the title page: an H1 or H2 there
+    is the title or subtitle, and H2 headings after line 10 start a new
+    page.
+
+    Parameters
+    ----------
+    text : str
+        Markdown source
+    first_line : int
+        Line number of ``text`` within the whole report
+
+    Yields
+    ------
+    tuple
+        (kind, value): "title", "subtitle", "heading1", "heading2",
+        "bullet", "paragraph" and "bold" carry formatted text; "table"
+        carries a list of rows; "image" carries (alt text, path);
+        "page_break" and "rule" carry None
+    """
+    line = first_line
+    position = 0
+    for match in _BLOCK.finditer(text):
+        line += text.count('\n', position, match.start())
+        position = match.start()
+        kind = match.lastgroup
+        value = match.group(kind)
+
+        if kind == 'h1':
+            # A level-one heading only makes sense as the title
+            if line < 5:
+                yield 'title', value
+        elif kind == 'h2':
+            if line < 5:
+                yield 'subtitle', value
+            else:
+                if line > 10:
+                    yield 'page_break', None
+                yield 'heading1', value
+        elif kind == 'h3':
+            yield 'heading2', value
+        elif kind == 'bullet':
+            yield 'bullet', format_text(value)
+        elif kind in ('numbered', 'text'):
+            yield 'paragraph', format_text(value)
+        elif kind == 'table':
+            yield 'table', _table_rows(value)
+        elif kind == 'rule':
+            yield 'rule', None
+        elif kind == 'bold':
+            yield 'bold', value.replace('**', '').strip()
+        elif kind == 'image':
+            # Without a "(path)" the reference is skipped
+            if match.group('src') is not None:
+                yield 'image', (match.group('alt'), match.group('src'))
@@ -0,0 +1,170 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+
+def draw_indices(n: int, n_resamples: int, method: str = 'bootstrap', seed=None) -> np.ndarray:
+    """
+    Row indices for many resamples at once.
+
+    Parameters
+    ----------
+    n : int
+        Number of rows in the data
+    n_resamples : int
+        Number of resamples (rows of the result)
+    method : str
+        "bootstrap" draws rows with replacement; "permutation" shuffles them
+    seed : int or np.random.SeedSequence, optional
+        Seed for reproducible draws
+
+    Returns
+    -------
+    np.ndarray
+        (n_resamples, n) integer index matrix
+    """
+    rng = np.random.default_rng(seed)
+    if method == 'bootstrap':
+        return rng.integers(0, n, size=(n_resamples, n))
+    if method == 'permutation':
+        return rng.permuted(np.broadcast_to(np.arange(n), (n_resamples, n)), axis=1)
+    raise ValueError(f"Unknown resampling method: {method}")
+
+
+# ============================================================================
+# BATCHED STATISTICS: every argument is (n_resamples, n), one row per resample
+# ============================================================================
+
+def batched_r(x: np.ndarray, y: np.ndarray, weights: np.ndarray = None) -> np.ndarray:
+    """Pearson r of each row pair, optionally over the rows' 0/1 ``weights`` only."""
+    if weights is None:
+        weights = np.ones_like(x, dtype=np.float64)
+    count = weights.sum(axis=1, keepdims=True)
+    dx = x - (weights * x).sum(axis=1, keepdims=True) / count
+    dy = y - (weights * y).sum(axis=1, keepdims=True) / count
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (weights * dx * dy).sum(axis=1) / np.sqrt(
+            (weights * dx * dx).sum(axis=1) * (weights * dy * dy).sum(axis=1))
+
+
+def mediation_statistics(x: np.ndarray, m: np.ndarray, y: np.ndarray) -> dict:
+    """
+    Effects of X on Y through mediator M, for every resample.
+
+    Paths a (X-M), b (M-Y) and the total effect (X-Y) are correlations. The
+    direct effect is X's coefficient when Y is regressed on standardized X
+    and M, and the indirect effect is total minus direct, matching the
+    estimates printed by the mediation analysis.
+    """
+    dx = x - x.mean(axis=1, keepdims=True)
+    dm = m - m.mean(axis=1, keepdims=True)
+    dy = y - y.mean(axis=1, keepdims=True)
+    sxx, smm, syy = (dx * dx).sum(axis=1), (dm * dm).sum(axis=1), (dy * dy).sum(axis=1)
+    sxm, sxy, smy = (dx * dm).sum(axis=1), (dx * dy).sum(axis=1), (dm * dy).sum(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        total = sxy / np.sqrt(sxx * syy)
+        path_a = sxm / np.sqrt(sxx * smm)
+        path_b = smy / np.sqrt(smm * syy)
+        # Two-predictor OLS slope for X, rescaled to a standardized X
+        # (population SD, as StandardScaler uses)
+        slope_x = (sxy * smm - smy * sxm) / (sxx * smm - sxm * sxm)
+        direct = slope_x * np.sqrt(sxx / x.shape[1])
+    return {'total': total, 'path_a': path_a, 'path_b': path_b,
+            'direct': direct, 'indirect': total - direct}
+
+
+def r_difference_statistics(x: np.ndarray, y: np.ndarray, moderator: np.ndarray) -> dict:
+    """
+    Correlation of X and Y below vs at-or-above the moderator's median.
+
+    The median split is redone within every resample, as the interaction
+    analysis does on the full data.
+    """
+    low = (moderator < np.median(moderator, axis=1, keepdims=True)).astype(np.float64)
+    low_r = batched_r(x, y, low)
+    high_r = batched_r(x, y, 1.0 - low)
+    return {'low_r': low_r, 'high_r': high_r, 'difference': low_r - high_r}
+
+
+# ============================================================================
+# RESAMPLING DRIVER
+# ============================================================================
+
+def _resample_chunk(statistic, data: dict, n_resamples: int, method: str, permute, seed) -> dict:
+    """Draw one index matrix and evaluate ``statistic`` on every resample in it."""
+    n = len(next(iter(data.values())))
+    idx = draw_indices(n, n_resamples, method, seed)
+    batch = {}
+    for name, values in data.items():
+        if method == 'bootstrap' or name in permute:
+            batch[name] = values[idx]
+        else:
+            batch[name] = np.broadcast_to(values, (n_resamples, n))
+    return statistic(**batch)
+
+
+def resample(statistic, data: dict, n_resamples: int = 5000, method: str = 'bootstrap',
+             permute=(), seed=None, chunk_size: int = 1000, n_jobs: int = 1) -> dict:
+    """
+    Evaluate a batched statistic on many bootstrap or permutation resamples.
+
+    Resamples are drawn ``chunk_size`` at a time as one index matrix, and
+    ``statistic`` computes all of them with array operations, so there is
+    no Python loop over resamples. Chunks bound memory use and can be
+    spread over a process pool; each chunk gets its own seed from
+    ``seed``, so results do not depend on ``n_jobs``.
+
+    Parameters
+    ----------
+    statistic : callable
+        Takes the arrays in ``data`` by name, each shaped (resamples, n),
+        and returns a dict of (resamples,) arrays
+    data : dict
+        Name -> 1-D array; all of the same length
+    n_resamples : int
+        Total number of resamples
+    method : str
+        "bootstrap" resamples whole rows; "permutation" shuffles only the
+        arrays named in ``permute``, breaking their link to the others
+    permute : list
+        Arrays to shuffle when ``method`` is "permutation"
+    seed : int, optional
+        Seed for reproducible results
+    chunk_size : int
+        Resamples per index matrix
+    n_jobs : int
+        Worker processes (1 computes in this process; -1 uses every CPU)
+
+    Returns
+    -------
+    dict
+        Statistic name -> (n_resamples,) array
+    """
+    if method == 'permutation' and not permute:
+        raise ValueError("A permutation test needs the names of the arrays to permute")
+    data = {name: np.asarray(values, dtype=np.float64) for name, values in data.items()}
+    sizes = [chunk_size] * (n_resamples // chunk_size)
+    if n_resamples % chunk_size:
+        sizes.append(n_resamples % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(statistic, data, size, method, set(permute), s) for size, s in zip(sizes, seeds)]
+
+    if n_jobs == 1 or len(sizes) == 1:
+        chunks = [_resample_chunk(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=None if n_jobs == -1 else n_jobs) as pool:
+            chunks = list(pool.map(_resample_chunk, *zip(*args)))
+    return {name: np.concatenate([c[name] for c in chunks]) for name in chunks[0]}
+
+
+def confidence_interval(samples: np.ndarray, level: float = 0.95) -> tuple:
+    """Percentile interval of bootstrap samples; failed resamples (NaN) are skipped."""
+    tail = (1 - level) / 2 * 100
+    lo, hi = np.nanpercentile(samples, [tail, 100 - tail])
+    return lo, hi
+
+
+def permutation_p_value(observed: float, null: np.ndarray) -> float:
+    """Two-sided p-value of ``observed`` against its permutation distribution."""
+    null = null[~np.isnan(null)]
+    return (1 + np.sum(np.abs(null) >= abs(observed))) / (1 + len(null))
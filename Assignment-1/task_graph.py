@@ -0,0 +1,266 @@
+import contextlib
+import hashlib
+import inspect
+import io
+import os
+import sys
+import sysconfig
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+
+def _file_digest(path: str) -> str:
+    """BLAKE2 digest of a file's contents."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+# The standard library and installed packages; modules anywhere else are the project's own
+_LIBRARY_DIRS = tuple({os.path.realpath(path) for name, path in sysconfig.get_paths().items()
+                       if name in ('stdlib', 'platstdlib', 'purelib', 'platlib')})
+
+
+def _local_module(obj):
+    """The project module ``obj`` is, or was defined in; None for library code."""
+    module = obj if inspect.ismodule(obj) else sys.modules.get(getattr(obj, '__module__', None) or '')
+    path = getattr(module, '__file__', None)
+    if path is None or os.path.realpath(path).startswith(_LIBRARY_DIRS):
+        return None
+    return module
+
+
+def _global_names(code) -> set:
+    """Names a code object (and any function nested in it) may look up as globals."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _global_names(const)
+    return names
+
+
+def _module_digests(func, extra=()) -> dict:
+    """
+    File digests of the project modules ``func`` uses.
+
+    Modules are found through the globals ``func`` refers to (a module
+    such as ``figures``, or a function or class imported from one) and
+    ``extra``, then through those modules' own globals, so a helper two
+    imports away is covered too. ``func``'s own module is skipped: its
+    source is keyed separately.
+    """
+    found = {}
+    stack = [func.__globals__[name] for name in _global_names(func.__code__) if name in func.__globals__]
+    stack += list(extra)
+    while stack:
+        module = _local_module(stack.pop())
+        if module is None or module.__name__ in found or module.__name__ == func.__module__:
+            continue
+        found[module.__name__] = _file_digest(module.__file__)
+        stack.extend(vars(module).values())
+    return dict(sorted(found.items()))
+
+
+# Stands in for a cache entry that is not there, since a task's result may be None
+_MISSING = object()
+
+
+def _execute(func, args: tuple) -> tuple:
+    """Run one task, capturing what it prints so the report can be replayed in order."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        result = func(*args)
+    return result, buffer.getvalue()
+
+
+class Task:
+    """
+    One named step of an analysis.
+
+    Parameters
+    ----------
+    name : str
+        Name other tasks use to depend on this one
+    func : callable
+        Called with the results of ``inputs``, in order
+    inputs : list
+        Names of the tasks whose results ``func`` needs
+    outputs : list
+        Files ``func`` writes; the task is stale if any is missing
+    sources : list
+        Files ``func`` reads; their contents are part of the cache key
+    uses : list
+        Modules (or objects from them) ``func`` reaches only indirectly,
+        e.g. through a callback; modules it refers to by name are found
+        automatically
+    render : bool
+        Run on the render queue instead of with the statistical tasks
+    """
+
+    def __init__(self, name: str, func, inputs=(), outputs=(), sources=(), uses=(), render=False):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.sources = list(sources)
+        self.uses = list(uses)
+        self.render = render
+
+
+class TaskGraph:
+    """
+    Dependency-aware runner for analysis tasks with cached results.
+
+    Each task's cache key hashes its own source code, the files of the
+    project modules it uses, its declared source files and the keys of
+    the tasks it depends on, so editing one task, a module it calls into
+    (or the data) invalidates exactly that task and everything downstream
+    of it.
+    Fresh tasks are not run: their printed output, stored apart from the
+    result, is replayed, and the result is loaded from the cache only if a
+    stale task needs it (a result evicted meanwhile is rebuilt). Stale
+    tasks whose inputs are ready run in parallel in a process pool, and
+    tasks marked ``render`` go to a separate render queue so figures are
+    drawn while the remaining statistics are computed.
+
+    Printed output is always shown in the order the tasks were declared,
+    whichever order they finish in.
+
+    Parameters
+    ----------
+    cache : ml.ProfileCache
+        Where task results and printed output are stored
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.tasks = {}
+
+    def task(self, name: str, inputs=(), outputs=(), sources=(), uses=(), render=False):
+        """Decorator registering a function as a task."""
+        def register(func):
+            missing = [dep for dep in inputs if dep not in self.tasks]
+            if missing:
+                raise KeyError(f"Task {name!r} depends on undeclared tasks: {missing}")
+            self.tasks[name] = Task(name, func, inputs, outputs, sources, uses, render)
+            return func
+        return register
+
+    def _keys(self) -> dict:
+        keys = {}
+        for name, task in self.tasks.items():
+            parts = [name, task.outputs]
+            parts += [inspect.getsource(task.func), _module_digests(task.func, task.uses)]
+            parts += [(path, _file_digest(path)) for path in task.sources]
+            parts += [keys[dep] for dep in task.inputs]
+            keys[name] = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+        return keys
+
+    def _selected(self, targets) -> list:
+        """The targets and everything they depend on, in declaration order."""
+        if not targets:
+            return list(self.tasks)
+        unknown = [t for t in targets if t not in self.tasks]
+        if unknown:
+            raise KeyError(f"Unknown tasks: {unknown}")
+        needed = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self.tasks[name].inputs)
+        return [name for name in self.tasks if name in needed]
+
+    def run(self, targets=None, n_jobs: int = None, force=(), render_queue=None) -> None:
+        """
+        Bring ``targets`` (default: every task) up to date.
+
+        Parameters
+        ----------
+        targets : list, optional
+            Task names to build; their dependencies are built as needed
+        n_jobs : int, optional
+            Worker processes for stale tasks (default: one per CPU; 1 runs in-process)
+        force : list
+            Task names to rerun even if their cache entry is fresh
+        render_queue : figures.RenderQueue, optional
+            Executor for ``render`` tasks (default: run them like any other task)
+        """
+        order = self._selected(targets)
+        keys = self._keys()
+        # A task is fresh if its log and result are both cached and its files exist;
+        # reading the small log entry leaves the result on disk until it is needed
+        logs = {}
+        for name in order:
+            if name in force or not all(os.path.exists(p) for p in self.tasks[name].outputs):
+                continue
+            log = self.cache.get(keys[name] + '-log')
+            if log is not None and self.cache.touch(keys[name]):
+                logs[name] = log
+        stale = {name for name in order if name not in logs}
+        # Anything downstream of a rerun has to see its new result
+        for name in order:
+            if any(dep in stale for dep in self.tasks[name].inputs):
+                stale.add(name)
+                logs.pop(name, None)
+
+        results = {}
+        printed = 0
+
+        def flush():
+            nonlocal printed
+            while printed < len(order) and order[printed] in logs:
+                print(logs[order[printed]], end='')
+                printed += 1
+
+        def result_of(name):
+            if name not in results:
+                result = self.cache.get(keys[name], _MISSING)
+                if result is _MISSING:
+                    # Evicted since the freshness check: rebuild it; its log was already replayed
+                    task = self.tasks[name]
+                    result, _ = _execute(task.func, tuple(result_of(d) for d in task.inputs))
+                    self.cache.put(keys[name], result)
+                results[name] = result
+            return results[name]
+
+        def finish(name, result, log):
+            results[name] = result
+            logs[name] = log
+            self.cache.put(keys[name], result)
+            self.cache.put(keys[name] + '-log', log)
+            flush()
+
+        flush()
+
+        pending = [name for name in order if name in stale]
+        n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+        pool = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs != 1 and pending else None
+        running = {}
+        try:
+            while pending or running:
+                ran_inline = False
+                for name in [n for n in pending
+                             if not any(d in pending or d in running.values()
+                                        for d in self.tasks[n].inputs)]:
+                    task = self.tasks[name]
+                    args = tuple(result_of(d) for d in task.inputs)
+                    pending.remove(name)
+                    executor = render_queue if task.render and render_queue is not None else pool
+                    if executor is None:
+                        finish(name, *_execute(task.func, args))
+                        ran_inline = True
+                    else:
+                        running[executor.submit(_execute, task.func, args)] = name
+                if running:
+                    # Don't block on workers while in-process tasks may have unlocked more work
+                    done, _ = wait(running, timeout=0 if ran_inline else None,
+                                   return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finish(running.pop(future), *future.result())
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        self.cache.trim()
@@ -0,0 +1,691 @@
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE = "https://pokeapi.co/api/v2"
+
+# Dataset columns (in order) and their types, as built by pokemon_row
+COLUMNS = {
+    'id': 'int', 'name': 'str', 'base_experience': 'int', 'height_dm': 'int', 'weight_hg': 'int',
+    'bmi_like': 'float', 'primary_type': 'str', 'secondary_type': 'str',
+    'ability_1': 'str', 'ability_2': 'str',
+    'hp': 'int', 'attack': 'int', 'defense': 'int', 'special_attack': 'int', 'special_defense': 'int',
+    'speed': 'int', 'capture_rate': 'int', 'is_legendary': 'bool', 'habitat': 'str'
+}
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_CODES = {429, 500, 502, 503, 504}
+
+# Cache hits whose access times are held in memory before they are written
+ACCESS_BATCH = 1000
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter that adapts to the server.
+
+    Each request takes one token; tokens refill at ``rate`` per second up
+    to ``burst``. Like TCP congestion control, the rate grows quickly
+    (by one request per second for every success) until the first 429,
+    then only slowly (about one request per second, per second) above
+    half the rate that drew it. A 429 halves the rate (down to
+    ``min_rate``) and, with a Retry-After, pauses every caller until it
+    has passed. The rate never exceeds ``max_rate``.
+
+    Args:
+        rate: Starting requests per second
+        burst: Most requests sent back to back
+        min_rate: Floor for the rate after repeated 429s
+        max_rate: Ceiling for the rate
+    """
+
+    def __init__(self, rate: float = 20.0, burst: int = 10, min_rate: float = 1.0, max_rate: float = 100.0):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self._threshold = max_rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._slowed_at = float('-inf')
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def slow_down(self, retry_after: Optional[float] = None):
+        """Back off after a 429 response."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Requests already in flight see the same overload; count it once
+            if now - self._slowed_at > 1.0:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self._threshold = self.rate
+                self._slowed_at = now
+            self._tokens = 0.0
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+    def speed_up(self):
+        """Probe for more throughput after a successful response."""
+        with self._lock:
+            step = 1.0 if self.rate < self._threshold else 1 / self.rate
+            self.rate = min(self.max_rate, self.rate + step)
+
+
+def _retry_after(resp) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delay or HTTP date), if any."""
+    value = resp.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class ResponseCache:
+    """
+    Persistent cache of JSON responses in a SQLite file.
+
+    Bodies are stored zlib-compressed and keyed by the full request URL
+    (query parameters sorted). An entry younger than ``ttl`` is served
+    without touching the network; an older one is revalidated with its
+    ETag / Last-Modified, and a 304 answer renews it without a download.
+    When the stored bodies exceed ``max_bytes`` the least recently used
+    entries are evicted. Hits only note their access time in memory; the
+    times are written in one batch with the next store, every
+    ``ACCESS_BATCH`` hits or on close, so reads of a warm cache rarely
+    wait on a commit.
+
+    Args:
+        path: SQLite file to keep the cache in
+        ttl: Seconds a response is used without revalidation
+        max_bytes: Upper bound on the compressed bodies kept
+    """
+
+    def __init__(self, path: str = ".pokeapi_cache.sqlite", ttl: float = 7 * 24 * 3600,
+                 max_bytes: int = 256 * 2**20):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._accessed = {}
+        # One connection shared by the crawl's threads, serialized by the lock
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY, body BLOB, etag TEXT, last_modified TEXT,
+            fetched_at REAL, accessed_at REAL, size INTEGER)""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (accessed_at)")
+        self._db.commit()
+        self._total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict] = None) -> str:
+        """Cache key of a request: its URL with sorted query parameters."""
+        if params:
+            url = requests.Request("GET", url, params=sorted(params.items())).prepare().url
+        return url
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a response.
+
+        Returns:
+            None on a miss, else a dict with the decoded ``data``, its
+            ``etag`` and ``last_modified`` validators, and ``fresh``
+            (True while the entry is younger than the TTL)
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?",
+                                   (key,)).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = now
+            if len(self._accessed) >= ACCESS_BATCH:
+                self._flush_accessed()
+                self._db.commit()
+        body, etag, last_modified, fetched_at = row
+        return {"data": json.loads(zlib.decompress(body)), "etag": etag, "last_modified": last_modified,
+                "fresh": now - fetched_at < self.ttl}
+
+    def put(self, key: str, content: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Store a response body (raw JSON bytes) and its validators."""
+        body = zlib.compress(content)
+        now = time.time()
+        with self._lock:
+            self._accessed.pop(key, None)
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             (key, body, etag, last_modified, now, now, len(body)))
+            self._total += len(body) - (old[0] if old else 0)
+            self._flush_accessed()
+            self._evict()
+            self._db.commit()
+
+    def renew(self, key: str):
+        """Restart an entry's TTL after the server confirmed it is unchanged (304)."""
+        now = time.time()
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._db.execute("UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            self._db.commit()
+
+    def _flush_accessed(self):
+        """Write the access times noted by get, so eviction sees them."""
+        if self._accessed:
+            self._db.executemany("UPDATE responses SET accessed_at = ? WHERE key = ?",
+                                 [(at, key) for key, at in self._accessed.items()])
+            self._accessed.clear()
+
+    def _evict(self):
+        """Drop least recently used entries until the bodies fit in max_bytes."""
+        while self._total > self.max_bytes:
+            rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at LIMIT 100").fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if self._total <= self.max_bytes:
+                    break
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total -= size
+
+    def close(self):
+        with self._lock:
+            self._flush_accessed()
+            self._db.commit()
+            self._db.close()
+
+
+class FetchClient:
+    """
+    JSON client on pooled keep-alive connections, paced by a TokenBucket.
+
+    One client is shared by every thread of a crawl, so connections are
+    reused instead of opened per request. 429 responses slow the limiter
+    down (honoring Retry-After) and are retried; 5xx responses and
+    connection errors are retried after a jittered exponential backoff.
+    With a ResponseCache, fresh responses are served from disk and stale
+    ones are revalidated with conditional requests.
+
+    Args:
+        limiter: Rate limiter (default: a TokenBucket with its defaults)
+        pool_size: Keep-alive connections kept per host
+        max_backoff: Longest backoff between retries in seconds
+        timeout: Request timeout in seconds
+        cache: Optional ResponseCache in front of the network
+    """
+
+    def __init__(self, limiter: Optional[TokenBucket] = None, pool_size: int = 32,
+                 max_backoff: float = 30.0, timeout: float = 30, cache: Optional[ResponseCache] = None):
+        self.limiter = limiter if limiter is not None else TokenBucket()
+        self.cache = cache
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _backoff(self, backoff: float, attempt: int) -> float:
+        # "Full jitter": anywhere up to the exponential delay, so retries spread out
+        return random.uniform(0, min(self.max_backoff, backoff * 2 ** attempt))
+
+    def get_json(self, url: str, params: Optional[Dict] = None, retries: int = 3, backoff: float = 0.8) -> Any:
+        """
+        Make a rate-limited GET request with retries.
+
+        Args:
+            url: The URL to request
+            params: Optional query parameters
+            retries: Number of retries (default 3)
+            backoff: Base of the exponential backoff in seconds (default 0.8)
+
+        Returns:
+            The JSON response if successful
+
+        Raises:
+            RuntimeError: If all retries are exhausted or for non-retryable status codes
+        """
+        headers = {}
+        if self.cache is not None:
+            key = ResponseCache.key(url, params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                if cached["fresh"]:
+                    return cached["data"]
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+        for attempt in range(retries + 1):
+            self.limiter.acquire()
+            try:
+                resp = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                if attempt < retries:
+                    time.sleep(self._backoff(backoff, attempt))
+                    continue
+                raise RuntimeError(f"Failed after {retries} retries: {e}")
+
+            if resp.status_code == 200:
+                self.limiter.speed_up()
+                data = resp.json()
+                if self.cache is not None:
+                    self.cache.put(key, resp.content, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+                return data
+            elif resp.status_code == 304 and headers:
+                self.limiter.speed_up()
+                self.cache.renew(key)
+                return cached["data"]
+            elif resp.status_code == 429 and attempt < retries:
+                # The limiter holds back every caller, not just this one
+                self.limiter.slow_down(_retry_after(resp))
+                continue
+            elif resp.status_code in RETRY_CODES and attempt < retries:
+                time.sleep(self._backoff(backoff, attempt))
+                continue
+            else:
+                raise RuntimeError(f"Status code {resp.status_code} - cannot retry")
+
+        raise RuntimeError(f"Failed after {retries} retries")
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def default_client() -> FetchClient:
+    """The FetchClient shared by get_json and the concurrent fetchers, with an on-disk cache."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = FetchClient(cache=ResponseCache())
+        return _client
+
+
+def get_json(url: str, params: Optional[Dict] = None, retries: int = 3, backoff: float = 0.8) -> Any:
+    """
+    Make a GET request with exponential backoff retry logic.
+
+    Requests go through the shared FetchClient, so they reuse pooled
+    connections, respect its rate limiter and are answered from its
+    on-disk cache when possible.
+
+    Args:
+        url: The URL to request
+        params: Optional query parameters
+        retries: Number of retries (default 3)
+        backoff: Base of the exponential backoff in seconds (default 0.8)
+
+    Returns:
+        The JSON response if successful
+
+    Raises:
+        RuntimeError: If all retries are exhausted or for non-retryable status codes
+    """
+    return default_client().get_json(url, params, retries, backoff)
+
+
+def paginate(url: str, limit: int = 50, max_items: Optional[int] = None, concurrency: int = 8,
+             client: Optional[FetchClient] = None) -> Iterator[Dict]:
+    """
+    Yield the items of a paginated list endpoint in offset order.
+
+    The first page reports ``count``, so every remaining offset is known
+    up front: those pages are requested concurrently (paced by the
+    client's rate limiter) and items are yielded as soon as all earlier
+    pages have arrived. Without a ``count`` the pages are followed one
+    by one.
+
+    Args:
+        url: List endpoint, e.g. BASE + "/pokemon"
+        limit: Items per page
+        max_items: Stop after this many items (default: all of them)
+        concurrency: Pages requested at the same time
+        client: FetchClient to send requests with (default: the shared one)
+
+    Yields:
+        The list items (each a dict with 'name' and 'url' for PokéAPI)
+    """
+    client = client if client is not None else default_client()
+    first = client.get_json(url, params={"limit": limit, "offset": 0})
+    total = first.get("count")
+    if max_items is not None:
+        total = max_items if total is None else min(total, max_items)
+
+    yielded = 0
+    for item in first.get("results", [])[:total]:
+        yield item
+        yielded += 1
+
+    if "count" not in first:
+        # No count to plan from: walk the pages in order
+        offset, page = limit, first
+        while page.get("results") and (total is None or yielded < total):
+            page = client.get_json(url, params={"limit": limit, "offset": offset})
+            for item in page.get("results", [])[:None if total is None else total - yielded]:
+                yield item
+                yielded += 1
+            offset += limit
+        return
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        pages = [pool.submit(client.get_json, url, {"limit": limit, "offset": offset})
+                 for offset in range(limit, total, limit)]
+        try:
+            for page in pages:
+                for item in page.result().get("results", [])[:total - yielded]:
+                    yield item
+                    yielded += 1
+        finally:
+            # The caller may stop early; skip the pages not started yet
+            for page in pages:
+                page.cancel()
+
+
+def pokemon_row(name: str, poke_json: Dict, species_json: Dict) -> Dict:
+    """
+    Extract one dataset row from a Pokémon's details and species JSON.
+
+    Args:
+        name: The Pokémon's name from the list endpoint
+        poke_json: Response of /pokemon/{name}
+        species_json: Response of /pokemon-species/{name}
+
+    Returns:
+        A dict with the df_pokemon columns
+    """
+    height_dm = poke_json['height']
+    weight_hg = poke_json['weight']
+
+    # Types - get primary (slot 1) and secondary (slot 2)
+    types = {entry['slot']: entry['type']['name'] for entry in poke_json['types']}
+
+    # Abilities - first two in the list
+    abilities = [entry['ability']['name'] for entry in poke_json['abilities'][:2]]
+    abilities += [None] * (2 - len(abilities))
+
+    # Stats - map by name
+    stats = {entry['stat']['name']: entry['base_stat'] for entry in poke_json['stats']}
+
+    return {
+        'id': poke_json['id'],
+        'name': name,
+        'base_experience': poke_json.get('base_experience') or 0,  # Fill missing with 0
+        'height_dm': height_dm,
+        'weight_hg': weight_hg,
+        'bmi_like': weight_hg / (height_dm ** 2) if height_dm > 0 else 0,
+        'primary_type': types.get(1),
+        'secondary_type': types.get(2),
+        'ability_1': abilities[0],
+        'ability_2': abilities[1],
+        'hp': stats.get('hp', 0),
+        'attack': stats.get('attack', 0),
+        'defense': stats.get('defense', 0),
+        'special_attack': stats.get('special-attack', 0),
+        'special_defense': stats.get('special-defense', 0),
+        'speed': stats.get('speed', 0),
+        'capture_rate': species_json['capture_rate'],
+        'is_legendary': species_json['is_legendary'],
+        'habitat': species_json['habitat']['name'] if species_json['habitat'] else None
+    }
+
+
+async def fetch_pokemon(name: str, semaphore: asyncio.Semaphore, executor: ThreadPoolExecutor,
+                        base: str = BASE, client: Optional[FetchClient] = None) -> Dict:
+    """
+    Fetch one Pokémon's details and species concurrently and build its row.
+
+    The blocking get_json calls run on ``executor``; ``semaphore`` bounds how
+    many Pokémon are in flight at once.
+    """
+    client = client if client is not None else default_client()
+    loop = asyncio.get_running_loop()
+    async with semaphore:
+        poke_json, species_json = await asyncio.gather(
+            loop.run_in_executor(executor, client.get_json, f"{base}/pokemon/{name}"),
+            loop.run_in_executor(executor, client.get_json, f"{base}/pokemon-species/{name}")
+        )
+    return pokemon_row(name, poke_json, species_json)
+
+
+async def fetch_rows(names: list, concurrency: int = 8, base: str = BASE,
+                     client: Optional[FetchClient] = None) -> list:
+    """
+    Build dataset rows for many Pokémon with at most ``concurrency`` in flight.
+
+    Rows are built as each Pokémon's responses arrive. If a single Pokémon
+    fails, its name and the error are printed and the rest continue.
+
+    Args:
+        names: Pokémon names, e.g. from the list endpoint
+        concurrency: Pokémon fetched at the same time (two requests each)
+        base: API base URL, e.g. a local stub server for testing
+        client: FetchClient to send requests with (default: the shared one)
+
+    Returns:
+        The rows that succeeded, in the order of ``names``
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def attempt(i, name):
+        try:
+            return i, await fetch_pokemon(name, semaphore, executor, base, client)
+        except Exception as e:
+            print(f"Error processing {name}: {e}")
+            return i, None
+
+    rows = [None] * len(names)
+    with ThreadPoolExecutor(max_workers=2 * concurrency) as executor:
+        for done in asyncio.as_completed([attempt(i, name) for i, name in enumerate(names)]):
+            i, row = await done
+            rows[i] = row
+    return [row for row in rows if row is not None]
+
+
+def run(coro):
+    """
+    Run a coroutine to completion and return its result.
+
+    Inside an already running event loop (e.g. a Jupyter notebook) the
+    coroutine runs on a fresh loop in a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def build_rows(names: list, concurrency: int = 8, base: str = BASE,
+               client: Optional[FetchClient] = None) -> list:
+    """Blocking wrapper of fetch_rows; safe to call from a notebook cell."""
+    return run(fetch_rows(names, concurrency, base, client))
+
+
+# ============================================================================
+# RESUMABLE CRAWL
+# ============================================================================
+
+def _sync(f):
+    f.flush()
+    os.fsync(f.fileno())
+
+
+class _CsvSink:
+    """Appends row batches to one CSV file; a checkpoint is the file's size."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def resume(self, checkpoints: list):
+        # Rows written after the last checkpoint were never journaled: drop them
+        size = checkpoints[-1]["size"] if checkpoints else 0
+        with open(self.path, "a+b") as f:
+            f.truncate(size)
+
+    def write(self, rows: list) -> Dict:
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            pd.DataFrame(rows, columns=list(COLUMNS)).to_csv(f, header=f.tell() == 0, index=False)
+            _sync(f)
+            return {"size": f.tell()}
+
+
+class _ParquetSink:
+    """Writes each row batch as one Parquet part file in a dataset directory."""
+
+    def __init__(self, path: str):
+        # pyarrow is only needed for Parquet output
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.pa, self.pq = pa, pq
+        types = {'int': pa.int64(), 'float': pa.float64(), 'str': pa.string(), 'bool': pa.bool_()}
+        self.schema = pa.schema([(column, types[kind]) for column, kind in COLUMNS.items()])
+        self.path = path
+        self.parts = 0
+
+    def resume(self, checkpoints: list):
+        os.makedirs(self.path, exist_ok=True)
+        done = {checkpoint["part"] for checkpoint in checkpoints}
+        # Only part files this sink wrote (or left half-written) are removed
+        for name in os.listdir(self.path):
+            if name.lstrip(".").startswith("part-") and name not in done:
+                os.remove(os.path.join(self.path, name))
+        self.parts = len(done)
+
+    def write(self, rows: list) -> Dict:
+        name = f"part-{self.parts:05d}.parquet"
+        # Dot-files are skipped by Parquet readers, so a half-written part is never read
+        tmp = os.path.join(self.path, "." + name)
+        self.pq.write_table(self.pa.Table.from_pylist(rows, schema=self.schema), tmp)
+        os.replace(tmp, os.path.join(self.path, name))
+        self.parts += 1
+        return {"part": name}
+
+
+def _read_journal(path: str) -> list:
+    """Checkpoints recorded so far; a line cut off by a crash is ignored."""
+    checkpoints = []
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    checkpoints.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+    return checkpoints
+
+
+def _has_output(path: str) -> bool:
+    """True if ``path`` is a non-empty file or a non-empty directory."""
+    if os.path.isdir(path):
+        return len(os.listdir(path)) > 0
+    return os.path.isfile(path) and os.path.getsize(path) > 0
+
+
+def crawl(names: list, output: str, batch_size: int = 50, concurrency: int = 8, base: str = BASE,
+          client: Optional[FetchClient] = None, restart: bool = False) -> int:
+    """
+    Build dataset rows for many Pokémon, streaming them to disk with checkpoints.
+
+    Names are fetched ``batch_size`` at a time (``concurrency`` in flight,
+    as in fetch_rows) and each batch's rows are appended to ``output``
+    before the batch is recorded in a journal (``output`` + ".journal").
+    Only one batch is held in memory. After a crash, calling crawl again
+    with the same arguments drops anything written after the last journal
+    entry and skips the names already recorded, so finished work is not
+    repeated. Pokémon that failed are printed, not journaled, and retried
+    on the next run.
+
+    The output can be read while the crawl runs: a CSV file only ever
+    holds complete rows, and a Parquet dataset only complete part files.
+    An existing output without a journal was not written by crawl, so it
+    is left alone unless ``restart`` is set.
+
+    Args:
+        names: Pokémon names, e.g. from the list endpoint
+        output: CSV file, or a directory of Parquet parts if it ends in ".parquet"
+        batch_size: Rows per write (a CSV chunk or one Parquet part)
+        concurrency: Pokémon fetched at the same time
+        base: API base URL, e.g. a local stub server for testing
+        client: FetchClient to send requests with (default: the shared one)
+        restart: Discard earlier progress (or an existing output) and start over
+
+    Returns:
+        The number of rows written by this call
+
+    Raises:
+        FileExistsError: If ``output`` already holds data but has no journal
+    """
+    journal = output + ".journal"
+    if not restart and not os.path.exists(journal) and _has_output(output):
+        raise FileExistsError(f"{output} exists but has no journal to resume from; "
+                              f"pass restart=True to overwrite it")
+    sink = _ParquetSink(output) if output.endswith(".parquet") else _CsvSink(output)
+    if restart and os.path.exists(journal):
+        os.remove(journal)
+    checkpoints = _read_journal(journal)
+    sink.resume(checkpoints)
+
+    done = {name for checkpoint in checkpoints for name in checkpoint["names"]}
+    todo = [name for name in names if name not in done]
+    if done:
+        print(f"Resuming: {len(names) - len(todo)} of {len(names)} already done")
+
+    # Rewrite the journal without a line cut off by a crash, then append to it
+    with open(journal + ".tmp", "w", encoding="utf-8") as log:
+        log.writelines(json.dumps(checkpoint) + "\n" for checkpoint in checkpoints)
+        _sync(log)
+    os.replace(journal + ".tmp", journal)
+
+    written = 0
+    with open(journal, "a", encoding="utf-8") as log:
+        for start in range(0, len(todo), batch_size):
+            rows = build_rows(todo[start:start + batch_size], concurrency, base, client)
+            if not rows:
+                continue
+            checkpoint = sink.write(rows)
+            checkpoint["names"] = [row["name"] for row in rows]
+            log.write(json.dumps(checkpoint) + "\n")
+            _sync(log)
+            written += len(rows)
+    return written
@@ -1,121 +1,1721 @@
 # type: ignore
 
+import hashlib
+import os
+import pickle
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-def univariate(df: pd.DataFrame) -> pd.DataFrame:
+SUMMARY_COLUMNS = ["Data Type", "Count", "Missing", "Unique", "Mode", "Min", "Q1", "Median",
+                   "Q3", "Max", "Mean", "Std", "Skew", "Kurt"]
+
+PLOT_MODES = ("show", "none", "lazy", "batch")
+
+# Upper bound on the working set of one block of numeric columns in bytes.
+# The sorted copy, the run-length scratch array and the centered deviations
+# are all sized n_rows x block_width, so the budget is split across them.
+_BLOCK_BYTES = 256 * 2**20
+
+
+def _is_numeric_dtype(dtype) -> bool:
+    """Real-valued numeric dtypes of any width, including nullable ones; not bool."""
+    return (pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+            and not pd.api.types.is_complex_dtype(dtype))
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    """Return True if a column gets the numeric statistics and plots."""
+    return _is_numeric_dtype(series.dtype)
+
+
+def _zero_out_fperr(values: np.ndarray) -> np.ndarray:
+    """Clamp floating point noise to zero, as pandas does for moment sums."""
+    return np.where(np.abs(values) < 1e-14, 0.0, values)
+
+
+def _finalize_moments(count: np.ndarray, m2: np.ndarray, m3: np.ndarray, m4: np.ndarray) -> tuple:
     """
-    Generate univariate statistical analysis and visualizations for a DataFrame.
-    
+    Turn sums of centered powers into std, skew and kurtosis.
+
+    ``m2``, ``m3`` and ``m4`` are the sums of the 2nd, 3rd and 4th powers of
+    the deviations from the mean. The bias corrections are the ones used by
+    ``Series.std``, ``Series.skew`` and ``Series.kurt``.
+    """
+    n = np.asarray(count, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(m2 / (n - 1))
+        skew = np.where(m2 == 0, 0.0, n * (n - 1) ** 0.5 / (n - 2) * m3 / m2 ** 1.5)
+        kurt_denom = (n - 2) * (n - 3) * m2 ** 2
+        kurt = np.where(kurt_denom == 0, 0.0,
+                        n * (n + 1) * (n - 1) * m4 / kurt_denom
+                        - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+    return np.where(n > 1, std, np.nan), np.where(n > 2, skew, np.nan), np.where(n > 3, kurt, np.nan)
+
+
+def _numeric_block_stats(block: np.ndarray) -> dict:
+    """
+    Compute the numeric summary statistics for a 2-D block of columns.
+
+    The block is sorted once along the rows; NaNs sort to the end, so every
+    order statistic (min, quantiles, max), the distinct count and the mode
+    are read off the sorted copy without another scan. The moments are then
+    taken from a single set of centered deviations.
+
+    Parameters
+    ----------
+    block : np.ndarray
+        float64 array of shape (n_rows, n_cols), NaN marking missing values
+
+    Returns
+    -------
+    dict
+        Statistic name -> np.ndarray of length n_cols
+    """
+    n_rows, n_cols = block.shape
+    if n_rows == 0:
+        # Nothing to sort: no values, and every statistic of the values is undefined
+        stats = {name: np.full(n_cols, np.nan) for name in SUMMARY_COLUMNS[4:]}
+        stats["Count"] = stats["Unique"] = np.zeros(n_cols, dtype=np.int64)
+        return stats
+    cols = np.arange(n_cols)
+    srt = np.sort(block, axis=0)
+    count = (~np.isnan(block)).sum(axis=0)
+    has_data = count > 0
+    last = np.maximum(count - 1, 0)
+
+    stats = {"Count": count}
+
+    # Order statistics, with the same linear interpolation as Series.quantile
+    for name, q in (("Min", 0.0), ("Q1", 0.25), ("Median", 0.5), ("Q3", 0.75), ("Max", 1.0)):
+        pos = last * q
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.ceil(pos).astype(np.int64)
+        lo_vals = srt[lo, cols]
+        hi_vals = srt[hi, cols]
+        stats[name] = np.where(has_data, lo_vals + (hi_vals - lo_vals) * (pos - lo), np.nan)
+
+    # Distinct values and mode from the run lengths of the sorted column.
+    # The running length peaks first at the end of the earliest longest run,
+    # so ties resolve to the smallest value, like Series.mode()[0].
+    rows = np.arange(n_rows)[:, None]
+    valid = rows < count
+    new_run = np.ones_like(srt, dtype=bool)
+    new_run[1:] = srt[1:] != srt[:-1]
+    new_run &= valid
+    stats["Unique"] = new_run.sum(axis=0)
+    run_start = np.maximum.accumulate(np.where(new_run, rows, 0), axis=0)
+    run_length = np.where(valid, rows - run_start + 1, 0)
+    stats["Mode"] = np.where(has_data, srt[run_length.argmax(axis=0), cols], np.nan)
+    del new_run, run_start, run_length, srt
+
+    # Sums of centered powers for the moments
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(has_data, np.nansum(block, axis=0) / count, np.nan)
+        dev = np.where(np.isnan(block), 0.0, block - mean)
+        dev2 = dev * dev
+        m2 = _zero_out_fperr(dev2.sum(axis=0))
+        m3 = _zero_out_fperr((dev2 * dev).sum(axis=0))
+        m4 = (dev2 * dev2).sum(axis=0)
+        del dev, dev2
+
+    stats["Mean"] = mean
+    stats["Std"], stats["Skew"], stats["Kurt"] = _finalize_moments(count, m2, m3, m4)
+    return stats
+
+
+def _integer_runs(values: np.ndarray) -> tuple:
+    """
+    Distinct count and mode of a 1-D integer array, compared exactly.
+
+    float64 holds integers exactly only up to 2**53, so the float block can
+    merge larger distinct values; this sorts the native integers instead.
+    Ties resolve to the smallest value, as in ``_numeric_block_stats``.
+    """
+    srt = np.sort(values)
+    starts = np.flatnonzero(np.r_[True, srt[1:] != srt[:-1]])
+    lengths = np.diff(np.r_[starts, len(srt)])
+    return len(starts), srt[starts[lengths.argmax()]]
+
+
+def _block_width(n_rows: int) -> int:
+    """Number of numeric columns summarized together within ``_BLOCK_BYTES``."""
+    # Three n_rows x width arrays of 8 bytes are alive at the peak of a block
+    return max(1, _BLOCK_BYTES // (24 * max(n_rows, 1)))
+
+
+def _blockwise_stats(values: np.ndarray) -> dict:
+    """Run ``_numeric_block_stats`` over column blocks of a float64 matrix."""
+    n_rows, n_cols = values.shape
+    block_width = _block_width(n_rows)
+    blocks = [_numeric_block_stats(values[:, start:start + block_width])
+              for start in range(0, n_cols, block_width)]
+    return {name: np.concatenate([block[name] for block in blocks]) for name in blocks[0]}
+
+
+def _resolve_n_jobs(n_jobs: int) -> int:
+    """Number of worker processes for ``n_jobs`` (-1 means one per CPU)."""
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def _attach_shared(name: str) -> shared_memory.SharedMemory:
+    """Open an existing shared memory block without taking ownership of it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track argument
+        return shared_memory.SharedMemory(name=name)
+
+
+def _shared_block_stats(name: str, shape: tuple, start: int, stop: int) -> dict:
+    """Process pool task: statistics for columns start:stop of a shared float64 matrix."""
+    shm = _attach_shared(name)
+    try:
+        values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+        stats = _blockwise_stats(values[:, start:stop])
+        del values
+    finally:
+        shm.close()
+    return stats
+
+
+def summary_statistics(df: pd.DataFrame, n_jobs: int = 1) -> pd.DataFrame:
+    """
+    Compute the univariate summary table for every column of a DataFrame.
+
+    Numeric columns are processed together in column blocks: each block is
+    copied into one float64 array and all statistics come out of a single
+    sort plus one moment pass (see ``_numeric_block_stats``). Integer
+    columns with values beyond 2**53, which float64 cannot tell apart, get
+    their unique count and mode from the native integers. Other columns
+    take one ``value_counts`` each for the unique count and the mode.
+
+    With ``n_jobs`` other than 1 the numeric columns are copied once into a
+    shared memory matrix and sharded across a process pool; workers map the
+    matrix instead of receiving pickled data, and the parent summarizes the
+    non-numeric columns while they run.
+
     Parameters
     ----------
     df : pd.DataFrame
-        Input DataFrame to analyze
-    
+        Input DataFrame to summarize
+    n_jobs : int
+        Worker processes for the numeric columns; -1 uses every CPU
+
     Returns
     -------
     pd.DataFrame
-        Summary statistics for each column
+        One row per column with the ``SUMMARY_COLUMNS`` statistics; the
+        numeric statistics are NaN for non-numeric columns
+    """
+    n_rows = len(df)
+    n_cols = df.shape[1]
+    n_jobs = _resolve_n_jobs(n_jobs)
+    numeric_pos = [i for i in range(n_cols) if _is_numeric(df.iloc[:, i])]
+    other_pos = [i for i in range(n_cols) if i not in set(numeric_pos)]
+
+    count = np.zeros(n_cols, dtype=np.int64)
+    unique = np.zeros(n_cols, dtype=np.int64)
+    mode = np.full(n_cols, None, dtype=object)
+    float_stats = {name: np.full(n_cols, np.nan) for name in SUMMARY_COLUMNS[5:]}
+
+    def store_numeric(positions, stats):
+        count[positions] = stats["Count"]
+        unique[positions] = stats["Unique"]
+        for name in float_stats:
+            float_stats[name][positions] = stats[name]
+        for pos, value in zip(positions, stats["Mode"]):
+            dtype = df.dtypes.iloc[pos]
+            if np.isnan(value) or (pd.api.types.is_integer_dtype(dtype) and abs(value) > 2**53):
+                # Modes of large integers are filled in exactly by store_large_integers
+                continue
+            # Report the mode in the column's own type (ints stay ints)
+            mode[pos] = dtype.type(value)
+
+    def store_large_integers():
+        # Integer columns reaching past 2**53 get Unique and Mode from their native values
+        for pos in numeric_pos:
+            dtype = df.dtypes.iloc[pos]
+            if not pd.api.types.is_integer_dtype(dtype) or count[pos] == 0:
+                continue
+            values = df.iloc[:, pos].dropna().to_numpy(dtype=getattr(dtype, "numpy_dtype", dtype))
+            if values.max() > 2**53 or values.min() < -2**53:
+                unique[pos], mode[pos] = _integer_runs(values)
+
+    def store_others():
+        for pos in other_pos:
+            counts = df.iloc[:, pos].value_counts(sort=False)
+            # Categorical columns also list their unused categories, with zero counts
+            counts = counts[counts > 0]
+            count[pos] = counts.sum()
+            unique[pos] = len(counts)
+            if len(counts) > 0:
+                top = counts.index[counts.to_numpy() == counts.max()]
+                try:
+                    mode[pos] = sorted(top)[0]
+                except TypeError:
+                    mode[pos] = top[0]
+
+    if n_jobs > 1 and len(numeric_pos) > 1 and n_rows > 0:
+        shape = (n_rows, len(numeric_pos))
+        shm = shared_memory.SharedMemory(create=True, size=n_rows * len(numeric_pos) * 8)
+        try:
+            values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+            for j, pos in enumerate(numeric_pos):
+                values[:, j] = df.iloc[:, pos].to_numpy(dtype=np.float64, na_value=np.nan)
+            del values
+            # A few shards per worker keeps the pool busy when columns differ in cost
+            n_shards = min(len(numeric_pos), 4 * n_jobs)
+            bounds = np.linspace(0, len(numeric_pos), n_shards + 1).astype(int)
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                futures = [(numeric_pos[lo:hi], pool.submit(_shared_block_stats, shm.name, shape, lo, hi))
+                           for lo, hi in zip(bounds[:-1], bounds[1:])]
+                store_others()
+                for positions, future in futures:
+                    store_numeric(positions, future.result())
+            store_large_integers()
+        finally:
+            shm.close()
+            shm.unlink()
+    else:
+        block_width = _block_width(n_rows)
+        for start in range(0, len(numeric_pos), block_width):
+            positions = numeric_pos[start:start + block_width]
+            block = df.iloc[:, positions].to_numpy(dtype=np.float64, na_value=np.nan)
+            store_numeric(positions, _numeric_block_stats(block))
+        store_large_integers()
+        store_others()
+
+    results = {
+        "Data Type": pd.Series(list(df.dtypes), dtype=object),
+        "Count": count,
+        "Missing": n_rows - count,
+        "Unique": unique,
+        "Mode": mode,
+    }
+    results.update(float_stats)
+    return pd.DataFrame(results, columns=SUMMARY_COLUMNS).set_axis(df.columns)
+
+
+def _summary_frame(rows: list, index) -> pd.DataFrame:
+    """Build a typed summary table from per-column dicts of ``SUMMARY_COLUMNS``."""
+    table = pd.DataFrame.from_records(rows, columns=SUMMARY_COLUMNS)
+    table = table.astype({"Count": np.int64, "Missing": np.int64, "Unique": np.int64,
+                          "Data Type": object, "Mode": object})
+    table[SUMMARY_COLUMNS[5:]] = table[SUMMARY_COLUMNS[5:]].astype(np.float64)
+    return table.set_axis(index)
+
+
+def _plot_distribution(series: pd.Series) -> plt.Figure:
+    """Stacked box plot and histogram with KDE for a numeric column."""
+    col = series.name
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8), 
+                                    gridspec_kw={'height_ratios': [1, 2], 'hspace': 0.3})
+    
+    # Box plot on top
+    sns.boxplot(y=series, ax=ax1)
+    ax1.set_title(f'Box Plot and Distribution for {col}')
+    ax1.set_xlabel('')
+    ax1.set_ylabel(col)
+    
+    # Histogram with KDE overlay underneath
+    sns.histplot(x=series, kde=True, ax=ax2)
+    ax2.set_xlabel(col)
+    ax2.set_ylabel('Frequency')
+    
+    fig.tight_layout()
+    return fig
+
+
+def _plot_counts(series: pd.Series) -> plt.Figure:
+    """Count plot with percentage labels for a categorical column."""
+    col = series.name
+    fig, ax = plt.subplots(figsize=(10, 6))
+    sns.countplot(x=series, ax=ax)
+    ax.set_title(f'Count Plot for {col}')
+    ax.set_xlabel(col)
+    ax.set_ylabel('Count')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    
+    # Add percentage labels above each bar
+    total = series.count()
+    if total > 0:
+        for p in ax.patches:
+            height = p.get_height()
+            percentage = (height / total) * 100
+            ax.text(p.get_x() + p.get_width() / 2., height,
+                    f'{percentage:.1f}%',
+                    ha='center', va='bottom')
+    
+    fig.tight_layout()
+    return fig
+
+
+class FigureSpec:
+    """
+    A univariate plot that has not been drawn yet.
+
+    Holds only the column's data and the kind of plot, so it is cheap to
+    create and can be pickled to a worker process. Nothing is rendered until
+    ``render`` or ``save`` is called.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Column to plot; its name is used for titles and labels
+    kind : str
+        "distribution" for numeric columns or "counts" for categorical ones
+    """
+
+    _PLOTTERS = {"distribution": _plot_distribution, "counts": _plot_counts}
+
+    def __init__(self, series: pd.Series, kind: str):
+        if kind not in self._PLOTTERS:
+            raise ValueError(f"Unknown plot kind: {kind}")
+        self.series = series
+        self.kind = kind
+
+    @property
+    def column(self):
+        return self.series.name
+
+    def __repr__(self) -> str:
+        return f"FigureSpec(column={self.column!r}, kind={self.kind!r})"
+
+    def render(self) -> plt.Figure:
+        """Draw and return the figure."""
+        return self._PLOTTERS[self.kind](self.series)
+
+    def save(self, path: str, dpi: int = 100) -> str:
+        """Render the figure to ``path``, close it and return the path."""
+        fig = self.render()
+        try:
+            fig.savefig(path, dpi=dpi)
+        finally:
+            plt.close(fig)
+        return path
+
+
+def _use_agg_backend():
+    """Process pool initializer: render without a display."""
+    plt.switch_backend("Agg")
+
+
+def _save_figure(spec: FigureSpec, path: str, dpi: int) -> str:
+    return spec.save(path, dpi=dpi)
+
+
+def _figure_path(plot_dir: str, column, kind: str) -> str:
+    """PNG path for a column; the name hash keeps e.g. "a b" and "a/b" apart."""
+    safe = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in str(column))
+    tag = hashlib.blake2b(str(column).encode(), digest_size=4).hexdigest()
+    return os.path.join(plot_dir, f"{safe}_{tag}_{kind}.png")
+
+
+def render_figures(specs: dict, plot_dir: str, n_jobs: int = None, dpi: int = 100,
+                   cache: "ProfileCache" = None, digests: dict = None) -> dict:
     """
+    Render figure specs to PNG files in parallel.
 
-    df_results = pd.DataFrame(columns=["Data Type", "Count", "Missing", "Unique", "Mode", "Min", "Q1", "Median",
-                                        "Q3", "Max", "Mean", "Std", "Skew", "Kurt"])
+    Each spec is drawn in a worker process running the Agg backend, so
+    rendering uses every core and never opens a window.
 
+    Parameters
+    ----------
+    specs : dict
+        Column name -> FigureSpec, as returned by ``univariate(plots="lazy")``
+    plot_dir : str
+        Directory for the PNG files; created if missing
+    n_jobs : int, optional
+        Number of worker processes (default: one per CPU)
+    dpi : int
+        Resolution of the saved images
+    cache : ProfileCache, optional
+        Reuse PNGs rendered earlier from identical column data
+    digests : dict, optional
+        Column name -> ``_column_digest`` already computed by the caller
+
+    Returns
+    -------
+    dict
+        Column name -> path of the rendered PNG
+    """
+    os.makedirs(plot_dir, exist_ok=True)
+    paths = {col: _figure_path(plot_dir, col, spec.kind) for col, spec in specs.items()}
+    keys = {}
+    if cache is not None:
+        digests = digests or {}
+        for col, spec in specs.items():
+            digest = digests.get(col) or _column_digest(spec.series)
+            keys[col] = _cache_key("figure", spec.kind, col, dpi, digest)
+            png = cache.get(keys[col])
+            if png is not None:
+                with open(paths[col], "wb") as f:
+                    f.write(png)
+        specs = {col: spec for col, spec in specs.items() if col not in keys or keys[col] not in cache}
+    if not specs:
+        return paths
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_use_agg_backend) as pool:
+        futures = {col: pool.submit(_save_figure, spec, paths[col], dpi) for col, spec in specs.items()}
+        for col, future in futures.items():
+            future.result()
+            if cache is not None:
+                with open(paths[col], "rb") as f:
+                    cache.put(keys[col], f.read())
+    if cache is not None:
+        cache.trim()
+    return paths
+
+
+def figure_specs(df: pd.DataFrame, df_results: pd.DataFrame) -> dict:
+    """
+    Decide which univariate plot each column gets.
+
+    Numeric columns get a distribution plot unless they only hold 0/1
+    values; every other column gets a count plot.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The profiled DataFrame
+    df_results : pd.DataFrame
+        Its summary table from ``summary_statistics``
+
+    Returns
+    -------
+    dict
+        Column name -> FigureSpec
+    """
+    specs = {}
     for col in df.columns:
-        df_results.loc[col, "Data Type"] = df[col].dtype
-        df_results.loc[col, "Count"] = df[col].count()
-        df_results.loc[col, "Missing"] = df[col].isna().sum()
-        df_results.loc[col, "Unique"] = df[col].nunique()
-        
-        # Handle mode safely
-        mode_values = df[col].mode()
-        df_results.loc[col, "Mode"] = mode_values[0] if len(mode_values) > 0 else None
-
-        if df[col].dtype in ["int64", "float64"]:
-            df_results.loc[col, "Min"] = df[col].min()
-            df_results.loc[col, "Q1"] = df[col].quantile(0.25)
-            df_results.loc[col, "Median"] = df[col].median()
-            df_results.loc[col, "Q3"] = df[col].quantile(0.75)
-            df_results.loc[col, "Max"] = df[col].max()
-            df_results.loc[col, "Mean"] = df[col].mean()
-            df_results.loc[col, "Std"] = df[col].std()
-            df_results.loc[col, "Skew"] = df[col].skew()
-            df_results.loc[col, "Kurt"] = df[col].kurt()
-
-            # Check if column is NOT boolean 0/1
-            unique_vals = set(df[col].dropna().unique())
-            is_boolean = unique_vals.issubset({0, 1})
-            
+        stats = df_results.loc[col]
+        if _is_numeric(df[col]):
+            # Check if column is NOT boolean 0/1: at most two distinct
+            # values whose min and max both lie in {0, 1}
+            is_boolean = stats["Count"] == 0 or (
+                stats["Unique"] <= 2 and stats["Min"] in (0, 1) and stats["Max"] in (0, 1))
             if not is_boolean:
-                # Create stacked plot: box plot on top, histogram with KDE underneath
-                fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8), 
-                                                gridspec_kw={'height_ratios': [1, 2], 'hspace': 0.3})
-                
-                # Box plot on top
-                sns.boxplot(data=df, y=col, ax=ax1)
-                ax1.set_title(f'Box Plot and Distribution for {col}')
-                ax1.set_xlabel('')
-                ax1.set_ylabel(col)
-                
-                # Histogram with KDE overlay underneath
-                sns.histplot(data=df, x=col, kde=True, ax=ax2)
-                ax2.set_xlabel(col)
-                ax2.set_ylabel('Frequency')
-                
-                plt.tight_layout()
-                plt.show()
+                specs[col] = FigureSpec(df[col], "distribution")
         else:
-            # Prepare for categorical plots
-            plt.figure(figsize=(10, 6))
-            ax = sns.countplot(data=df, x=col)
-            plt.title(f'Count Plot for {col}')
-            plt.xlabel(col)
-            plt.ylabel('Count')
-            plt.xticks(rotation=45, ha='right')
-            
-            # Add percentage labels above each bar
-            total = len(df[col].dropna())
-            if total > 0:
-                for p in ax.patches:
-                    height = p.get_height()
-                    percentage = (height / total) * 100
-                    ax.text(p.get_x() + p.get_width() / 2., height,
-                            f'{percentage:.1f}%',
-                            ha='center', va='bottom')
-            
-            plt.tight_layout()
-            plt.show()
+            specs[col] = FigureSpec(df[col], "counts")
+    return specs
+
+
+def univariate(df: pd.DataFrame, plots: str = "show", plot_dir: str = "univariate_plots",
+               n_jobs: int = None, cache=None):
+    """
+    Generate univariate statistical analysis and visualizations for a DataFrame.
+    
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input DataFrame to analyze
+    plots : str
+        How to handle the per-column figures:
+
+        - "show": draw each figure and ``plt.show()`` it (default)
+        - "none": skip plotting and return only the statistics
+        - "lazy": return FigureSpec objects that draw on ``render()``
+        - "batch": render PNG files into ``plot_dir`` in a process pool
+    plot_dir : str
+        Output directory for ``plots="batch"``
+    n_jobs : int, optional
+        Worker processes for the statistics and for ``plots="batch"``;
+        -1 uses every CPU. By default the statistics run in this process
+        and batch rendering uses one worker per CPU
+    cache : ProfileCache or str, optional
+        On-disk cache (or its directory). Columns whose data is unchanged
+        since an earlier call reuse their statistics and batch-rendered
+        plots; only new or modified columns are recomputed.
+    
+    Returns
+    -------
+    pd.DataFrame or tuple
+        Summary statistics for each column. With ``plots="lazy"`` a tuple
+        ``(summary, specs)`` of column name -> FigureSpec, and with
+        ``plots="batch"`` a tuple ``(summary, paths)`` of column name -> PNG path
+    """
+    if plots not in PLOT_MODES:
+        raise ValueError(f"plots must be one of {PLOT_MODES}, got {plots!r}")
+
+    stats_jobs = _resolve_n_jobs(n_jobs)
+    cache = _as_cache(cache)
+    digests = None
+    if cache is None:
+        df_results = summary_statistics(df, n_jobs=stats_jobs)
+    else:
+        digests = {col: _column_digest(df[col]) for col in df.columns}
+        df_results = _cached_summary(df, cache, digests, stats_jobs)
+    if plots == "none":
+        return df_results
+
+    specs = figure_specs(df, df_results)
+    if plots == "lazy":
+        return df_results, specs
+    if plots == "batch":
+        return df_results, render_figures(specs, plot_dir, n_jobs=n_jobs, cache=cache, digests=digests)
+
+    for spec in specs.values():
+        spec.render()
+        plt.show()
 
     return df_results
 
-def drop_columns(df: pd.DataFrame) -> pd.DataFrame:
+
+def _has_predictive_power(series: pd.Series, sample_size: int) -> bool:
+    """
+    Decide whether ``drop_columns`` keeps a column, hashing as little as possible.
+
+    The rule is exact: keep the column if it has more than one distinct value,
+    unless it is non-numeric and every value is distinct. Only the first
+    ``sample_size`` rows are hashed at first, which settles most columns:
+
+    - Two distinct values plus a repeat (or a missing value) in the sample
+      means the column can be neither constant nor an ID column.
+    - A single distinct value in the sample is confirmed or refuted by one
+      vectorized comparison against that value instead of a hash table.
+
+    Only columns that still look like IDs (every sampled value distinct) fall
+    back to an exact ``nunique``.
+    """
+    n_rows = len(series)
+    is_numeric = pd.api.types.is_numeric_dtype(series)
+    head = series.iloc[:sample_size]
+    head_unique = head.nunique()
+    # A repeated or missing value in the sample rules out "all values unique"
+    cannot_be_id = is_numeric or head_unique < len(head)
+
+    if head_unique >= 2 and cannot_be_id:
+        return True
+
+    if head_unique <= 1:
+        present = series.dropna()
+        if len(present) == 0:
+            return False
+        varies = bool((present.to_numpy() != present.iloc[0]).any())
+        if not varies:
+            return False
+        if cannot_be_id and len(head) >= 2:
+            return True
+
+    n_unique = series.nunique()
+    return n_unique > 1 and not (n_unique == n_rows and not is_numeric)
+
+
+def drop_columns(df: pd.DataFrame, sample_size: int = 10_000, cache=None) -> pd.DataFrame:
     """
     Drop columns with no predictive power.
     
     Removes columns where:
     - All values are identical (0 or 1 unique value)
     - All values are unique and the column is non-numeric (e.g., ID columns)
+
+    Columns are checked on a leading sample first and only counted exactly
+    when the sample cannot settle the decision; the result is the same as
+    counting every column with ``nunique``.
     
     Parameters
     ----------
     df : pd.DataFrame
         Input DataFrame
+    sample_size : int
+        Number of leading rows inspected before falling back to an exact count
+    cache : ProfileCache or str, optional
+        On-disk cache (or its directory) of keep/drop decisions per column
     
     Returns
     -------
     pd.DataFrame
         DataFrame with low-predictive-power columns removed
     """
+    cache = _as_cache(cache)
+    if cache is None:
+        cols_to_keep = [col for col in df.columns if _has_predictive_power(df[col], sample_size)]
+        return df[cols_to_keep]
+
     cols_to_keep = []
     for col in df.columns:
-        n_unique = df[col].nunique()
-        is_numeric = pd.api.types.is_numeric_dtype(df[col])
-        
-        # Keep column if it has multiple unique values
-        if n_unique > 1:
-            # Drop only if all values are unique AND non-numeric
-            if not (n_unique == len(df) and not is_numeric):
-                cols_to_keep.append(col)
-    
-    return df[cols_to_keep]
\ No newline at end of file
+        key = _cache_key("drop_columns", _column_digest(df[col]))
+        keep = cache.get(key)
+        if keep is None:
+            keep = _has_predictive_power(df[col], sample_size)
+            cache.put(key, keep)
+        if keep:
+            cols_to_keep.append(col)
+    cache.trim()
+    return df[cols_to_keep]
+
+
+def _looks_like_dates(series: pd.Series, sample_size: int = 200) -> bool:
+    """True if nearly all of a sample of a text column parses as dates."""
+    sample = series.dropna().iloc[:sample_size]
+    if len(sample) == 0:
+        return False
+    sample = sample.astype(str)
+    # Require date punctuation so plain numbers and codes are left alone
+    if not sample.str.contains(r"[-/:]", regex=True).all():
+        return False
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        parsed = pd.to_datetime(sample, errors="coerce")
+    return parsed.notna().mean() >= 0.95
+
+
+def optimize_dtypes(df: pd.DataFrame, category_ratio: float = 0.5, date_columns: list = None,
+                    lossy_floats: bool = False) -> pd.DataFrame:
+    """
+    Shrink a DataFrame's memory footprint before profiling.
+
+    - Integer columns are downcast to the smallest integer type holding
+      their range.
+    - Float columns become float32 when that loses nothing (or always, with
+      ``lossy_floats=True``).
+    - Text columns whose values parse as dates become ``datetime64``.
+    - Remaining text columns with few distinct values become ``category``.
+    
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input DataFrame
+    category_ratio : float
+        Text columns with at most this many distinct values per row are
+        converted to ``category``
+    date_columns : list, optional
+        Columns to parse as dates. By default, text columns are detected
+        from a sample of their values (e.g. ``signup_date``).
+    lossy_floats : bool
+        Downcast every float column to float32, even if values round
+    
+    Returns
+    -------
+    pd.DataFrame
+        Copy of ``df`` with compact dtypes
+    """
+    converted = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_integer_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            converted[col] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series):
+            narrow = series.astype(np.float32)
+            if lossy_floats or narrow.astype(series.dtype).equals(series):
+                converted[col] = narrow
+        elif _is_categorical_like(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+            if date_columns is not None:
+                is_date = col in date_columns
+            else:
+                is_date = _looks_like_dates(series)
+            if is_date:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    converted[col] = pd.to_datetime(series, errors="coerce")
+            elif series.nunique() <= category_ratio * max(len(series), 1):
+                converted[col] = series.astype("category")
+    return df.assign(**converted) if converted else df.copy()
+
+
+def _is_categorical_like(series: pd.Series) -> bool:
+    """Return True for object, string and category columns."""
+    return (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+            or isinstance(series.dtype, pd.CategoricalDtype))
+
+
+def _fit_column_categories(series: pd.Series, threshold: float, max_cardinality: int):
+    """Categories of one column to keep, or None if the column is not binned."""
+    if not _is_categorical_like(series):
+        return None
+    codes, uniques = pd.factorize(series)
+    if max_cardinality is not None and len(uniques) > max_cardinality:
+        return None
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    total = counts.sum()
+    if total == 0:
+        return None
+    return list(uniques[counts / total >= threshold])
+
+
+def _bin_column(series: pd.Series, kept: list, other: str) -> pd.Series:
+    """Map a column onto ``kept`` plus ``other`` with one hash lookup into the categories."""
+    categories = list(kept) if other in kept else list(kept) + [other]
+    codes = pd.Index(categories).get_indexer(series)
+    codes[(codes == -1) & series.notna().to_numpy()] = categories.index(other)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=categories),
+                     index=series.index, name=series.name)
+
+
+def fit_rare_categories(df: pd.DataFrame, threshold: float = 0.05, max_cardinality: int = None) -> dict:
+    """
+    Learn which categories ``bin_rare_categories`` keeps for each column.
+
+    Each object, string or category column is factorized once and its
+    category shares come from a ``bincount`` of the codes.
+    
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Training data
+    threshold : float
+        Categories making up less than this share of a column's non-missing
+        values are binned
+    max_cardinality : int, optional
+        Leave columns with more distinct values than this untouched (e.g.
+        names or free text, where binning would collapse everything)
+    
+    Returns
+    -------
+    dict
+        Column name -> list of categories to keep
+    """
+    category_map = {}
+    for col in df.columns:
+        kept = _fit_column_categories(df[col], threshold, max_cardinality)
+        if kept is not None:
+            category_map[col] = kept
+    return category_map
+
+
+def bin_rare_categories(df: pd.DataFrame, threshold: float = 0.05, max_cardinality: int = None,
+                        category_map: dict = None, other: str = "Other") -> pd.DataFrame:
+    """
+    Bin rare categories into a single ``other`` category.
+
+    Columns are converted to ``Categorical`` against the kept categories
+    with one vectorized lookup; every value outside them (rare in the
+    training data, or never seen) gets the code of ``other``. Missing
+    values stay missing.
+    
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input DataFrame
+    threshold : float
+        Share below which a category is binned, used when fitting
+    max_cardinality : int, optional
+        Skip columns with more distinct values than this, used when fitting
+    category_map : dict, optional
+        Output of ``fit_rare_categories`` from earlier data; when given,
+        nothing is recounted and ``threshold``/``max_cardinality`` are ignored
+    other : str
+        Label for the binned categories
+    
+    Returns
+    -------
+    pd.DataFrame
+        Copy of ``df`` with each mapped column as a category column
+    """
+    if category_map is None:
+        category_map = fit_rare_categories(df, threshold=threshold, max_cardinality=max_cardinality)
+
+    df = df.copy()
+    for col, kept in category_map.items():
+        if col in df.columns:
+            df[col] = _bin_column(df[col], kept, other)
+    return df
+
+
+# ============================================================================
+# PREPROCESSING PIPELINE: fit once, apply a fused per-column plan
+# ============================================================================
+
+# Bump when the fitted plan changes shape so old saved plans are rejected
+_PIPELINE_VERSION = 1
+
+
+class _Replace:
+    """Fitted column operation: replace values by a fixed mapping."""
+
+    def __init__(self, mapping: dict):
+        self.mapping = mapping
+
+    def __call__(self, series: pd.Series) -> pd.Series:
+        return series.replace(self.mapping)
+
+
+class _BinCategories:
+    """Fitted column operation: bin categories outside ``kept`` into ``other``."""
+
+    def __init__(self, kept: list, other: str):
+        self.kept = kept
+        self.other = other
+
+    def __call__(self, series: pd.Series) -> pd.Series:
+        return _bin_column(series, self.kept, self.other)
+
+
+class Pipeline:
+    """
+    Preprocessing steps recorded once, fitted once and replayed on new batches.
+
+    Steps are added with the chaining methods below. ``fit`` runs them in
+    order on training data and compiles the result into a plan: the list of
+    output columns plus, for each column, the fitted operations to apply to
+    it. ``transform`` applies that plan in a single pass over the columns of
+    a batch and builds the output frame once, so no step makes a copy of the
+    whole frame. Plans can be saved and loaded, letting scoring jobs skip
+    ``fit`` entirely.
+
+    Examples
+    --------
+    >>> pipe = (ml.Pipeline()
+    ...         .drop_columns()
+    ...         .drop(['Unnamed: 0'])
+    ...         .replace('Position', {'PG-SG': 'PG', 'SM-PF': 'SF'})
+    ...         .bin_rare_categories(threshold=0.05))
+    >>> df_train = pipe.fit_transform(df)
+    >>> pipe.save('nba_plan.pkl')
+    >>> df_batch = ml.Pipeline.load('nba_plan.pkl').transform(batch)
+    """
+
+    def __init__(self):
+        self.steps = []
+        self.columns_ = None
+        self.operations_ = None
+
+    def _add(self, kind: str, **params) -> "Pipeline":
+        self.steps.append((kind, params))
+        self.columns_ = self.operations_ = None
+        return self
+
+    def drop_columns(self, sample_size: int = 10_000) -> "Pipeline":
+        """Drop columns without predictive power, as ``drop_columns`` does."""
+        return self._add("drop_columns", sample_size=sample_size)
+
+    def drop(self, columns: list) -> "Pipeline":
+        """Drop the named columns; names not present are ignored."""
+        return self._add("drop", columns=list(columns))
+
+    def replace(self, column, mapping: dict) -> "Pipeline":
+        """Replace values of one column; ignored if the column is not present."""
+        return self._add("replace", column=column, mapping=dict(mapping))
+
+    def bin_rare_categories(self, threshold: float = 0.05, max_cardinality: int = None,
+                            other: str = "Other") -> "Pipeline":
+        """Bin rare categories, as ``bin_rare_categories`` does."""
+        return self._add("bin_rare_categories", threshold=threshold,
+                         max_cardinality=max_cardinality, other=other)
+
+    def _fit(self, df: pd.DataFrame) -> dict:
+        """
+        Fit every step on ``df``, compile the plan and return the output columns.
+
+        Each step sees the output of the steps before it. Intermediate
+        results are kept as a dict of columns, so fitting never copies the
+        frame either.
+        """
+        current = {col: df[col] for col in df.columns}
+        operations = {col: [] for col in df.columns}
+
+        for kind, params in self.steps:
+            if kind == "drop_columns":
+                current = {col: s for col, s in current.items()
+                           if _has_predictive_power(s, params["sample_size"])}
+            elif kind == "drop":
+                current = {col: s for col, s in current.items() if col not in params["columns"]}
+            elif kind == "replace":
+                col = params["column"]
+                if col in current:
+                    op = _Replace(params["mapping"])
+                    operations[col].append(op)
+                    current[col] = op(current[col])
+            elif kind == "bin_rare_categories":
+                for col, s in current.items():
+                    kept = _fit_column_categories(s, params["threshold"], params["max_cardinality"])
+                    if kept is not None:
+                        op = _BinCategories(kept, params["other"])
+                        operations[col].append(op)
+                        current[col] = op(s)
+            else:
+                raise ValueError(f"Unknown pipeline step: {kind}")
+
+        self.columns_ = list(current)
+        self.operations_ = {col: operations[col] for col in self.columns_ if operations[col]}
+        return current
+
+    def fit(self, df: pd.DataFrame) -> "Pipeline":
+        """Fit every step on ``df`` and compile the plan."""
+        self._fit(df)
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply the fitted plan to a new batch with the training columns."""
+        if self.columns_ is None:
+            raise RuntimeError("Pipeline is not fitted; call fit() first")
+        missing = [col for col in self.columns_ if col not in df.columns]
+        if missing:
+            raise KeyError(f"Batch is missing columns the pipeline was fitted on: {missing}")
+
+        output = {}
+        for col in self.columns_:
+            series = df[col]
+            for op in self.operations_.get(col, ()):
+                series = op(series)
+            output[col] = series
+        return pd.DataFrame(output, index=df.index, copy=False)
+
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Fit on ``df`` and return its transformed version without a second pass."""
+        return pd.DataFrame(self._fit(df), index=df.index, copy=False)
+
+    def save(self, path: str) -> None:
+        """Write the recorded steps and fitted plan to ``path``."""
+        if self.columns_ is None:
+            raise RuntimeError("Pipeline is not fitted; call fit() first")
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"version": _PIPELINE_VERSION, "pipeline": self}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "Pipeline":
+        """Read a fitted pipeline written by ``save``."""
+        with open(path, "rb") as f:
+            saved = pickle.load(f)
+        if not isinstance(saved, dict) or saved.get("version") != _PIPELINE_VERSION:
+            raise ValueError(f"{path} is not a pipeline saved by this version of ml_library")
+        return saved["pipeline"]
+
+
+# ============================================================================
+# STREAMING PROFILER: mergeable per-column sketches
+# ============================================================================
+
+class MomentSketch:
+    """
+    Exact count, min, max and central moment sums of a numeric stream.
+
+    Each batch is reduced with NumPy and folded into the running state with
+    the pairwise update of Chan et al. / Pebay, the batch form of Welford's
+    algorithm, so two sketches can be merged without revisiting data.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of float values (NaNs are ignored)."""
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        batch = MomentSketch()
+        batch.n = len(values)
+        batch.mean = values.mean()
+        dev = values - batch.mean
+        dev2 = dev * dev
+        batch.m2 = dev2.sum()
+        batch.m3 = (dev2 * dev).sum()
+        batch.m4 = (dev2 * dev2).sum()
+        batch.min = values.min()
+        batch.max = values.max()
+        self.merge(batch)
+
+    def merge(self, other: "MomentSketch") -> None:
+        """Fold another sketch into this one."""
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.__dict__.update(other.__dict__)
+            return
+        na, nb = self.n, other.n
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+        m3 = (self.m3 + other.m3 + delta * delta_n ** 2 * na * nb * (na - nb)
+              + 3 * delta_n * (na * other.m2 - nb * self.m2))
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * delta_n ** 2 * (na * na * other.m2 + nb * nb * self.m2)
+              + 4 * delta_n * (na * other.m3 - nb * self.m3))
+        self.mean += delta_n * nb
+        self.n, self.m2, self.m3, self.m4 = n, m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def stats(self) -> dict:
+        """Min, Max, Mean, Std, Skew and Kurt with pandas' bias corrections."""
+        m2, m3 = _zero_out_fperr(np.array([self.m2, self.m3]))
+        std, skew, kurt = _finalize_moments(self.n, m2, m3, self.m4)
+        return {"Min": self.min, "Max": self.max, "Mean": self.mean if self.n else np.nan,
+                "Std": float(std), "Skew": float(skew), "Kurt": float(kurt)}
+
+
+class QuantileSketch:
+    """
+    KLL quantile sketch (Karnin, Lang & Liberty, 2016).
+
+    Values live in a stack of compactors; compactor ``h`` holds items of
+    weight ``2**h``. A full compactor is sorted and every other item is
+    promoted one level up, so memory stays O(k log(n/k)) while rank error
+    stays around 1/k. Until the first compaction the sketch holds every value
+    and answers quantiles exactly.
+
+    Parameters
+    ----------
+    k : int
+        Capacity of the top compactor; larger is more accurate
+    seed : int, optional
+        Seed for the random compaction offsets
+    """
+
+    _DECAY = 2.0 / 3.0
+
+    def __init__(self, k: int = 1024, seed: int = None):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.levels) - height - 1
+        return max(2, int(np.ceil(self.k * self._DECAY ** depth)))
+
+    def _compress(self) -> None:
+        height = 0
+        while height < len(self.levels):
+            level = self.levels[height]
+            if len(level) >= self._capacity(height):
+                if height + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(level)
+                # An odd item out stays behind at this level
+                keep = len(level) % 2
+                promoted = level[keep + self._rng.integers(2)::2]
+                self.levels[height] = level[:keep]
+                self.levels[height + 1] = np.concatenate([self.levels[height + 1], promoted])
+            height += 1
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of float values (NaNs are ignored)."""
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch into this one."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for height, level in enumerate(other.levels):
+            self.levels[height] = np.concatenate([self.levels[height], level])
+        self.n += other.n
+        self._compress()
+
+    def quantiles(self, qs) -> np.ndarray:
+        """Estimate the values at quantiles ``qs`` (each in [0, 1])."""
+        qs = np.asarray(qs, dtype=np.float64)
+        if self.n == 0:
+            return np.full(qs.shape, np.nan)
+        if len(self.levels) == 1:
+            return np.quantile(self.levels[0], qs)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        cum = np.cumsum(weights[order])
+        idx = np.searchsorted(cum, qs * cum[-1], side="left")
+        return values[np.minimum(idx, len(values) - 1)]
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Vectorized int.bit_length for uint64 arrays."""
+    x = x.copy()
+    length = np.zeros(x.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        big = x >= np.uint64(1 << shift)
+        length[big] += shift
+        x[big] >>= np.uint64(shift)
+    return length + (x > 0)
+
+
+class DistinctSketch:
+    """
+    HyperLogLog distinct counter with an exact small-cardinality mode.
+
+    Values are hashed with ``pd.util.hash_array``. While a column has at most
+    ``exact_limit`` distinct hashes they are kept in a sorted array and the
+    count is exact; beyond that only the ``2**p`` registers are kept
+    (relative error about 1.04 / sqrt(2**p)).
+
+    Parameters
+    ----------
+    p : int
+        Number of index bits; the sketch holds ``2**p`` one-byte registers
+    exact_limit : int
+        Largest distinct count tracked exactly
+    """
+
+    def __init__(self, p: int = 14, exact_limit: int = 4096):
+        self.p = p
+        self.exact_limit = exact_limit
+        self.registers = np.zeros(2 ** p, dtype=np.uint8)
+        self.exact = np.empty(0, dtype=np.uint64)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of non-null values."""
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_array(np.asarray(values))
+        self._add_hashes(hashes)
+
+    def _add_hashes(self, hashes: np.ndarray) -> None:
+        tail_bits = 64 - self.p
+        index = (hashes >> np.uint64(tail_bits)).astype(np.int64)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+        rank = (tail_bits - _bit_length(tail) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        if self.exact is not None:
+            self.exact = np.union1d(self.exact, hashes)
+            if len(self.exact) > self.exact_limit:
+                self.exact = None
+
+    def merge(self, other: "DistinctSketch") -> None:
+        """Fold another sketch into this one."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+        if self.exact is not None and other.exact is not None:
+            self.exact = np.union1d(self.exact, other.exact)
+            if len(self.exact) > self.exact_limit:
+                self.exact = None
+        else:
+            self.exact = None
+
+    def count(self) -> int:
+        """Estimated number of distinct values."""
+        if self.exact is not None:
+            return len(self.exact)
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype(np.float64))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class ModeSketch:
+    """
+    Misra-Gries heavy hitters summary used to find the mode.
+
+    Each batch is counted exactly with ``value_counts`` and added to at most
+    ``k`` counters; when more than ``k`` are live, the (k+1)-th largest
+    count is subtracted from all of them and the non-positive ones dropped
+    (the mergeable variant of Agarwal et al., 2012). The mode is exact for
+    columns with at most ``k`` distinct values, and any value occurring more
+    than n / (k + 1) times is always retained. A counter undercounts its
+    value by at most the total subtracted so far, and a dropped value
+    occurs at most that often; when no counter exceeds it (e.g. an ID
+    column whose values all occur once) the counts look tied, and the
+    smallest value seen, kept on the side, is reported as the mode.
+
+    Parameters
+    ----------
+    k : int
+        Number of counters kept
+    """
+
+    def __init__(self, k: int = 256):
+        self.k = k
+        self.counters = pd.Series(dtype=np.int64)
+        self.subtracted = 0
+        self.smallest = None
+
+    def update(self, values: pd.Series) -> None:
+        """Add a batch of non-null values."""
+        self._absorb(values.value_counts(sort=False))
+
+    def merge(self, other: "ModeSketch") -> None:
+        """Fold another sketch into this one."""
+        self._absorb(other.counters)
+        self.subtracted += other.subtracted
+        if other.smallest is not None:
+            self._track_smallest(pd.Index([other.smallest]))
+
+    def _track_smallest(self, values: pd.Index) -> None:
+        candidates = values if self.smallest is None else values.append(pd.Index([self.smallest]))
+        try:
+            self.smallest = candidates.min()
+        except TypeError:
+            # Values that do not compare: keep the first one seen, as mode() does
+            self.smallest = self.smallest if self.smallest is not None else values[0]
+
+    def _absorb(self, counts: pd.Series) -> None:
+        if len(counts) == 0:
+            return
+        self._track_smallest(counts.index)
+        if len(self.counters) == 0:
+            combined = counts.astype(np.int64)
+        else:
+            combined = self.counters.add(counts, fill_value=0).astype(np.int64)
+        if len(combined) > self.k:
+            cutoff = np.partition(combined.to_numpy(), -(self.k + 1))[-(self.k + 1)]
+            combined = combined[combined > cutoff] - cutoff
+            self.subtracted += int(cutoff)
+        self.counters = combined
+
+    def mode(self):
+        """Most frequent value seen (smallest on ties), or None if nothing was seen."""
+        if len(self.counters) == 0 or self.counters.max() <= self.subtracted:
+            return self.smallest
+        top = self.counters.index[self.counters.to_numpy() == self.counters.max()]
+        try:
+            return sorted(top)[0]
+        except TypeError:
+            return top[0]
+
+
+class ColumnSketch:
+    """
+    All sketches needed for one row of the univariate summary table.
+
+    Whether the column is numeric is decided from the first batch that
+    holds any non-null value, with the same rule as ``univariate``.
+    """
+
+    def __init__(self, name, quantile_k: int = 1024, distinct_p: int = 14, mode_k: int = 256,
+                 seed: int = None):
+        self.name = name
+        self.dtype = None
+        self.numeric = None
+        self.n_rows = 0
+        self.moments = MomentSketch()
+        self.quantiles = QuantileSketch(k=quantile_k, seed=seed)
+        self.distinct = DistinctSketch(p=distinct_p)
+        self.modes = ModeSketch(k=mode_k)
+
+    def _merge_dtype(self, dtype) -> None:
+        if self.dtype is None or self.dtype == dtype:
+            self.dtype = dtype
+        elif _is_numeric_dtype(self.dtype) and _is_numeric_dtype(dtype):
+            try:
+                self.dtype = np.promote_types(self.dtype, dtype)
+            except TypeError:  # nullable extension dtypes
+                self.dtype = np.dtype("float64")
+        else:
+            self.dtype = np.dtype("O")
+
+    def update(self, series: pd.Series) -> None:
+        """Add one chunk of the column."""
+        self.n_rows += len(series)
+        present = series.dropna()
+        if len(present) == 0:
+            return
+        if self.numeric is None:
+            self.numeric = _is_numeric(series)
+        elif self.numeric and not _is_numeric(series):
+            raise ValueError(
+                f"Column {self.name!r} changed from numeric to {series.dtype} between chunks; "
+                f"pass dtype={{{self.name!r}: ...}} to fix its type")
+        self._merge_dtype(series.dtype)
+
+        self.modes.update(present)
+        if self.numeric:
+            values = present.to_numpy(dtype=np.float64)
+            self.moments.update(values)
+            self.quantiles.update(values)
+            self.distinct.update(values)
+        else:
+            self.moments.n += len(present)
+            self.distinct.update(present.to_numpy())
+
+    def merge(self, other: "ColumnSketch") -> None:
+        """Fold the sketch of another part of the same column into this one."""
+        if other.numeric is not None:
+            if self.numeric is not None and self.numeric != other.numeric:
+                raise ValueError(f"Cannot merge numeric and non-numeric sketches of {self.name!r}")
+            self.numeric = other.numeric
+            self._merge_dtype(other.dtype)
+        self.n_rows += other.n_rows
+        self.moments.merge(other.moments)
+        self.quantiles.merge(other.quantiles)
+        self.distinct.merge(other.distinct)
+        self.modes.merge(other.modes)
+
+    def summary(self) -> dict:
+        """One row of the univariate summary table."""
+        count = self.moments.n
+        row = {"Data Type": self.dtype if self.dtype is not None else np.dtype("float64"),
+               "Count": count, "Missing": self.n_rows - count,
+               "Unique": self.distinct.count(), "Mode": self.modes.mode()}
+        if self.numeric:
+            row.update(self.moments.stats())
+            row["Q1"], row["Median"], row["Q3"] = self.quantiles.quantiles([0.25, 0.5, 0.75])
+        return row
+
+
+# Bump when the sketch classes change shape so old saved profiles are rejected
+_PROFILE_VERSION = 1
+
+
+class StreamingProfile:
+    """
+    Bounded-memory univariate profile built one chunk at a time.
+
+    Keeps a ``ColumnSketch`` per column: exact counts, min and max,
+    Welford-style moment sums for mean, std, skew and kurtosis, a KLL sketch
+    for the quartiles, HyperLogLog for the distinct count and Misra-Gries for
+    the mode. Profiles of different row ranges of the same table can be
+    merged, and ``summary()`` returns the same table as ``univariate``.
+
+    Because every sketch is updated in place, a profile doubles as an
+    incremental profile of a growing table: ``update`` it with each batch of
+    appended rows and ``save`` it between runs instead of rescanning the
+    history.
+
+    Parameters
+    ----------
+    quantile_k, distinct_p, mode_k : int
+        Accuracy settings forwarded to each column's sketches
+    seed : int, optional
+        Seed for the quantile sketches' compaction
+    """
+
+    def __init__(self, quantile_k: int = 1024, distinct_p: int = 14, mode_k: int = 256,
+                 seed: int = None):
+        self.settings = {"quantile_k": quantile_k, "distinct_p": distinct_p, "mode_k": mode_k,
+                         "seed": seed}
+        self.columns = {}
+        self.n_rows = 0
+
+    def _column(self, name) -> ColumnSketch:
+        if name not in self.columns:
+            sketch = ColumnSketch(name, **self.settings)
+            # A column first seen now was missing from every earlier row
+            sketch.n_rows = self.n_rows
+            self.columns[name] = sketch
+        return self.columns[name]
+
+    def update(self, df: pd.DataFrame) -> "StreamingProfile":
+        """Add a chunk of rows and return self."""
+        for col in df.columns:
+            self._column(col).update(df[col])
+        for name, sketch in self.columns.items():
+            if name not in df.columns:
+                sketch.n_rows += len(df)
+        self.n_rows += len(df)
+        return self
+
+    def merge(self, other: "StreamingProfile") -> "StreamingProfile":
+        """Fold a profile of other rows of the same table into this one."""
+        for name, sketch in other.columns.items():
+            self._column(name).merge(sketch)
+        for name, sketch in self.columns.items():
+            if name not in other.columns:
+                sketch.n_rows += other.n_rows
+        self.n_rows += other.n_rows
+        return self
+
+    def summary(self) -> pd.DataFrame:
+        """The univariate summary table for all rows seen so far."""
+        rows = [sketch.summary() for sketch in self.columns.values()]
+        return _summary_frame(rows, list(self.columns))
+
+    def save(self, path: str) -> None:
+        """Write the profile to ``path`` so a later run can keep updating it."""
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"version": _PROFILE_VERSION, "profile": self}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "StreamingProfile":
+        """Read a profile written by ``save``."""
+        with open(path, "rb") as f:
+            saved = pickle.load(f)
+        if not isinstance(saved, dict) or saved.get("version") != _PROFILE_VERSION:
+            raise ValueError(f"{path} is not a profile saved by this version of ml_library")
+        return saved["profile"]
+
+
+def profile_csv(path: str, chunksize: int = 100_000, profile: StreamingProfile = None,
+                **read_csv_kwargs) -> pd.DataFrame:
+    """
+    Profile a CSV file too large to load, reading it in chunks.
+
+    Memory is bounded by one chunk plus a fixed-size sketch per column.
+    Counts, missing values, min, max and the moments are exact; the
+    quartiles, unique counts and modes are exact for small or
+    low-cardinality columns and approximate otherwise (see
+    ``StreamingProfile``).
+
+    Parameters
+    ----------
+    path : str
+        CSV file to profile
+    chunksize : int
+        Rows per chunk
+    profile : StreamingProfile, optional
+        Existing profile to extend, e.g. one loaded with
+        ``StreamingProfile.load`` when ``path`` holds newly appended rows
+    **read_csv_kwargs
+        Forwarded to ``pd.read_csv``, e.g. ``dtype=`` or ``usecols=``
+
+    Returns
+    -------
+    pd.DataFrame
+        Summary statistics for each column, as returned by ``univariate``
+    """
+    if profile is None:
+        profile = StreamingProfile()
+    with pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs) as reader:
+        for chunk in reader:
+            profile.update(chunk)
+    return profile.summary()
+
+
+# ============================================================================
+# PROFILE CACHE: content-addressed results on disk
+# ============================================================================
+
+# Bump when the statistics or plots change so stale entries are not reused
+_CACHE_VERSION = 1
+
+
+def _column_digest(series: pd.Series) -> str:
+    """
+    Fingerprint of a column's dtype and values.
+
+    Numeric buffers are hashed directly; other columns go through the
+    vectorized ``pd.util.hash_pandas_object`` first so the digest does not
+    depend on Python object identity.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(series.dtype).encode())
+    h.update(len(series).to_bytes(8, "little"))
+    values = series.to_numpy()
+    if values.dtype.kind in "biufcmM":
+        h.update(np.ascontiguousarray(values).view(np.uint8))
+    else:
+        h.update(pd.util.hash_pandas_object(series, index=False).to_numpy().view(np.uint8))
+    return h.hexdigest()
+
+
+def _cache_key(*parts) -> str:
+    """Cache key for a function name, its parameters and column digests."""
+    return hashlib.blake2b(repr((_CACHE_VERSION,) + parts).encode(), digest_size=16).hexdigest()
+
+
+class ProfileCache:
+    """
+    Size-bounded on-disk cache for profiling results.
+
+    Entries are pickled into one file per key under ``directory``. Reads
+    refresh a file's modification time, and ``trim`` deletes the least
+    recently used files until the cache fits in ``max_bytes``.
+
+    Parameters
+    ----------
+    directory : str
+        Where entries are stored; created if missing
+    max_bytes : int
+        Size limit enforced by ``trim``
+    """
+
+    def __init__(self, directory: str = ".ml_cache", max_bytes: int = 512 * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pkl")
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def touch(self, key: str) -> bool:
+        """Mark ``key`` as recently used without loading it; False if it is not stored."""
+        try:
+            os.utime(self._path(key))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def get(self, key: str, default=None):
+        """Return the value stored under ``key``, or ``default``."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value) -> None:
+        """Store ``value`` under ``key``; the write is atomic."""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def trim(self) -> None:
+        """Evict least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                os.unlink(entry.path)
+
+
+def _as_cache(cache):
+    """Accept a ProfileCache, a cache directory path, or None."""
+    if cache is None or isinstance(cache, ProfileCache):
+        return cache
+    return ProfileCache(cache)
+
+
+def _cached_summary(df: pd.DataFrame, cache: ProfileCache, digests: dict, n_jobs: int) -> pd.DataFrame:
+    """``summary_statistics`` that only computes columns missing from the cache."""
+    rows = {}
+    missing = []
+    for pos, col in enumerate(df.columns):
+        row = cache.get(_cache_key("summary_statistics", digests[col]))
+        if row is None:
+            missing.append(pos)
+        else:
+            rows[pos] = row
+
+    if missing:
+        fresh = summary_statistics(df.iloc[:, missing], n_jobs=n_jobs)
+        for pos, (_, row) in zip(missing, fresh.iterrows()):
+            rows[pos] = row.to_dict()
+            cache.put(_cache_key("summary_statistics", digests[df.columns[pos]]), rows[pos])
+        cache.trim()
+
+    return _summary_frame([rows[pos] for pos in range(df.shape[1])], df.columns)
+
+
+# ============================================================================
+# DATA LOADING: columnar cache for CSV and Excel sources
+# ============================================================================
+
+def _table_cache_path(path: str, cache_dir: str, read_kwargs: dict) -> str:
+    """Arrow file for a source, keyed by its location, size, mtime and read options."""
+    stat = os.stat(path)
+    key = _cache_key("load_table", os.path.abspath(path), stat.st_size, stat.st_mtime_ns,
+                     sorted(read_kwargs.items()))
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{stem}-{key[:16]}.arrow")
+
+
+def _arrow_compatible(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast object columns Arrow cannot type (e.g. ``[1, 'two', 3.5]``) to str, keeping nulls."""
+    import pyarrow as pa
+
+    for col in df.columns[df.dtypes == object]:
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+def load_table(path: str, columns: list = None, cache_dir: str = None, refresh: bool = False,
+               **read_kwargs) -> pd.DataFrame:
+    """
+    Load a CSV or Excel file through a columnar on-disk cache.
+
+    The first load parses the source with ``pd.read_csv`` or
+    ``pd.read_excel`` and writes an uncompressed Arrow (Feather v2) copy.
+    Later loads memory-map that copy and read only the requested columns,
+    skipping text parsing entirely. The copy is rebuilt whenever the
+    source's size or modification time changes.
+
+    Building the copy parses every column, whatever ``columns`` asks for,
+    so that later loads can select any of them; the selection is applied
+    to the returned frame. Object columns holding values of mixed types,
+    which Arrow cannot store, are converted to strings (nulls are kept)
+    on both the first and later loads.
+    
+    Parameters
+    ----------
+    path : str
+        CSV (``.csv``) or Excel (``.xlsx``/``.xls``) source file
+    columns : list, optional
+        Columns to load; all columns by default
+    cache_dir : str, optional
+        Where Arrow copies are kept (default: ``.ml_cache`` next to the source)
+    refresh : bool
+        Rebuild the Arrow copy even if it is up to date
+    **read_kwargs
+        Forwarded to ``pd.read_csv``/``pd.read_excel`` when the copy is built,
+        e.g. ``sheet_name=`` or ``dtype=``; they are part of the cache key
+    
+    Returns
+    -------
+    pd.DataFrame
+        The requested columns, in the order given
+    """
+    from pyarrow import feather
+
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(path)), ".ml_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    arrow_path = _table_cache_path(path, cache_dir, read_kwargs)
+
+    if refresh or not os.path.exists(arrow_path):
+        if path.lower().endswith((".xlsx", ".xls")):
+            df = pd.read_excel(path, **read_kwargs)
+        else:
+            df = pd.read_csv(path, **read_kwargs)
+        df.columns = [str(col) for col in df.columns]
+        df = _arrow_compatible(df)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            feather.write_feather(df, tmp, compression="uncompressed")
+            os.replace(tmp, arrow_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        if columns is not None:
+            return df[list(columns)]
+        return df
+
+    table = feather.read_table(arrow_path, columns=list(columns) if columns is not None else None,
+                               memory_map=True)
+    return table.to_pandas()
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+import ml_library as ml
+
+
+def test_summary_statistics_empty_frame():
+    df = pd.DataFrame({"a": [1, 2], "b": [1.5, 2.0], "s": ["x", "y"]}).iloc[:0]
+    summary = ml.summary_statistics(df)
+    assert list(summary.index) == ["a", "b", "s"]
+    assert (summary["Count"] == 0).all()
+    assert (summary["Unique"] == 0).all()
+    assert summary["Mode"].isna().all()
+    assert summary[ml.SUMMARY_COLUMNS[5:]].isna().all().all()
+    assert ml.univariate(df, plots="none").equals(summary)
+
+
+def test_summary_statistics_large_integers():
+    df = pd.DataFrame({
+        "int64": [2**60 + 1, 2**60 + 2, 2**60 + 2],
+        "uint64": np.array([2**64 - 1, 2**64 - 2, 2**64 - 2], dtype=np.uint64),
+        "nullable": pd.array([2**60 + 1, None, 2**60 + 1], dtype="Int64"),
+    })
+    summary = ml.summary_statistics(df)
+    assert summary["Unique"].tolist() == [2, 2, 1]
+    assert summary["Mode"].tolist() == [2**60 + 2, 2**64 - 2, 2**60 + 1]
+
+
+def test_profile_csv_all_unique_column(tmp_path):
+    path = tmp_path / "ids.csv"
+    pd.DataFrame({"id": np.arange(1000)[::-1], "name": [f"x{i}" for i in range(1000)]}).to_csv(path, index=False)
+    profile = ml.profile_csv(str(path), chunksize=100)
+    assert profile["Mode"].tolist() == [0, "x0"]
+    assert profile["Mode"].tolist() == ml.summary_statistics(pd.read_csv(path))["Mode"].tolist()